@@ -0,0 +1,41 @@
+"""
+Measures how long it takes to create a BlueDot (and its Bluetooth adapter),
+which is dominated by the D-Bus calls made to find and read the adapter.
+The more devices bluez knows about the longer a ``GetManagedObjects`` call
+takes, so the number of known objects is reported too.
+
+Needs a Bluetooth adapter and bluez, e.g. run it on a Raspberry Pi:
+
+    python3 benchmarks/bench_bluedot_init.py
+"""
+import os
+import sys
+from time import perf_counter
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot import BlueDot
+from bluedot.utils import get_managed_objects, get_signal_bus
+
+N = 20
+
+if __name__ == "__main__":
+    print("known D-Bus objects : {}".format(len(get_managed_objects())))
+    print("receiving signals   : {}".format(get_signal_bus() is not None))
+
+    start = perf_counter()
+    bd = BlueDot(auto_start_server = False, print_messages = False)
+    print("first BlueDot()     : {:.1f} ms".format((perf_counter() - start) * 1000))
+
+    start = perf_counter()
+    for i in range(N):
+        bd = BlueDot(auto_start_server = False, print_messages = False)
+    print("BlueDot()           : {:.1f} ms".format((perf_counter() - start) / N * 1000))
+
+    start = perf_counter()
+    for i in range(N):
+        bd.adapter.powered
+        bd.adapter.discoverable
+        bd.adapter.pairable
+    print("adapter properties  : {:.3f} ms".format((perf_counter() - start) / N / 3 * 1000))
@@ -0,0 +1,36 @@
+"""
+Measures the cost of parsing colors given as hex strings, names and tuples,
+with and without the cache used by parse_color.
+
+    python3 benchmarks/bench_colors.py
+"""
+import os
+import sys
+from timeit import timeit
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot.colors import parse_color, _parse_color
+
+N = 100000
+
+VALUES = (
+    ("hex", "#ff8000"),
+    ("hex + alpha", "#ff800080"),
+    ("name", "orange"),
+    ("tuple", (255, 128, 0)),
+    ("list", [255, 128, 0]),
+)
+
+def cost(func, value):
+    return timeit(lambda: func(value), number=N) / N * 1e6
+
+if __name__ == "__main__":
+    # load the named colors first, so they aren't part of the first timing
+    parse_color("red")
+    print("{:<12} {:>10} {:>10}".format("", "uncached", "cached"))
+    for name, value in VALUES:
+        uncached = cost(_parse_color.__wrapped__, tuple(value) if isinstance(value, list) else value)
+        cached = cost(parse_color, value)
+        print("{:<12} {:8.2f}us {:8.2f}us".format(name, uncached, cached))
@@ -0,0 +1,50 @@
+"""
+Measures the cost of using a 20x20 grid of buttons: looking up buttons,
+processing moves, sending the configuration when a client connects and
+resizing the grid.
+
+    python3 benchmarks/bench_grid.py
+"""
+import os
+import sys
+from timeit import timeit
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot import MockBlueDot
+
+COLS = ROWS = 20
+N = 200
+
+def cost(func, number = N):
+    return timeit(func, number=number) / number * 1e6
+
+if __name__ == "__main__":
+    mbd = MockBlueDot(cols = COLS, rows = ROWS, print_messages = False)
+    mbd.mock_client_connected()
+    mbd._server.send = lambda data: None
+    # a few modified buttons, like a d-pad
+    for col, row in ((0, 0), (COLS - 1, 0), (0, ROWS - 1), (COLS - 1, ROWS - 1)):
+        mbd[col, row].color = "red"
+
+    def lookup():
+        for row in range(ROWS):
+            for col in range(COLS):
+                mbd[col, row]
+
+    def moves():
+        mbd.mock_blue_dot_pressed(5, 5, 0, 0)
+        for i in range(100):
+            mbd.mock_blue_dot_moved(5, 5, i / 100, 0)
+        mbd.mock_blue_dot_released(5, 5, 1, 0)
+
+    def resize():
+        mbd.resize(COLS - 1, ROWS - 1)
+        mbd.resize(COLS, ROWS)
+
+    print("{}x{} grid".format(COLS, ROWS))
+    print("    lookup every button  {:8.1f} us".format(cost(lookup)))
+    print("    process 100 moves    {:8.1f} us".format(cost(moves, 20)))
+    print("    send config          {:8.1f} us".format(cost(mbd._send_bluedot_config)))
+    print("    resize and back      {:8.1f} us".format(cost(resize, 20)))
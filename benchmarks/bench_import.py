@@ -0,0 +1,38 @@
+"""
+Measures how long it takes to import bluedot, and the modules which take
+the longest, using ``python -X importtime``.
+
+    python3 benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+SLOWEST = 10
+
+def import_times():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (ROOT, env.get("PYTHONPATH")) if p)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import bluedot"],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+if __name__ == "__main__":
+    runs = [import_times() for _ in range(RUNS)]
+    # the fastest run is the least affected by the rest of the system
+    best = min(runs, key=lambda times: times["bluedot"])
+    print("import bluedot: {:.1f} ms (best of {})".format(best["bluedot"] / 1000, RUNS))
+    print("dbus imported: {}".format("dbus" in best))
+    print("slowest modules:")
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[1:SLOWEST + 1]:
+        print("    {:<30} {:6.1f} ms".format(name, cumulative / 1000))
@@ -0,0 +1,58 @@
+"""
+Measures painting every button of a large grid, by setting the color of
+each button, compared to set_colors and fill_gradient, and counts the
+messages sent.
+
+    python3 benchmarks/bench_palette.py
+"""
+import os
+import sys
+from time import perf_counter
+
+import numpy
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot import MockBlueDot
+
+SIZES = ((20, 20), (50, 50))
+FRAMES = 20
+
+def time_frames(mbd, paint):
+    sent = []
+    mbd._server.send = sent.append
+    start = perf_counter()
+    for frame in range(FRAMES):
+        paint(frame)
+    elapsed = perf_counter() - start
+    return elapsed / FRAMES * 1000, len(sent) / FRAMES
+
+def heat_map(cols, rows, frame):
+    # a different frame each time, so every button changes
+    x, y = numpy.meshgrid(numpy.arange(cols), numpy.arange(rows))
+    values = numpy.zeros((rows, cols, 3))
+    values[..., 0] = (x * 7 + y * 3 + frame * 11) % 256
+    values[..., 2] = 255 - values[..., 0]
+    return values
+
+if __name__ == "__main__":
+    for cols, rows in SIZES:
+        mbd = MockBlueDot(cols = cols, rows = rows, print_messages = False)
+        mbd.mock_client_connected()
+        frames = [heat_map(cols, rows, frame) for frame in range(FRAMES)]
+        lists = [frame.tolist() for frame in frames]
+
+        def per_button(frame):
+            for row in range(rows):
+                for col in range(cols):
+                    mbd[col, row].color = lists[frame][row][col]
+
+        print("{}x{} grid".format(cols, rows))
+        for name, paint in (
+            ("per button", per_button),
+            ("set_colors(list)", lambda frame: mbd.set_colors(lists[frame])),
+            ("set_colors(array)", lambda frame: mbd.set_colors(frames[frame])),
+            ("fill_gradient", lambda frame: mbd.fill_gradient((frame, 0, 0), (0, 0, 255 - frame), "radial"))):
+            ms, messages = time_frames(mbd, paint)
+            print("    {:<18} {:7.2f} ms per frame {:6.0f} messages".format(name, ms, messages))
@@ -0,0 +1,43 @@
+"""
+Measures how long it takes PathRecognizer to match a path against a large
+library of templates, with and without NumPy.
+
+    python3 benchmarks/bench_paths.py
+"""
+import os
+import sys
+from math import cos, pi, sin
+from random import Random
+from timeit import timeit
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot.gestures import PathRecognizer, TEMPLATES
+
+NO_OF_TEMPLATES = 300
+N = 200
+
+def random_templates(count):
+    random = Random(42)
+    templates = dict(TEMPLATES)
+    for i in range(count - len(templates)):
+        templates["random{}".format(i)] = [
+            (random.uniform(-1, 1), random.uniform(-1, 1)) for p in range(8)]
+    return templates
+
+if __name__ == "__main__":
+    templates = random_templates(NO_OF_TEMPLATES)
+    # a circle made up of 60 positions
+    path = [(0.5 * sin(2 * pi * i / 60), 0.5 * cos(2 * pi * i / 60)) for i in range(61)]
+
+    for use_numpy in (False, True):
+        try:
+            paths = PathRecognizer(templates, use_numpy = use_numpy)
+        except ImportError:
+            print("numpy is not installed")
+            continue
+        assert paths.recognize(path).name == "circle"
+        per_call = timeit(lambda: paths.recognize(path), number = N) / N
+        print("{} templates, numpy={} : {:.3f} ms per path".format(
+            NO_OF_TEMPLATES, use_numpy, per_call * 1000))
@@ -0,0 +1,69 @@
+"""
+Measures the memory used by, and the rate at which, BlueDotPosition and
+Color objects can be created.
+
+Colors are interned, so the cost of creating a new color (including its
+entry in the table of colors) and of looking up a color which already
+exists are measured separately.
+
+    python3 benchmarks/bench_positions.py
+"""
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+from timeit import timeit
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot import BlueDotPosition
+from bluedot.colors import Color
+from bluedot.clock import VirtualClock
+
+N = 100000
+
+def bytes_per_object(factory):
+    objects = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(N):
+        objects.append(factory(i))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # don't count the list holding the objects
+    return (allocated - (len(objects) * 8)) / N
+
+def objects_per_second(statement, number = N, **namespace):
+    return number / timeit(statement, globals = namespace, number = number)
+
+def distinct_color(i):
+    return Color(i & 255, (i >> 8) & 255, i >> 16)
+
+def new_colors_per_second():
+    # the colors are kept, so each one is new
+    colors = []
+    start = perf_counter()
+    for i in range(N):
+        colors.append(distinct_color(i))
+    return N / (perf_counter() - start)
+
+if __name__ == "__main__":
+    clock = VirtualClock()
+
+    print("BlueDotPosition")
+    print("  bytes per position         : {:.0f}".format(
+        bytes_per_object(lambda i: BlueDotPosition(0, 0, i / N, -i / N, clock))))
+    print("  positions per second       : {:.0f}".format(
+        objects_per_second("BlueDotPosition(0, 0, '0.1234', '-0.5678', clock)",
+            BlueDotPosition = BlueDotPosition, clock = clock)))
+
+    print("Color")
+    print("  bytes per new color        : {:.0f}".format(
+        bytes_per_object(distinct_color)))
+    print("  new colors per second      : {:.0f}".format(new_colors_per_second()))
+    # kept, so the color is looked up rather than created each time
+    existing = Color(255, 128, 0)
+    print("  existing colors per second : {:.0f}".format(
+        objects_per_second("Color(255, 128, 0)", Color = Color)))
@@ -0,0 +1,49 @@
+"""
+Measures the cost of predicting the position of the Blue Dot for every
+position received, compared to just reading the last position.
+
+    python3 benchmarks/bench_predict.py
+"""
+import os
+import sys
+from math import cos, sin
+from time import perf_counter
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot import MockBlueDot
+from bluedot.clock import VirtualClock
+
+N = 20000
+
+def cost_per_move(mbd, clock, read):
+    mbd.mock_blue_dot_pressed(0, 0, 0, 0)
+    start = perf_counter()
+    for i in range(N):
+        clock.advance(0.02)
+        mbd.mock_blue_dot_moved(0, 0, 0.5 * sin(i / 50), 0.5 * cos(i / 50))
+        read(mbd)
+    elapsed = perf_counter() - start
+    mbd.mock_blue_dot_released(0, 0, 0, 0)
+    return elapsed / N * 1e6
+
+if __name__ == "__main__":
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+    mbd.mock_client_connected()
+
+    print("position           : {:.1f} us per move".format(
+        cost_per_move(mbd, clock, lambda mbd: mbd.position)))
+
+    print("predicted_position : {:.1f} us per move".format(
+        cost_per_move(mbd, clock, lambda mbd: mbd.predicted_position(clock.time() + 0.05))))
+
+    start = perf_counter()
+    mbd.mock_blue_dot_pressed(0, 0, 0, 0)
+    clock.advance(0.02)
+    mbd.mock_blue_dot_moved(0, 0, 0.1, 0.1)
+    for i in range(N):
+        mbd.predicted_position(clock.time() + 0.05)
+    print("predicted_position : {:.2f} us per call".format(
+        (perf_counter() - start) / N * 1e6))
@@ -0,0 +1,37 @@
+"""
+Measures how many press / release interactions per second Blue Dot can
+process, with no handlers attached and with a swipe handler attached.
+
+    python3 benchmarks/bench_release.py
+"""
+import os
+import sys
+from time import perf_counter
+
+# run from a checkout, without installing bluedot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bluedot import MockBlueDot
+
+N = 20000
+
+def interactions_per_second(mbd):
+    start = perf_counter()
+    for i in range(N):
+        mbd.mock_blue_dot_pressed(0, 0, -1, 0)
+        mbd.mock_blue_dot_released(0, 0, 1, 0)
+    return N / (perf_counter() - start)
+
+if __name__ == "__main__":
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+
+    print("no handlers           : {:.0f} interactions per second".format(
+        interactions_per_second(mbd)))
+
+    def swiped(swipe):
+        pass
+
+    mbd.set_when_swiped(swiped)
+    print("when_swiped handler   : {:.0f} interactions per second".format(
+        interactions_per_second(mbd)))
@@ -1,4 +1,23 @@
+import sys
+
 from .dot import BlueDot, BlueDotButton
-from .interactions import BlueDotInteraction, BlueDotPosition, BlueDotRotation, BlueDotSwipe
-from .colors import COLORS
+from .interactions import BlueDotInteraction, BlueDotPosition, BlueDotPositions, BlueDotRotation, BlueDotSwipe
 from .mock import MockBlueDot
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        # COLORS is loaded the first time it is used, as it creates every
+        # named color
+        if name == "COLORS":
+            from .colors import COLORS
+            return COLORS
+        elif name == "__all__":
+            # used by "from bluedot import *", which should include COLORS
+            global __all__
+            __all__ = [
+                name for name in globals()
+                if not name.startswith("_") and name != "sys"] + ["COLORS"]
+            return __all__
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+else:
+    from .colors import COLORS
@@ -0,0 +1,242 @@
+import asyncio
+
+from .constants import (
+    SERVICE_NAME,
+    ADAPTER_INTERFACE,
+    DEVICE_INTERFACE,
+    PROPERTIES_INTERFACE,
+    OBJECT_MANAGER_INTERFACE,
+    DBUS_TIMEOUT,
+)
+
+
+class AsyncBluetoothAdapter:
+    """
+    Represents a Bluetooth Adapter, like
+    :class:`~bluedot.btcomm.BluetoothAdapter`, for use with :mod:`asyncio`.
+    D-Bus calls are made without blocking the event loop, and each call has
+    a timeout, so a slow bluez can't stall the program.
+
+    The following example powers up the adapter, while doing something else
+    at the same time::
+
+        import asyncio
+        from bluedot.aio import AsyncBluetoothAdapter
+
+        async def setup_adapter():
+            async with AsyncBluetoothAdapter() as a:
+                await a.set_powered(True)
+                print(await a.get_paired_devices())
+
+        async def main():
+            await asyncio.gather(setup_adapter(), something_else())
+
+        asyncio.run(main())
+
+    .. note::
+
+        This class requires the `dbus-next`_ library. It is used on its own
+        and isn't used by :class:`~bluedot.btcomm.BluetoothServer` or
+        :class:`~bluedot.BlueDot`.
+
+    :param str device:
+        The Bluetooth device to be used, the default is "hci0".
+
+    :param float timeout:
+        The number of seconds to wait for each D-Bus call before raising
+        :exc:`asyncio.TimeoutError`. Defaults to the same timeout used by
+        :class:`~bluedot.btcomm.BluetoothAdapter`.
+
+    .. _dbus-next: https://python-dbus-next.readthedocs.io/
+    """
+    def __init__(self, device = "hci0", timeout = DBUS_TIMEOUT):
+        self._device = device
+        self._timeout = timeout
+        self._bus = None
+        self._path = None
+        self._address = None
+        self._pairing_task = None
+
+    @property
+    def device(self):
+        """
+        The Bluetooth device name. This defaults to "hci0".
+        """
+        return self._device
+
+    @property
+    def address(self):
+        """
+        The MAC address of the Bluetooth adapter, available once the adapter
+        is open.
+        """
+        return self._address
+
+    async def open(self):
+        """
+        Connects to the system bus and finds the adapter.
+        """
+        # imported here, so dbus-next is only a pre-requisite for this class
+        from dbus_next import BusType
+        from dbus_next.aio import MessageBus
+
+        if self._bus is not None:
+            return
+        self._bus = await asyncio.wait_for(
+            MessageBus(bus_type=BusType.SYSTEM).connect(), self._timeout)
+
+        objects, = await self._call("/", OBJECT_MANAGER_INTERFACE, "GetManagedObjects")
+        for path, interfaces in objects.items():
+            adapter = interfaces.get(ADAPTER_INTERFACE)
+            if adapter is None:
+                continue
+            address = adapter["Address"].value
+            if self._device == address or path.endswith(self._device):
+                self._path = path
+                self._address = address
+                break
+        else:
+            self.close()
+            raise Exception("Bluetooth adapter {} not found".format(self._device))
+
+    def close(self):
+        """
+        Disconnects from the system bus.
+        """
+        if self._pairing_task is not None:
+            self._pairing_task.cancel()
+            self._pairing_task = None
+        if self._bus is not None:
+            self._bus.disconnect()
+            self._bus = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    async def _call(self, path, interface, member, signature = "", body = ()):
+        from dbus_next import Message, MessageType
+        from dbus_next.errors import DBusError
+
+        if self._bus is None:
+            raise Exception("The adapter is not open")
+        reply = await asyncio.wait_for(
+            self._bus.call(Message(
+                destination=SERVICE_NAME,
+                path=path,
+                interface=interface,
+                member=member,
+                signature=signature,
+                body=list(body))),
+            self._timeout)
+        if reply.message_type == MessageType.ERROR:
+            raise DBusError(reply.error_name, reply.body[0] if reply.body else "", reply)
+        return reply.body
+
+    async def get_property(self, prop):
+        """
+        Returns the value of an adapter property e.g. ``"Powered"``.
+        """
+        value, = await self._call(
+            self._path, PROPERTIES_INTERFACE, "Get", "ss", (ADAPTER_INTERFACE, prop))
+        return value.value
+
+    async def get_properties(self):
+        """
+        Returns a dictionary of all the adapter's properties.
+        """
+        properties, = await self._call(
+            self._path, PROPERTIES_INTERFACE, "GetAll", "s", (ADAPTER_INTERFACE, ))
+        return {name: value.value for name, value in properties.items()}
+
+    async def set_property(self, prop, value):
+        """
+        Sets the value of an adapter property.
+        """
+        from dbus_next import Variant
+
+        if isinstance(value, bool):
+            value = Variant("b", value)
+        await self._call(
+            self._path, PROPERTIES_INTERFACE, "Set", "ssv", (ADAPTER_INTERFACE, prop, value))
+
+    async def get_powered(self):
+        """
+        Returns ``True`` if the adapter is powered on.
+        """
+        return bool(await self.get_property("Powered"))
+
+    async def set_powered(self, value):
+        """
+        Powers the adapter on (``True``) or off (``False``).
+        """
+        await self.set_property("Powered", bool(value))
+
+    async def get_discoverable(self):
+        """
+        Returns ``True`` if the adapter is discoverable.
+        """
+        return bool(await self.get_property("Discoverable"))
+
+    async def set_discoverable(self, value):
+        """
+        Makes the adapter discoverable (``True``) or not (``False``).
+        """
+        await self.set_property("Discoverable", bool(value))
+
+    async def get_pairable(self):
+        """
+        Returns ``True`` if the adapter is pairable.
+        """
+        return bool(await self.get_property("Pairable"))
+
+    async def set_pairable(self, value):
+        """
+        Makes the adapter pairable (``True``) or not (``False``).
+        """
+        await self.set_property("Pairable", bool(value))
+
+    async def get_paired_devices(self):
+        """
+        Returns a list of devices paired with this adapter
+        :code:`[(mac_address, name), (mac_address, name), ...]`.
+        """
+        objects, = await self._call("/", OBJECT_MANAGER_INTERFACE, "GetManagedObjects")
+        paired_devices = []
+        for path, interfaces in objects.items():
+            properties = interfaces.get(DEVICE_INTERFACE)
+            if properties is None:
+                continue
+            if properties["Adapter"].value != self._path:
+                continue
+            if "Paired" not in properties or not properties["Paired"].value:
+                continue
+            paired_devices.append((properties["Address"].value, properties["Alias"].value))
+        return paired_devices
+
+    async def allow_pairing(self, timeout = 60):
+        """
+        Put the adapter into discoverable and pairable mode.
+
+        :param int timeout:
+            The time in seconds the adapter will remain pairable. If set to ``None``
+            the device will be discoverable and pairable indefinetly.
+        """
+        if self._pairing_task is not None:
+            self._pairing_task.cancel()
+            self._pairing_task = None
+
+        await self.set_pairable(True)
+        await self.set_discoverable(True)
+
+        if timeout is not None:
+            self._pairing_task = asyncio.ensure_future(self._expire_pairing(timeout))
+
+    async def _expire_pairing(self, timeout):
+        await asyncio.sleep(timeout)
+        self._pairing_task = None
+        await self.set_discoverable(False)
+        await self.set_pairable(False)
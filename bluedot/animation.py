@@ -0,0 +1,345 @@
+import traceback
+from bisect import bisect_right
+from threading import Event, Lock, current_thread
+
+from .colors import Color, parse_color
+from .threads import WrapThread
+
+
+def linear(t):
+    """
+    No easing, the color changes at a constant rate.
+    """
+    return t
+
+def ease_in(t):
+    """
+    Starts slowly and speeds up.
+    """
+    return t * t
+
+def ease_out(t):
+    """
+    Starts quickly and slows down.
+    """
+    return t * (2 - t)
+
+def ease_in_out(t):
+    """
+    Starts slowly, speeds up and slows down at the end.
+    """
+    return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
+
+EASINGS = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+    }
+
+# the slowest the frame rate will drop to when the link can't keep up
+MIN_FPS = 2
+
+
+def _blend(start, end, t):
+    return Color(
+        round(start._red + (end._red - start._red) * t),
+        round(start._green + (end._green - start._green) * t),
+        round(start._blue + (end._blue - start._blue) * t),
+        round(start._alpha + (end._alpha - start._alpha) * t))
+
+
+class Animation:
+    """
+    Represents a color animation of a :class:`~bluedot.BlueDot` or
+    :class:`~bluedot.BlueDotButton`, returned by
+    :meth:`~bluedot.BlueDot.animate` and
+    :meth:`~bluedot.BlueDot.animate_keyframes`.
+
+    This class is not intended to be created directly.
+
+    :param target:
+        The :class:`~bluedot.BlueDot` or :class:`~bluedot.BlueDotButton`
+        being animated.
+
+    :param keyframes:
+        A list of ``(time, color)`` tuples, the time in seconds from the
+        start of the animation.
+
+    :param easing:
+        The easing function, or the name of one in :data:`EASINGS`, applied
+        between each pair of keyframes.
+
+    :param float fps:
+        The number of frames per second to send.
+
+    :param bool repeat:
+        If ``True`` the animation repeats until it is cancelled.
+    """
+    def __init__(self, target, keyframes, easing = "linear", fps = 25, repeat = False):
+        if not callable(easing):
+            try:
+                easing = EASINGS[easing]
+            except KeyError:
+                raise ValueError("{} is not an easing, must be one of {}".format(easing, ", ".join(EASINGS)))
+        if fps <= 0:
+            raise ValueError("fps must be greater than 0")
+
+        keyframes = sorted(
+            ((float(time), parse_color(color)) for time, color in keyframes),
+            key=lambda keyframe: keyframe[0])
+        if not keyframes:
+            raise ValueError("an animation needs at least 1 keyframe")
+        if keyframes[0][0] < 0:
+            raise ValueError("keyframe times must be 0 or more")
+        if repeat and keyframes[-1][0] == 0:
+            raise ValueError("a repeating animation must last longer than 0 seconds")
+
+        self._target = target
+        self._times = [time for time, color in keyframes]
+        self._colors = [color for time, color in keyframes]
+        self._easing = easing
+        self._fps = fps
+        self._repeat = repeat
+        self._start = None
+        self._animator = None
+        self._done = Event()
+
+    @property
+    def target(self):
+        """
+        The :class:`~bluedot.BlueDot` or :class:`~bluedot.BlueDotButton`
+        being animated.
+        """
+        return self._target
+
+    @property
+    def duration(self):
+        """
+        The length of the animation in seconds, the time of the last
+        keyframe.
+        """
+        return self._times[-1]
+
+    @property
+    def fps(self):
+        """
+        The number of frames per second requested for the animation.
+        """
+        return self._fps
+
+    @property
+    def repeat(self):
+        """
+        Returns ``True`` if the animation repeats.
+        """
+        return self._repeat
+
+    @property
+    def done(self):
+        """
+        Returns ``True`` once the animation has finished or been cancelled.
+        """
+        return self._done.is_set()
+
+    def color_at(self, time):
+        """
+        Returns the :class:`~bluedot.colors.Color` of the animation at a
+        time.
+
+        :param float time:
+            The time in seconds since the start of the animation.
+        """
+        times = self._times
+        if self._repeat:
+            time %= times[-1]
+        i = bisect_right(times, time)
+        if i == 0:
+            return self._colors[0]
+        if i == len(times):
+            return self._colors[-1]
+        t = (time - times[i - 1]) / (times[i] - times[i - 1])
+        return _blend(self._colors[i - 1], self._colors[i], self._easing(t))
+
+    def cancel(self):
+        """
+        Stops the animation, leaving the color as it is.
+        """
+        if self._animator is not None:
+            self._animator.remove(self)
+        self._done.set()
+
+    def wait(self, timeout = None):
+        """
+        Waits until the animation has finished or been cancelled. Returns
+        ``True`` if it has, or ``False`` if the timeout expired.
+
+        :param float timeout:
+            Number of seconds to wait, the default is ``None`` which waits
+            forever.
+        """
+        return self._done.wait(timeout)
+
+
+class Animator:
+    """
+    Runs the animations of a :class:`~bluedot.BlueDot` and its buttons.
+
+    A single thread works out the color of every running animation each
+    frame, and sends the configuration of all the buttons which changed
+    color in one message. The thread is only running while there are
+    animations.
+
+    The frame rate is the highest requested by the running animations, but
+    if sending a frame takes more than half the time between frames (the
+    Bluetooth link can't keep up) the frame rate is reduced, and increased
+    again when it can. Frames are timed using the Blue Dot's
+    :attr:`~bluedot.BlueDot.clock`.
+
+    If an error occurs working out or sending a frame (e.g. in an easing
+    function) it is printed, the running animations are finished and the
+    thread stops.
+
+    This class is used by :class:`~bluedot.BlueDot` and is not intended to
+    be created directly.
+    """
+    def __init__(self, bd):
+        self._bd = bd
+        self._lock = Lock()
+        self._animations = []
+        self._thread = None
+        self._running = False
+        self._fps = None
+
+    @property
+    def animations(self):
+        """
+        A tuple of the running animations.
+        """
+        return tuple(self._animations)
+
+    @property
+    def fps(self):
+        """
+        The current frame rate, or ``None`` if there are no animations.
+        """
+        return self._fps if self._running else None
+
+    def start(self, animation):
+        """
+        Starts an animation, stopping any other animation of the same
+        target.
+        """
+        with self._lock:
+            previous = animation._target._animation
+            if previous is not None:
+                self._remove(previous)
+                previous._done.set()
+            animation._animator = self
+            animation._start = self._bd.clock.time()
+            animation._target._animation = animation
+            self._animations.append(animation)
+
+            if not self._running:
+                if self._thread is not None:
+                    # the last thread has stopped, or is about to
+                    self._thread.join()
+                self._running = True
+                self._fps = animation._fps
+                self._thread = WrapThread(target=self._run)
+                self._thread.start()
+
+    def remove(self, animation):
+        """
+        Removes an animation.
+        """
+        with self._lock:
+            self._remove(animation)
+
+    def _remove(self, animation):
+        if animation in self._animations:
+            self._animations.remove(animation)
+            animation._target._animation = None
+
+    def frame(self):
+        """
+        Works out the color of every animation, sends the changes and
+        returns the time in seconds until the next frame.
+        """
+        with self._lock:
+            bd = self._bd
+            now = bd.clock.time()
+            colors = {}
+            dot_animated = False
+            # the blue dot's animations first, so a button's own
+            # animation takes priority
+            for animation in sorted(self._animations, key=lambda a: a._target is not bd):
+                color = animation.color_at(now - animation._start)
+                if animation._target is bd:
+                    previous = bd._color
+                    bd._color = color
+                    dot_animated = True
+                    # buttons which have been given their own color are left
+                    # alone
+                    for button in bd.buttons:
+                        if button._color is previous:
+                            colors[button] = color
+                else:
+                    colors[animation._target] = color
+
+                if not animation._repeat and now - animation._start >= animation.duration:
+                    self._remove(animation)
+                    animation._done.set()
+
+            msg = ""
+            for button, color in colors.items():
+                if button._color is not color:
+                    button._color = color
+                    msg += button._build_config_msg()
+            # changing the blue dot's color changes which buttons are
+            # modified, not just the ones animated
+            for button in (bd.buttons if dot_animated else colors):
+                bd._buttons.update_modified(button)
+
+            requested = max((a._fps for a in self._animations), default=self._fps)
+            if msg and bd.is_connected:
+                sent = bd.clock.time()
+                bd._server.send(msg)
+                sent = bd.clock.time() - sent
+                # adapt the frame rate to how quickly frames can be sent
+                if sent > 0.5 / self._fps:
+                    self._fps = max(MIN_FPS, min(requested, self._fps * 0.75))
+                else:
+                    self._fps = min(requested, self._fps * 1.1)
+            else:
+                self._fps = min(requested, self._fps * 1.1)
+
+            if not self._animations:
+                self._running = False
+            return 1 / self._fps
+
+    def _run(self):
+        stopping = current_thread().stopping
+        clock = self._bd.clock
+        next_frame = clock.time()
+        try:
+            while self._running and not stopping.is_set():
+                interval = self.frame()
+                # frames are scheduled from when they should have been sent,
+                # so the timing doesn't drift, unless a frame is late
+                next_frame = max(next_frame + interval, clock.time())
+                stopping.wait(min(interval, next_frame - clock.time()))
+        except Exception:
+            traceback.print_exc()
+        finally:
+            # still running if there was an error or the thread was stopped,
+            # in which case start won't be waiting (with the lock) for the
+            # thread to finish
+            if self._running:
+                with self._lock:
+                    self._running = False
+                    # the animations can't continue, so finish them
+                    for animation in self._animations:
+                        animation._target._animation = None
+                        animation._done.set()
+                    self._animations = []
@@ -6,14 +6,8 @@ import errno
 
 from .utils import (
     register_spp,
-    get_mac,
-    get_adapter_powered_status,
-    get_adapter_discoverable_status,
-    get_adapter_pairable_status,
-    get_paired_devices,
-    device_pairable,
-    device_discoverable,
-    device_powered,
+    AdapterProperties,
+    DeviceRegistry,
 )
 
 from .threads import WrapThread
@@ -38,7 +32,10 @@ class BluetoothAdapter:
     """
     def __init__(self, device = "hci0"):
         self._device = device
-        self._address = get_mac(self._device)
+        # the adapter's properties are cached, so reading them is quick
+        self._properties = None
+        self._address = str(self._adapter_properties().get("Address"))
+        self._devices = None
         self._pairing_thread = None
 
     @property
@@ -67,33 +64,33 @@ class BluetoothAdapter:
 
             sudo rfkill unblock bluetooth
         """
-        return get_adapter_powered_status(self._device)
+        return bool(self._adapter_properties().get("Powered"))
 
     @powered.setter
     def powered(self, value):
-        device_powered(self._device, value)
+        self._adapter_properties().set("Powered", bool(value))
 
     @property
     def discoverable(self):
         """
         Set to ``True`` to make the Bluetooth adapter discoverable.
         """
-        return get_adapter_discoverable_status(self._device)
+        return bool(self._adapter_properties().get("Discoverable"))
 
     @discoverable.setter
     def discoverable(self, value):
-        device_discoverable(self._device, value)
+        self._adapter_properties().set("Discoverable", bool(value))
 
     @property
     def pairable(self):
         """
         Set to ``True`` to make the Bluetooth adapter pairable.
         """
-        return get_adapter_pairable_status(self._device)
+        return bool(self._adapter_properties().get("Pairable"))
 
     @pairable.setter
     def pairable(self, value):
-        device_pairable(self._device, value)
+        self._adapter_properties().set("Pairable", bool(value))
 
     @property
     def paired_devices(self):
@@ -107,7 +104,29 @@ class BluetoothAdapter:
                 device_address = d[0]
                 device_name = d[1]
         """
-        return get_paired_devices(self._device)
+        return self._device_registry().paired_devices
+
+    def find_paired_device(self, name):
+        """
+        Returns the MAC address of a paired device, or ``None`` if the
+        device isn't paired.
+
+        :param str name:
+            The MAC address or name of the device.
+        """
+        return self._device_registry().find(name)
+
+    def _adapter_properties(self):
+        # created again if the adapter is used after being closed
+        if self._properties is None:
+            self._properties = AdapterProperties(self._device)
+        return self._properties
+
+    def _device_registry(self):
+        # created when first needed, as it loads all the devices
+        if self._devices is None:
+            self._devices = DeviceRegistry(self._device)
+        return self._devices
 
     def allow_pairing(self, timeout = 60):
         """
@@ -131,6 +150,20 @@ class BluetoothAdapter:
             self._pairing_thread = WrapThread(target=self._expire_pairing, args=(timeout, ))
             self._pairing_thread.start()
 
+    def close(self):
+        """
+        Stops caching the adapter's properties and paired devices, so the
+        adapter no longer receives signals from D-Bus. The adapter can still
+        be used after it has been closed, the caches are created again when
+        needed.
+        """
+        if self._properties is not None:
+            self._properties.close()
+            self._properties = None
+        if self._devices is not None:
+            self._devices.close()
+            self._devices = None
+
     def _expire_pairing(self, timeout):
         #wait till the timeout or the thread is stopped
         self._pairing_thread.stopping.wait(timeout)
@@ -373,6 +406,8 @@ class BluetoothServer:
                 self._conn_thread.stop()
                 self._conn_thread = None
 
+        self.adapter.close()
+
     def send(self, data):
         """
         Send data to a connected Bluetooth client
@@ -645,12 +680,8 @@ class BluetoothClient():
             if not self.adapter.powered:
                 raise Exception("Bluetooth device {} is turned off".format(self.adapter.device))
 
-            #try and find the server name or MAC address in the paired devices list
-            server_mac = None
-            for device in self.adapter.paired_devices:
-                if self._server == device[0] or self._server == device[1]:
-                    server_mac = device[0]
-                    break
+            #try and find the server name or MAC address in the paired devices
+            server_mac = self.adapter.find_paired_device(self._server)
             if server_mac == None:
                 raise Exception("Server {} not found in paired devices".format(self._server))
 
@@ -682,6 +713,8 @@ class BluetoothClient():
                 self._client_sock = None
                 self._connected = False
 
+        self.adapter.close()
+
     def send(self, data):
         """
         Send data to a Bluetooth server.
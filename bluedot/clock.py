@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from time import monotonic, time
+
+try:
+    from time import monotonic_ns
+except ImportError:
+    # python < 3.7
+    def monotonic_ns():
+        return int(monotonic() * 1e9)
+
+
+class Clock(ABC):
+    """
+    The base class for clocks used by :class:`~bluedot.BlueDot`.
+
+    A clock must implement :meth:`time`, subclasses can override
+    :meth:`time_ns` and :meth:`wall_time` if they can be implemented more
+    accurately or efficiently.
+    """
+    @abstractmethod
+    def time(self):
+        """
+        Returns the current time in seconds.
+        """
+
+    def time_ns(self):
+        """
+        Returns the current time as an integer number of nanoseconds. Used
+        to timestamp positions.
+        """
+        return int(self.time() * 1e9)
+
+    def wall_time(self, timestamp):
+        """
+        Converts a timestamp returned by :meth:`time_ns` into a wall clock
+        time in seconds since the epoch.
+
+        :param int timestamp:
+            The timestamp in nanoseconds.
+        """
+        return timestamp / 1e9
+
+
+class MonotonicClock(Clock):
+    """
+    A clock which returns the time from :func:`time.monotonic`. This is the
+    default clock used by :class:`~bluedot.BlueDot`.
+
+    A monotonic clock cannot go backwards, so durations calculated using it
+    are not affected by changes to the system time (e.g. when NTP sets the
+    time after a Raspberry Pi boots). Wall clock times are worked out when
+    they are asked for, so they are correct after the system time changes.
+    """
+    def time(self):
+        """
+        Returns the current time in seconds.
+        """
+        return monotonic()
+
+    def time_ns(self):
+        """
+        Returns the current time as an integer number of nanoseconds.
+        """
+        return monotonic_ns()
+
+    def wall_time(self, timestamp):
+        """
+        Converts a timestamp returned by :meth:`time_ns` into a wall clock
+        time in seconds since the epoch.
+
+        :param int timestamp:
+            The timestamp in nanoseconds.
+        """
+        # the difference between the wall clock and the monotonic clock is
+        # sampled each time, as the system time may have been changed since
+        # the timestamp was taken
+        epoch_ns = int(time() * 1e9) - monotonic_ns()
+        return (epoch_ns + timestamp) / 1e9
+
+
+class VirtualClock(Clock):
+    """
+    A clock which only changes when it is told to. Useful for testing timing
+    sensitive features (e.g. double presses and swipes) without having to
+    ``sleep``::
+
+        from bluedot import MockBlueDot
+        from bluedot.clock import VirtualClock
+
+        clock = VirtualClock()
+        mbd = MockBlueDot(clock=clock)
+        mbd.mock_client_connected()
+
+        mbd.mock_blue_dot_pressed(0,0,0,0)
+        clock.advance(1)
+        mbd.mock_blue_dot_released(0,0,0,0)
+
+        print(mbd[0,0].interaction.duration)
+
+    :param float start:
+        The time in seconds the clock starts at. Defaults to ``0``.
+    """
+    def __init__(self, start = 0):
+        self._time_ns = int(round(start * 1e9))
+
+    def time(self):
+        """
+        Returns the current time in seconds.
+        """
+        return self._time_ns / 1e9
+
+    def time_ns(self):
+        """
+        Returns the current time as an integer number of nanoseconds.
+        """
+        return self._time_ns
+
+    def advance(self, seconds):
+        """
+        Moves the clock forward.
+
+        :param float seconds:
+            The number of seconds to move the clock forward by.
+        """
+        if seconds < 0:
+            raise ValueError("a virtual clock cannot go backwards")
+        self._time_ns += int(round(seconds * 1e9))
+
+
+DEFAULT_CLOCK = MonotonicClock()
@@ -1,2 +1,19 @@
 PROTOCOL_VERSION = 2
-CHECK_PROTOCOL_TIMEOUT = 2
\ No newline at end of file
+CHECK_PROTOCOL_TIMEOUT = 2
+
+SERVICE_NAME = "org.bluez"
+ADAPTER_INTERFACE = SERVICE_NAME + ".Adapter1"
+DEVICE_INTERFACE = SERVICE_NAME + ".Device1"
+PROFILE_MANAGER = SERVICE_NAME + ".ProfileManager1"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+OBJECT_MANAGER_INTERFACE = "org.freedesktop.DBus.ObjectManager"
+
+# the number of seconds to wait for bluez to reply to a D-Bus call
+DBUS_TIMEOUT = 5
+
+# the number of milliseconds between wake ups of the thread which receives
+# D-Bus signals
+SIGNAL_LOOP_WAKEUP = 500
+
+# the number of seconds between checks for whether a generator should stop
+ITER_STOP_INTERVAL = 0.1
@@ -2,14 +2,20 @@ from __future__ import division
 
 import sys
 import warnings
-from time import sleep, time
-from threading import Event
-from inspect import getfullargspec
+from copy import deepcopy
+from threading import Event, current_thread
+from time import monotonic, sleep
 
 from .btcomm import BluetoothServer
-from .threads import WrapThread
-from .constants import PROTOCOL_VERSION, CHECK_PROTOCOL_TIMEOUT
+from .threads import SequencedEvent, expects_arg, run_callback
+from .clock import DEFAULT_CLOCK
+from .constants import PROTOCOL_VERSION, CHECK_PROTOCOL_TIMEOUT, ITER_STOP_INTERVAL
 from .interactions import BlueDotInteraction, BlueDotPosition, BlueDotRotation, BlueDotSwipe
+from .gestures import GestureEngine
+from .events import EventBus
+from .animation import Animation, Animator
+from .palette import color_grid, gradient_grid
+from .grid import ButtonGrid
 from .colors import parse_color, BLUE
 from .exceptions import ButtonDoesNotExist
 
@@ -24,11 +30,14 @@ class Dot:
         self._border = border
         self._visible = visible
 
-        self._is_pressed_event = Event()
-        self._is_released_event = Event()
-        self._is_moved_event = Event()
-        self._is_swiped_event = Event()
-        self._is_double_pressed_event = Event()
+        # sequenced events for each type of event, the event "changed" is
+        # set when the dot is pressed, released or moved
+        self._events = {
+            name: SequencedEvent() for name in (
+                "pressed", "double_pressed", "released", "moved",
+                "swiped", "rotated", "gesture", "changed")}
+        # the events whose sequence number has been read
+        self._sequenced = set()
 
         self._when_pressed = None
         self._when_pressed_background = False
@@ -42,11 +51,17 @@ class Dot:
         self._when_swiped_background = False
         self._when_rotated = None
         self._when_rotated_background = False
+        self._when_gesture = None
+        self._when_gesture_background = False
         
         self._is_pressed = False
         self._position = None
         self._double_press_time = 0.3
         self._rotation_segments = 8
+        self._max_positions = None
+        self._history_seconds = None
+        self._filters = ()
+        self._animation = None
 
     @property
     def is_pressed(self):
@@ -70,12 +85,116 @@ class Dot:
         while True:
             yield self.value
 
+    def iter_values(self, on_change = True, rate = None):
+        """
+        Returns an infinite generator yielding the current :attr:`value`.
+        Unlike :attr:`values` it doesn't yield as fast as it can, so it can
+        be used as a gpiozero ``source`` without using all the CPU::
+
+            led.source = bd.iter_values()
+
+        The generator ends when the Blue Dot is stopped, or the thread
+        using it is stopped (e.g. when the gpiozero device is closed).
+
+        :param bool on_change:
+            If ``True`` (the default) the generator blocks until the value
+            changes.
+
+        :param float rate:
+            If given, the maximum number of values per second to yield. If
+            `on_change` is ``False`` the value is yielded at this rate.
+        """
+        return self._iter(lambda: self.value, on_change, rate)
+
+    def iter_positions(self, on_change = True, rate = None):
+        """
+        Returns an infinite generator yielding the current :attr:`position`.
+
+        :param bool on_change:
+            If ``True`` (the default) the generator blocks until the button
+            is pressed, released or moved.
+
+        :param float rate:
+            If given, the maximum number of positions per second to yield. If
+            `on_change` is ``False`` the position is yielded at this rate.
+        """
+        return self._iter(lambda: self._position, on_change, rate)
+
+    def iter_robot_values(self, on_change = True, rate = None):
+        """
+        Returns an infinite generator yielding a tuple of ``(left, right)``
+        motor speeds, between -1 and 1, for driving a robot. Pressing the
+        top drives forwards, the bottom backwards and the sides turns.
+        ``(0, 0)`` is yielded when the button is released. Made to be used
+        as the source of a :class:`gpiozero.Robot`::
+
+            robot.source = bd.iter_robot_values()
+
+        :param bool on_change:
+            If ``True`` (the default) the generator blocks until the values
+            change.
+
+        :param float rate:
+            If given, the maximum number of values per second to yield. If
+            `on_change` is ``False`` the values are yielded at this rate.
+        """
+        return self._iter(self._robot_values, on_change, rate)
+
+    def _robot_values(self):
+        position = self._position
+        if not self._is_pressed or position is None:
+            return (0, 0)
+        x, y = position.x, position.y
+        left = y if x > 0 else y + x
+        right = y if x < 0 else y - x
+        return (max(-1, min(1, left)), max(-1, min(1, right)))
+
+    def _iter(self, get_value, on_change, rate):
+        changed = self._events["changed"]
+        interval = 1 / rate if rate else 0
+        next_time = monotonic()
+        seq = None
+        last = object()
+        while not self._iter_stopped():
+            if on_change:
+                if seq is None:
+                    seq = changed.seq
+                else:
+                    # wait with a timeout, so the generator can stop
+                    count = changed.wait(ITER_STOP_INTERVAL, since = seq)
+                    if not count:
+                        continue
+                    seq += count
+
+            value = get_value()
+            # moving doesn't always change the value
+            if not on_change or value != last:
+                last = value
+                yield value
+
+                if interval:
+                    next_time += interval
+                    delay = next_time - monotonic()
+                    if delay > 0:
+                        sleep(delay)
+                    else:
+                        next_time = monotonic()
+
+    def _iter_stopped(self):
+        # generators end when the thread using them is stopped (e.g. a
+        # gpiozero source thread) or the blue dot is stopped
+        stopping = getattr(current_thread(), "stopping", None)
+        return (stopping is not None and stopping.is_set()) or self._is_stopped()
+
+    def _is_stopped(self):
+        return False
+
     @property
     def position(self):
         """
         Returns an instance of :class:`BlueDotPosition` representing the
         current or last position the button was pressed, held or
-        released.
+        released. The position changes as the button is moved.
 
         .. note::
 
@@ -86,6 +205,35 @@ class Dot:
         """
         return self._position
 
+    def predicted_position(self, at = None, max_horizon = 0.1):
+        """
+        Returns an instance of :class:`BlueDotPosition` which is where the
+        button is predicted to be pressed, extrapolated from the velocity and
+        acceleration of the current interaction. Useful for compensating for
+        the time it takes positions to arrive over Bluetooth e.g. when
+        controlling a fast robot.
+
+        If the button is released the position where it was released is
+        returned, if it has never been pressed ``None`` is returned.
+
+        :param float at:
+            The time, in seconds since the epoch (the same as
+            :attr:`BlueDotPosition.time`), to predict the position at e.g.
+            ``position.time + 0.05``. If ``None`` (the default) the current
+            time is used.
+
+        :param float max_horizon:
+            The maximum number of seconds to predict ahead of the last
+            position received. Defaults to ``0.1``.
+        """
+        interaction = self._current_interaction()
+        if interaction is None:
+            return self._position
+        return interaction.predicted_position(at, max_horizon)
+
+    def _current_interaction(self):
+        return None
+
     @property
     def when_pressed(self):
         """
@@ -292,6 +440,63 @@ class Dot:
     def rotation_segments(self, value):
         self._rotation_segments = value
 
+    @property
+    def max_positions(self):
+        """
+        Sets or returns the maximum number of positions kept in an
+        interaction's :attr:`~BlueDotInteraction.positions`. The position
+        where the button was pressed and the most recent positions are kept.
+        Must be at least 2. Defaults to ``None``, all positions are kept.
+
+        Limiting the number of positions stops the memory used growing
+        while the button is held.
+        """
+        return self._max_positions
+
+    @max_positions.setter
+    def max_positions(self, value):
+        if value is not None and value < 2:
+            raise ValueError("max_positions must be at least 2")
+        self._max_positions = value
+
+    @property
+    def history_seconds(self):
+        """
+        Sets or returns the number of seconds of positions kept in an
+        interaction's :attr:`~BlueDotInteraction.positions`. The position
+        where the button was pressed and the most recent position are always
+        kept. Defaults to ``None``, all positions are kept.
+        """
+        return self._history_seconds
+
+    @history_seconds.setter
+    def history_seconds(self, value):
+        if value is not None and value < 0:
+            raise ValueError("history_seconds cannot be negative")
+        self._history_seconds = value
+
+    @property
+    def filters(self):
+        """
+        Sets or returns the filters applied to the positions received, before
+        :attr:`position` is updated and any callbacks are called. Filters are
+        applied in order. Defaults to ``()``, positions are not filtered.
+
+        Filters are instances of :class:`~bluedot.filters.PositionFilter`
+        e.g. to smooth out jitter and ignore the middle of the dot::
+
+            from bluedot import BlueDot
+            from bluedot.filters import OneEuroFilter, DeadZoneFilter
+
+            bd = BlueDot()
+            bd.filters = [OneEuroFilter(), DeadZoneFilter(0.2)]
+        """
+        return self._filters
+
+    @filters.setter
+    def filters(self, value):
+        self._filters = tuple(value or ())
+
     @property
     def when_rotated(self):
         """
@@ -326,6 +531,40 @@ class Dot:
         self._when_rotated = callback
         self._when_rotated_background = background
 
+    @property
+    def when_gesture(self):
+        """
+        Sets or returns the function which is called when a gesture is
+        recognised by one of the recognizers added using
+        :meth:`BlueDot.add_gesture`.
+
+        The function should accept 0 or 1 parameters, if the function accepts 1 parameter an
+        instance of :class:`.gestures.BlueDotGesture` will be returned representing the
+        gesture.
+
+        The function will be run in the same thread and block, to run in a separate 
+        thread use `set_when_gesture(function, background=True)`
+        """
+        return self._when_gesture
+
+    @when_gesture.setter
+    def when_gesture(self, value):
+        self.set_when_gesture(value)
+
+    def set_when_gesture(self, callback, background=False):
+        """
+        Sets the function which is called when a gesture is recognised.
+
+        :param Callable callback:
+            The function to call, setting to `None` will stop the callback.
+
+        :param bool background:
+            If set to `True` the function will be run in a separate thread 
+            and it will return immediately. The default is `False`.
+        """
+        self._when_gesture = callback
+        self._when_gesture_background = background
+
     @property
     def color(self):
         """
@@ -344,8 +583,12 @@ class Dot:
 
     @color.setter
     def color(self, value):
-        self._color = parse_color(value)
-        
+        value = parse_color(value)
+        if self._animation is not None:
+            # setting the color stops it being animated
+            self._animation.cancel()
+        self._color = value
+
     @property
     def square(self):
         """
@@ -384,60 +627,229 @@ class Dot:
     def visible(self, value):
         self._visible = value
 
-    def wait_for_press(self, timeout = None):
+    @property
+    def animation(self):
+        """
+        The :class:`~bluedot.animation.Animation` of the dot's color which
+        is running, or ``None``.
+        """
+        return self._animation
+
+    def animate(self, color_from, color_to, duration = 1, easing = "linear", fps = 25, repeat = False):
+        """
+        Animates the color of the dot, from one color to another, and
+        returns an :class:`~bluedot.animation.Animation`::
+
+            from bluedot import BlueDot
+            from signal import pause
+
+            bd = BlueDot()
+            bd.animate("red", "blue", duration=2, easing="ease_in_out")
+
+            pause()
+
+        The animation runs in the background, setting :attr:`color` stops
+        it. Use :meth:`~bluedot.animation.Animation.wait` to wait for it to
+        finish. Animating the Blue Dot changes the buttons which haven't
+        been given their own color.
+
+        :param color_from:
+            The color to start from, any value accepted by :attr:`color`.
+            If ``None`` the current color is used.
+
+        :param color_to:
+            The color to finish at.
+
+        :param float duration:
+            The length of the animation in seconds. Defaults to ``1``.
+
+        :param easing:
+            How the color changes over time, ``"linear"`` (the default),
+            ``"ease_in"``, ``"ease_out"``, ``"ease_in_out"`` or a function
+            which is passed a value between ``0`` and ``1`` and returns the
+            eased value.
+
+        :param float fps:
+            The number of frames per second. The frame rate is reduced if
+            the Bluetooth link can't keep up. Defaults to ``25``.
+
+        :param bool repeat:
+            If ``True`` the animation repeats until it is stopped. Defaults
+            to ``False``.
+        """
+        if color_from is None:
+            color_from = self._color
+        return self.animate_keyframes(((0, color_from), (duration, color_to)), easing, fps, repeat)
+
+    def animate_keyframes(self, keyframes, easing = "linear", fps = 25, repeat = False):
+        """
+        Animates the color of the dot through a sequence of keyframes, and
+        returns an :class:`~bluedot.animation.Animation`. For example, to
+        pulse the dot red::
+
+            bd.animate_keyframes(
+                [(0, "blue"), (0.5, "red"), (1, "blue")],
+                easing="ease_in_out", repeat=True)
+
+        :param keyframes:
+            A list of ``(time, color)`` tuples, the time in seconds from the
+            start of the animation.
+
+        :param easing:
+            How the color changes between keyframes, see :meth:`animate`.
+
+        :param float fps:
+            The number of frames per second. Defaults to ``25``.
+
+        :param bool repeat:
+            If ``True`` the animation repeats until it is stopped. Defaults
+            to ``False``.
+        """
+        animation = Animation(self, keyframes, easing, fps, repeat)
+        self._animator.start(animation)
+        return animation
+
+    def wait_for_press(self, timeout = None, since = None):
         """
         Waits until a Blue Dot is pressed.
-        Returns ``True`` if the button was pressed.
+        Returns the number of times the button was pressed, which is ``0``
+        (i.e. false) if the wait timed out.
 
         :param float timeout:
             Number of seconds to wait for a Blue Dot to be pressed, if ``None``
             (the default), it will wait indefinetly.
+
+        :param int since:
+            Wait for presses since this :attr:`press_seq`, rather than the
+            next press. Presses which happen while not waiting are never
+            missed e.g.::
+
+                seq = bd.press_seq
+                while True:
+                    seq += bd.wait_for_press(since=seq)
         """
-        return self._is_pressed_event.wait(timeout)
+        return self._events["pressed"].wait(timeout, since)
 
-    def wait_for_double_press(self, timeout = None):
+    def wait_for_double_press(self, timeout = None, since = None):
         """
         Waits until a Blue Dot is double pressed.
-        Returns ``True`` if the button was double pressed.
+        Returns the number of times the button was double pressed, which is
+        ``0`` (i.e. false) if the wait timed out.
 
         :param float timeout:
             Number of seconds to wait for a Blue Dot to be double pressed, if ``None``
             (the default), it will wait indefinetly.
+
+        :param int since:
+            Wait for double presses since this :attr:`double_press_seq`,
+            rather than the next double press.
         """
-        return self._is_double_pressed_event.wait(timeout)
+        return self._events["double_pressed"].wait(timeout, since)
 
-    def wait_for_release(self, timeout = None):
+    def wait_for_release(self, timeout = None, since = None):
         """
         Waits until a Blue Dot is released.
-        Returns ``True`` if the button was released.
+        Returns the number of times the button was released, which is ``0``
+        (i.e. false) if the wait timed out.
 
         :param float timeout:
             Number of seconds to wait for a Blue Dot to be released, if ``None``
             (the default), it will wait indefinetly.
+
+        :param int since:
+            Wait for releases since this :attr:`release_seq`, rather than the
+            next release.
         """
-        return self._is_released_event.wait(timeout)
+        return self._events["released"].wait(timeout, since)
 
-    def wait_for_move(self, timeout = None):
+    def wait_for_move(self, timeout = None, since = None):
         """
         Waits until the position where the button is pressed is moved.
-        Returns ``True`` if the position pressed on the button was moved.
+        Returns the number of times the position pressed on the button was
+        moved, which is ``0`` (i.e. false) if the wait timed out.
 
         :param float timeout:
             Number of seconds to wait for the position that the button
             is pressed to move, if ``None`` (the default), it will wait indefinetly.
+
+        :param int since:
+            Wait for moves since this :attr:`move_seq`, rather than the next
+            move.
         """
-        return self._is_moved_event.wait(timeout)
+        return self._events["moved"].wait(timeout, since)
 
-    def wait_for_swipe(self, timeout = None):
+    def wait_for_swipe(self, timeout = None, since = None):
         """
         Waits until the button is swiped.
-        Returns ``True`` if the button was swiped.
+        Returns the number of times the button was swiped, which is ``0``
+        (i.e. false) if the wait timed out.
 
         :param float timeout:
             Number of seconds to wait for the button to be swiped, if ``None``
             (the default), it will wait indefinetly.
+
+        :param int since:
+            Wait for swipes since this :attr:`swipe_seq`, rather than the
+            next swipe.
+        """
+        return self._events["swiped"].wait(timeout, since)
+
+    @property
+    def press_seq(self):
+        """
+        Returns the number of times the button has been pressed, for use
+        with :meth:`wait_for_press`.
+        """
+        return self._seq("pressed")
+
+    @property
+    def double_press_seq(self):
+        """
+        Returns the number of times the button has been double pressed, for
+        use with :meth:`wait_for_double_press`.
+        """
+        return self._seq("double_pressed")
+
+    @property
+    def release_seq(self):
+        """
+        Returns the number of times the button has been released, for use
+        with :meth:`wait_for_release`.
+        """
+        return self._seq("released")
+
+    @property
+    def move_seq(self):
+        """
+        Returns the number of times the position pressed on the button has
+        moved, for use with :meth:`wait_for_move`.
+        """
+        return self._seq("moved")
+
+    @property
+    def swipe_seq(self):
+        """
+        Returns the number of times the button has been swiped, for use with
+        :meth:`wait_for_swipe`.
+        """
+        return self._seq("swiped")
+
+    def _seq(self, name):
+        # once a sequence number has been read the event is always
+        # detected, so a later wait since it doesn't miss any
+        self._sequenced.add(name)
+        return self._events[name].seq
+
+    def _is_subscribed(self, name):
+        """
+        Returns ``True`` if anything is interested in the event `name`, i.e.
+        a callback has been set, a thread is waiting for it or its sequence
+        number has been read.
         """
-        return self._is_swiped_event.wait(timeout)
+        return (
+            getattr(self, "_when_" + name) is not None or
+            self._events[name].waiting > 0 or
+            name in self._sequenced)
 
     def press(self, position):
         """
@@ -448,8 +860,8 @@ class Dot:
         """
         self._position = position
         self._is_pressed = True
-        self._is_pressed_event.set()
-        self._is_pressed_event.clear()
+        self._events["pressed"].set()
+        self._events["changed"].set()
 
         self._process_callback(self.when_pressed, position, self._when_pressed_background)
 
@@ -462,8 +874,8 @@ class Dot:
         """
         self._position = position
         self._is_pressed = False
-        self._is_released_event.set()
-        self._is_released_event.clear()
+        self._events["released"].set()
+        self._events["changed"].set()
 
         self._process_callback(self.when_released, position, self._when_released_background)
 
@@ -474,8 +886,9 @@ class Dot:
         :param BlueDotPosition position:
             The BlueDotPosition where the Dot was pressed.
         """
-        self._is_moved_event.set()
-        self._is_moved_event.clear()
+        self._position = position
+        self._events["moved"].set()
+        self._events["changed"].set()
 
         self._process_callback(self.when_moved, position, self._when_moved_background)
 
@@ -486,8 +899,7 @@ class Dot:
         :param BlueDotPosition position:
             The BlueDotPosition where the Dot was pressed.
         """
-        self._is_double_pressed_event.set()
-        self._is_double_pressed_event.clear()
+        self._events["double_pressed"].set()
 
         self._process_callback(self.when_double_pressed, position, self._when_double_pressed_background)
 
@@ -498,8 +910,7 @@ class Dot:
         :param BlueDotSwipe swipe:
             The BlueDotSwipe representing how the dot was swiped.
         """
-        self._is_swiped_event.set()
-        self._is_swiped_event.clear()
+        self._events["swiped"].set()
 
         self._process_callback(self.when_swiped, swipe, self._when_swiped_background)
 
@@ -511,28 +922,22 @@ class Dot:
             The BlueDotRotation representing how the dot was rotated.
         """
         # print("rotating - when_rotated {}")
+        self._events["rotated"].set()
         self._process_callback(self.when_rotated, rotation, self._when_rotated_background)
+
+    def gesture(self, gesture):
+        """
+        Processes any "gesture" events associated with this dot.
+
+        :param BlueDotGesture gesture:
+            The BlueDotGesture which was recognised.
+        """
+        self._events["gesture"].set()
+        self._process_callback(self.when_gesture, gesture, self._when_gesture_background)
         
     def _process_callback(self, callback, arg, background):
         if callback:
-            args_expected = getfullargspec(callback).args
-            no_args_expected = len(args_expected)
-            if len(args_expected) > 0:
-                # if someone names the first arg of a class function to something
-                # other than self, this will fail! or if they name the first argument
-                # of a non class function to self this will fail!
-                if args_expected[0] == "self":
-                    no_args_expected -= 1
-
-            if no_args_expected == 0:
-                call_back_t = WrapThread(target=callback)
-            else:
-                call_back_t = WrapThread(target=callback, args=(arg, ))
-            call_back_t.start()
-
-            # if this callback is not running in the background wait for it
-            if not background:
-                call_back_t.join()
+            run_callback(callback, (arg, ) if expects_arg(callback) else (), background)
 
 
 class BlueDotButton(Dot):
@@ -635,11 +1040,13 @@ class BlueDotButton(Dot):
         Returns `True` if the button's appearance has been modified [is 
         different] from the default.  
         """
+        # equal colors are the same object, so comparing them is cheap
+        bd = self._bd
         return not (
-            self.color == self._bd.color and 
-            self.visible == self._bd.visible and
-            self.border == self._bd.border and
-            self.square == self._bd.square
+            self._color == bd._color and
+            self._visible == bd._visible and
+            self._border == bd._border and
+            self._square == bd._square
             )
 
     @property
@@ -657,6 +1064,12 @@ class BlueDotButton(Dot):
         """
         return self._interaction
 
+    def _current_interaction(self):
+        return self._interaction
+
+    def _is_stopped(self):
+        return self._bd._is_stopped()
+
     def press(self, position):
         """
         Processes any "pressed" events associated with this button.
@@ -667,7 +1080,8 @@ class BlueDotButton(Dot):
         super().press(position)
 
         # create new interaction
-        self._interaction = BlueDotInteraction(position)
+        self._interaction = BlueDotInteraction(
+            position, self._bd.clock, self._max_positions, self._history_seconds)
 
     def release(self, position):
         """
@@ -709,7 +1123,7 @@ class BlueDotButton(Dot):
                 # was it less than the time threshold (0.3 seconds)
                 if self._interaction.duration < self._double_press_time:
                     #was the dot pressed again in less than the threshold
-                    if time() - self._interaction.released_position.time < self._double_press_time:
+                    if (position.timestamp - self._interaction.released_position.timestamp) / 1e9 < self._double_press_time:
                         double_press = True
         
         return double_press
@@ -730,16 +1144,38 @@ class BlueDotButton(Dot):
         with the button was a rotation. Returns `None` if the button was not 
         rotated. 
         """
-        # only bother checking to see if its a rotation if `when_rotated`
-        # as been set. Performance thang!
-        if self.when_rotated or self._bd.when_rotated:
-            rotation = BlueDotRotation(self._interaction, self._rotation_segments)
-            if rotation.valid:
-                return rotation
+        rotation = BlueDotRotation(self._interaction, self._rotation_segments)
+        if rotation.valid:
+            return rotation
+
+    def _filter_position(self, position, pressed):
+        # the filters are reset when the button is pressed so one interaction
+        # isn't smoothed into the next
+        if pressed:
+            for f in self._filters:
+                f.reset()
+
+        x, y = position.x, position.y
+        t = position.timestamp / 1e9
+        for f in self._filters:
+            x, y = f(x, y, t)
+
+        return BlueDotPosition._from_values(
+            position.col, position.row,
+            max(-1, min(1, x)), max(-1, min(1, y)),
+            position.timestamp, self._bd.clock)
+
+    @property
+    def _animator(self):
+        return self._bd._animator
+
+    def _is_subscribed(self, name):
+        # an event for this button is also an event for the blue dot
+        return super()._is_subscribed(name) or self._bd._is_subscribed(name)
 
     def _build_config_msg(self):
         return "5,{},{},{},{},{},{}\n".format(
-                    self.color,
+                    self._color.str_rgba,
                     int(self.square),
                     int(self.border),
                     int(self.visible),
@@ -748,6 +1184,7 @@ class BlueDotButton(Dot):
                     )
 
     def _send_config(self):
+        self._bd._buttons.update_modified(self)
         if self._bd.is_connected:
             self._bd._server.send(self._build_config_msg())
 
@@ -776,6 +1213,12 @@ class BlueDot(Dot):
         bd[1,1].wait_for_press()
         print("Bottom right button pressed")
 
+    Slices return a :class:`~.grid.ButtonGridView` of a row, column or block
+    of buttons, which can be changed together::
+
+        bd = BlueDot(cols=3, rows=3)
+        bd[:, 0].color = "red"
+
     :param str device:
         The Bluetooth device the server should use, the default is "hci0", if
         your device only has 1 Bluetooth adapter this shouldn't need to be changed.
@@ -808,6 +1251,12 @@ class BlueDot(Dot):
     :param int rows:
         The number of rows in the grid of buttons. Defaults to ``1``.
 
+    :param clock:
+        The clock used to timestamp positions and time interactions. If
+        ``None`` (the default), a :class:`~.clock.MonotonicClock` is used.
+        A :class:`~.clock.VirtualClock` can be used to test timing
+        sensitive features without having to wait.
+
     """
     def __init__(self,
         device = "hci0",
@@ -816,9 +1265,11 @@ class BlueDot(Dot):
         power_up_device = False,
         print_messages = True,
         cols = 1,
-        rows = 1):
+        rows = 1,
+        clock = None):
 
         self._data_buffer = ""
+        self._clock = clock or DEFAULT_CLOCK
         self._device = device
         self._port = port
         self._power_up_device = power_up_device
@@ -830,12 +1281,16 @@ class BlueDot(Dot):
         self._when_client_connects_background = False
         self._when_client_disconnects = None
         self._when_client_disconnects_background = False
+        self._gestures = GestureEngine()
+        self._bus = EventBus()
+        self._animator = Animator(self)
+        self._stopped = False
 
         # setup the main "dot"
         super().__init__(BLUE, False, False, True)
 
         # setup the grid
-        self._buttons = {}
+        self._buttons = ButtonGrid()
         self.resize(cols, rows)
 
         self._create_server()
@@ -846,9 +1301,10 @@ class BlueDot(Dot):
     @property
     def buttons(self):
         """
-        A list of :class:`BlueDotButton` objects in the "grid". 
+        A tuple of :class:`BlueDotButton` objects in the "grid", column by
+        column.
         """
-        return self._buttons.values()
+        return self._buttons.buttons_by_col
 
     @property
     def cols(self):
@@ -915,6 +1371,13 @@ class BlueDot(Dot):
         """
         return self._server.adapter.paired_devices
 
+    @property
+    def clock(self):
+        """
+        The clock used to timestamp positions and time interactions.
+        """
+        return self._clock
+
     @property
     def print_messages(self):
         """
@@ -978,6 +1441,16 @@ class BlueDot(Dot):
         """
         return self._get_button((0,0)).interaction
 
+    def _is_stopped(self):
+        return self._stopped
+
+    def _current_interaction(self):
+        # the interaction of the button which was last used
+        if self._position is not None:
+            button = self._buttons.get(self._position.col, self._position.row)
+            if button is not None:
+                return button.interaction
+
     @property
     def rotation_segments(self):
         """
@@ -1015,6 +1488,79 @@ class BlueDot(Dot):
         for button in self.buttons:
             button.double_press_time = value
 
+    @property
+    def max_positions(self):
+        """
+        Sets or returns the maximum number of positions kept in an
+        interaction's :attr:`~BlueDotInteraction.positions`. The position
+        where the button was pressed and the most recent positions are kept.
+        Must be at least 2. Defaults to ``None``, all positions are kept.
+
+        .. note::
+
+            If there are multiple buttons in the grid, the 'default' value
+            will be returned and when set all buttons will be updated.
+        """
+        return super(BlueDot, self.__class__).max_positions.fget(self)
+
+    @max_positions.setter
+    def max_positions(self, value):
+        super(BlueDot, self.__class__).max_positions.fset(self, value)
+        for button in self.buttons:
+            button.max_positions = value
+
+    @property
+    def history_seconds(self):
+        """
+        Sets or returns the number of seconds of positions kept in an
+        interaction's :attr:`~BlueDotInteraction.positions`. The position
+        where the button was pressed and the most recent position are always
+        kept. Defaults to ``None``, all positions are kept.
+
+        .. note::
+
+            If there are multiple buttons in the grid, the 'default' value
+            will be returned and when set all buttons will be updated.
+        """
+        return super(BlueDot, self.__class__).history_seconds.fget(self)
+
+    @history_seconds.setter
+    def history_seconds(self, value):
+        super(BlueDot, self.__class__).history_seconds.fset(self, value)
+        for button in self.buttons:
+            button.history_seconds = value
+
+    @property
+    def filters(self):
+        """
+        Sets or returns the filters applied to the positions received, before
+        :attr:`position` is updated and any callbacks are called. Filters are
+        applied in order. Defaults to ``()``, positions are not filtered.
+
+        Filters are instances of :class:`~bluedot.filters.PositionFilter`
+        e.g. to smooth out jitter and ignore the middle of the dot::
+
+            from bluedot import BlueDot
+            from bluedot.filters import OneEuroFilter, DeadZoneFilter
+
+            bd = BlueDot()
+            bd.filters = [OneEuroFilter(), DeadZoneFilter(0.2)]
+
+        .. note::
+
+            If there are multiple buttons in the grid, the 'default' value
+            will be returned and when set all buttons will be given their
+            own copy of the filters.
+        """
+        return super(BlueDot, self.__class__).filters.fget(self)
+
+    @filters.setter
+    def filters(self, value):
+        super(BlueDot, self.__class__).filters.fset(self, value)
+        for button in self.buttons:
+            # filters hold state, so each button needs its own
+            button.filters = deepcopy(self._filters)
+
     @property
     def color(self):
         """
@@ -1172,6 +1718,7 @@ class BlueDot(Dot):
         Start the :class:`.btcomm.BluetoothServer` if it is not already 
         running. By default the server is started at initialisation.
         """
+        self._stopped = False
         self._server.start()
         self._print_message("Server started {}".format(self.server.server_address))
         self._print_message("Waiting for connection")
@@ -1190,6 +1737,7 @@ class BlueDot(Dot):
         """
         Stop the Bluetooth server.
         """
+        self._stopped = True
         self._server.stop()
 
     def allow_pairing(self, timeout = 60):
@@ -1203,6 +1751,113 @@ class BlueDot(Dot):
         """
         self.server.adapter.allow_pairing(timeout = timeout)
 
+    @property
+    def gestures(self):
+        """
+        A tuple of the :class:`.gestures.GestureRecognizer` instances added
+        using :meth:`add_gesture`.
+        """
+        return self._gestures.recognizers
+
+    def add_gesture(self, recognizer):
+        """
+        Adds a gesture recognizer. When the recognizer recognises a gesture
+        the :attr:`when_gesture` callbacks of the Blue Dot and button are
+        called::
+
+            from bluedot import BlueDot
+            from bluedot.gestures import LongPressRecognizer, TapRecognizer
+            from signal import pause
+
+            def gesture(g):
+                print("{} on button {},{}".format(g.name, g.col, g.row))
+
+            bd = BlueDot()
+            bd.add_gesture(LongPressRecognizer(min_duration=2))
+            bd.add_gesture(TapRecognizer(taps=3))
+            bd.when_gesture = gesture
+
+            pause()
+
+        Returns the recognizer.
+
+        :param GestureRecognizer recognizer:
+            The recognizer to add.
+        """
+        self._gestures.add(recognizer)
+        return recognizer
+
+    def subscribe(self, kind, handler, button = None, filter = None, background = False):
+        """
+        Subscribes a handler to an event and returns a
+        :class:`~bluedot.events.Subscription`. Unlike :attr:`when_pressed`,
+        etc, any number of handlers can be subscribed to the same event::
+
+            from bluedot import BlueDot
+            from signal import pause
+
+            def forward():
+                print("forward")
+
+            def stop():
+                print("stop")
+
+            bd = BlueDot()
+            bd.subscribe("pressed", forward, filter="top")
+            bd.subscribe("moved", forward, filter="top")
+            bd.subscribe("released", stop)
+
+            pause()
+
+        :param str kind:
+            The kind of event, one of ``"pressed"``, ``"double_pressed"``,
+            ``"released"``, ``"moved"``, ``"swiped"``, ``"rotated"`` or
+            ``"gesture"``.
+
+        :param handler:
+            The function to call, it can take no arguments or 1 argument,
+            the :class:`BlueDotPosition`, :class:`BlueDotSwipe`,
+            :class:`BlueDotRotation` or
+            :class:`~bluedot.gestures.BlueDotGesture` of the event.
+
+        :param button:
+            Only call the handler for events from this button, a
+            :class:`BlueDotButton`, a ``(col, row)`` tuple or a list of
+            them, or a range of buttons e.g. ``bd[0:2, :]``. If ``None``
+            (the default), events from all buttons are handled.
+
+        :param filter:
+            Only call the handler if the filter matches. Either a function
+            which is passed the event's argument and returns ``True`` or
+            ``False``, the name of a property of the argument e.g.
+            ``"top"`` or ``"middle"`` for positions and ``"up"`` for swipes,
+            or a list of names any of which can match.
+
+        :param bool background:
+            If ``True`` the handler is called in its own thread. Defaults to
+            ``False``, the handler is called straight away on the thread
+            receiving the data, so it should return quickly.
+        """
+        return self._bus.subscribe(kind, handler, button, filter, background)
+
+    def unsubscribe(self, subscription):
+        """
+        Removes a subscription returned by :meth:`subscribe`.
+
+        :param Subscription subscription:
+            The subscription to remove.
+        """
+        self._bus.unsubscribe(subscription)
+
+    def remove_gesture(self, recognizer):
+        """
+        Removes a gesture recognizer added using :meth:`add_gesture`.
+
+        :param GestureRecognizer recognizer:
+            The recognizer to remove.
+        """
+        self._gestures.remove(recognizer)
+
     def resize(self, cols, rows):
         """
         Resizes the grid of buttons. 
@@ -1221,26 +1876,91 @@ class BlueDot(Dot):
         self._cols = cols
         self._rows = rows        
 
-        # create new buttons
-        new_buttons = {}
+        # existing buttons are reused, new buttons are created
+        def create_button(c, r):
+            button = BlueDotButton(self, c, r, self._color, self._square, self._border, self._visible)
+            button.max_positions = self._max_positions
+            button.history_seconds = self._history_seconds
+            button.filters = deepcopy(self._filters)
+            return button
 
-        for c in range(cols):
-            for r in range(rows):
-                # if button already exist, reuse it
-                if (c,r) in self._buttons.keys():
-                    new_buttons[c,r] = self._buttons[c,r]
-                else:   
-                    new_buttons[c,r] = BlueDotButton(self, c, r, self._color, self._square, self._border, self._visible)
-                
-        self._buttons = new_buttons
+        self._buttons = self._buttons.resized(cols, rows, create_button)
 
         self._send_bluedot_config()
 
+    def set_colors(self, colors):
+        """
+        Sets the color of every button in the grid at once, sending all the
+        changes in one message::
+
+            from bluedot import BlueDot
+            from random import randint
+
+            bd = BlueDot(cols=10, rows=10)
+            bd.set_colors(lambda col, row: (randint(0, 255), 0, 0))
+
+        :param colors:
+            A NumPy array of shape ``(rows, cols, 3)`` or
+            ``(rows, cols, 4)`` of ``(red, green, blue)`` or
+            ``(red, green, blue, alpha)`` values between `0` & `255`, a list
+            of rows, each a list of colors, or a function which is passed
+            the ``col`` and ``row`` of each button and returns its color.
+            Colors can be any value accepted by :attr:`color`.
+
+        .. note::
+
+            Arrays of numbers are converted to colors using NumPy, if it is
+            installed.
+        """
+        self._set_button_colors(color_grid(colors, self._cols, self._rows))
+
+    def fill_gradient(self, color_from, color_to, direction = "horizontal"):
+        """
+        Sets the colors of the buttons in the grid to a gradient, sending
+        all the changes in one message::
+
+            from bluedot import BlueDot
+
+            bd = BlueDot(cols=10, rows=10)
+            bd.fill_gradient("blue", "red", direction="radial")
+
+        :param color_from:
+            The color of the first button (or the centre).
+
+        :param color_to:
+            The color of the last button (or the corners).
+
+        :param str direction:
+            ``"horizontal"`` (the default) from left to right,
+            ``"vertical"`` from top to bottom, ``"diagonal"`` from the top
+            left to the bottom right or ``"radial"`` from the centre out.
+        """
+        self._set_button_colors(gradient_grid(color_from, color_to, self._cols, self._rows, direction))
+
+    def _set_button_colors(self, grid):
+        get = self._buttons.get
+        self._update_buttons(
+            (get(col, row), "_color", color)
+            for row, colors in enumerate(grid)
+            for col, color in enumerate(colors))
+
+    def _update_buttons(self, updates):
+        # sets an attribute (e.g. "_color") of many buttons, sending the
+        # changes in one message
+        msgs = []
+        for button, attr, value in updates:
+            if attr == "_color" and button._animation is not None:
+                button._animation.cancel()
+            if getattr(button, attr) != value:
+                setattr(button, attr, value)
+                self._buttons.update_modified(button)
+                msgs.append(button._build_config_msg())
+
+        if msgs and self.is_connected:
+            self._server.send("".join(msgs))
+
     def _get_button(self, key):
-        try:
-            return self._buttons[key]
-        except KeyError:
-            raise ButtonDoesNotExist("The button `{}` does not exist".format(key))
+        return self._buttons[key]
 
     def _client_connected(self):
         self._is_connected_event.set()
@@ -1287,6 +2007,8 @@ class BlueDot(Dot):
                 position = None
                 try:
                     button, position = self._parse_interaction_msg(operation, params)
+                    if button.filters:
+                        position = button._filter_position(position, operation == "1")
                     self._position = position
                 except ValueError:
                     # warn about the occasional corrupt command
@@ -1323,43 +2045,82 @@ class BlueDot(Dot):
         # parse message
         col = int(params[0])
         row = int(params[1])
-        position = BlueDotPosition(col, row, params[2], params[3])
-        button = self._get_button((col, row))
-        
+        position = BlueDotPosition(col, row, params[2], params[3], self._clock)
+        button = self._buttons.get(col, row)
+        if button is None:
+            raise ButtonDoesNotExist("The button `{}` does not exist".format((col, row)))
+
         return button, position
 
+    # gestures (double press, rotation, swipe) are only worked out if
+    # something is interested in them. Performance thang!
+
     def _process_press(self, button, position):
         # was the button double pressed?
-        if button.is_double_press(position):
+        if button._is_subscribed("double_pressed") and button.is_double_press(position):
             self.double_press(position)
             button.double_press(position)
+            self._publish("double_pressed", button, position)
         
         # set the blue dot and button as pressed
         self.press(position)
         button.press(position)
+        self._publish("pressed", button, position)
+
+        self._process_gestures("pressed", button, position)
 
     def _process_move(self, button, position):
         # set the blue dot as moved
         self.move(position)
         # set the button as moved
         button.move(position)
+        self._publish("moved", button, position)
         # was it a rotation
-        rotation = button.get_rotation()
-        if rotation is not None:
-            self.rotate(rotation)
-            button.rotate(rotation)
+        if button._is_subscribed("rotated"):
+            rotation = button.get_rotation()
+            if rotation is not None:
+                self.rotate(rotation)
+                button.rotate(rotation)
+                self._publish("rotated", button, rotation)
+
+        self._process_gestures("moved", button, position)
 
     def _process_release(self, button, position):
         # set the blue dot as released
         self.release(position)
         # set the button as released
         button.release(position)
+        self._publish("released", button, position)
         
         # was it a swipe?
-        swipe = button.get_swipe()
-        if swipe is not None:
-            self.swipe(swipe)
-            button.swipe(swipe)
+        if button._is_subscribed("swiped"):
+            swipe = button.get_swipe()
+            if swipe is not None:
+                self.swipe(swipe)
+                button.swipe(swipe)
+                self._publish("swiped", button, swipe)
+
+        self._process_gestures("released", button, position)
+
+    def _process_gestures(self, event, button, position):
+        # once a recognizer has been added it sees every event, whether or
+        # not anything is listening, so gestures which span buttons (e.g.
+        # chords) or presses (e.g. taps) are tracked correctly, the
+        # gestures are only published if something is listening
+        if self._gestures:
+            for gesture in self._gestures.process(event, button, position):
+                if button._is_subscribed("gesture"):
+                    self.gesture(gesture)
+                    button.gesture(gesture)
+                    self._publish("gesture", button, gesture)
+
+    def _is_subscribed(self, name):
+        return super()._is_subscribed(name) or self._bus.has_subscribers(name)
+
+    def _publish(self, kind, button, arg):
+        # subscribers are only looked for if there are any
+        if self._bus:
+            self._bus.publish(kind, (button.col, button.row), arg)
                     
     def _check_protocol_version(self, protocol_version, client_name):
         try:
@@ -1393,11 +2154,9 @@ class BlueDot(Dot):
                     )
                 )
 
-            # send the configuration for the individual buttons
-            button_config_msg = ""
-            for button in self.buttons:
-                if button.modified:
-                    button_config_msg += button._build_config_msg()
+            # send the configuration for the modified buttons
+            button_config_msg = "".join(
+                button._build_config_msg() for button in self._buttons.modified)
 
             if button_config_msg != "":
                 self._server.send(button_config_msg)
@@ -1407,4 +2166,4 @@ class BlueDot(Dot):
             print(message)
 
     def __getitem__(self, key):
-        return self._get_button(key)
+        return self._buttons[key]
@@ -0,0 +1,164 @@
+import traceback
+from operator import attrgetter
+from threading import Lock
+
+from .threads import WrapThread, expects_arg
+
+EVENT_KINDS = ("pressed", "double_pressed", "released", "moved", "swiped", "rotated", "gesture")
+
+
+def _compile_filter(filter):
+    # a filter can be a callable, the name of an attribute (e.g. "top" of a
+    # position or "up" of a swipe) or a list of names, any of which match
+    if filter is None or callable(filter):
+        return filter
+    if isinstance(filter, str):
+        return attrgetter(filter)
+    getters = tuple(attrgetter(name) for name in filter)
+    return lambda arg: any(getter(arg) for getter in getters)
+
+
+def _button_keys(button):
+    # a button can be given as a BlueDotButton, a (col, row) tuple or a
+    # list of either, including a range of buttons from slicing the blue dot
+    # e.g. bd[0:2, :]
+    if button is None:
+        return (None, )
+    if hasattr(button, "col"):
+        return ((button.col, button.row), )
+    if isinstance(button, tuple) and len(button) == 2 and all(isinstance(v, int) for v in button):
+        return (button, )
+    return tuple(key for b in button for key in _button_keys(b))
+
+
+class Subscription:
+    """
+    Represents a handler subscribed to events from a
+    :class:`~bluedot.BlueDot`, returned by :meth:`~bluedot.BlueDot.subscribe`.
+
+    This class is not intended to be created directly.
+    """
+    __slots__ = ("_bus", "_kind", "_handler", "_keys", "_filter", "_background", "_expects_arg", "_active")
+
+    def __init__(self, bus, kind, handler, keys, filter, background):
+        self._bus = bus
+        self._kind = kind
+        self._handler = handler
+        self._keys = keys
+        self._filter = _compile_filter(filter)
+        self._background = background
+        # worked out once when subscribing rather than on every event
+        self._expects_arg = expects_arg(handler)
+        self._active = True
+
+    @property
+    def kind(self):
+        """
+        The kind of event subscribed to e.g. ``"pressed"``.
+        """
+        return self._kind
+
+    @property
+    def handler(self):
+        """
+        The function called when the event happens.
+        """
+        return self._handler
+
+    @property
+    def active(self):
+        """
+        Returns ``True`` until the subscription is unsubscribed.
+        """
+        return self._active
+
+    def unsubscribe(self):
+        """
+        Stops the handler being called.
+        """
+        self._bus.unsubscribe(self)
+
+    def _dispatch(self, arg):
+        if self._filter is not None and not self._filter(arg):
+            return
+        args = (arg, ) if self._expects_arg else ()
+        if self._background:
+            WrapThread(target=self._handler, args=args).start()
+        else:
+            # called on the thread receiving the data, without the cost of
+            # starting a thread for every event
+            try:
+                self._handler(*args)
+            except Exception:
+                # reported, but doesn't stop the data being received or the
+                # other handlers being called
+                traceback.print_exc()
+
+
+class EventBus:
+    """
+    Dispatches events to :class:`Subscription` handlers. Subscriptions are
+    indexed by the kind of event and the button, so only the handlers
+    interested in an event are looked at.
+
+    This class is used by :class:`~bluedot.BlueDot` and is not intended to
+    be created directly.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        # (kind, (col, row) or None) -> tuple of subscriptions, replaced
+        # rather than modified, so dispatching doesn't need the lock
+        self._index = {}
+        self._counts = dict.fromkeys(EVENT_KINDS, 0)
+
+    def __bool__(self):
+        return any(self._counts.values())
+
+    def has_subscribers(self, kind):
+        """
+        Returns ``True`` if there are any subscriptions for `kind`.
+        """
+        return self._counts[kind] > 0
+
+    def subscribe(self, kind, handler, button = None, filter = None, background = False):
+        """
+        Subscribes a handler to an event and returns a :class:`Subscription`.
+        See :meth:`~bluedot.BlueDot.subscribe`.
+        """
+        if kind not in EVENT_KINDS:
+            raise ValueError("{} is not a kind of event, must be one of {}".format(kind, ", ".join(EVENT_KINDS)))
+
+        keys = tuple(dict.fromkeys(_button_keys(button)))
+        subscription = Subscription(self, kind, handler, keys, filter, background)
+        with self._lock:
+            for key in subscription._keys:
+                self._index[kind, key] = self._index.get((kind, key), ()) + (subscription, )
+            self._counts[kind] += 1
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Removes a :class:`Subscription`. Unsubscribing more than once has no
+        effect.
+        """
+        with self._lock:
+            if not subscription._active:
+                return
+            subscription._active = False
+            kind = subscription._kind
+            for key in subscription._keys:
+                remaining = tuple(s for s in self._index[kind, key] if s is not subscription)
+                if remaining:
+                    self._index[kind, key] = remaining
+                else:
+                    del self._index[kind, key]
+            self._counts[kind] -= 1
+
+    def publish(self, kind, key, arg):
+        """
+        Calls the handlers subscribed to `kind` for the button `key` or any
+        button.
+        """
+        index = self._index
+        for subscription in index.get((kind, key), ()) + index.get((kind, None), ()):
+            subscription._dispatch(arg)
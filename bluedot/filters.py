@@ -0,0 +1,159 @@
+from abc import ABC, abstractmethod
+from math import hypot, pi
+
+
+class PositionFilter(ABC):
+    """
+    The base class for filters which can be applied to the positions
+    received for a button, see :attr:`~bluedot.BlueDot.filters`.
+
+    A filter is called with the ``x``, ``y`` and time (in seconds) of each
+    position and returns the filtered ``(x, y)``. Filters only keep the
+    state they need to filter the next position, so the cost of filtering
+    doesn't grow the longer a button is held.
+
+    Subclasses must implement :meth:`__call__`.
+    """
+    def reset(self):
+        """
+        Clears any state the filter holds. Called when a button is pressed,
+        so one interaction is not smoothed into the next.
+        """
+        pass
+
+    @abstractmethod
+    def __call__(self, x, y, t):
+        """
+        Returns the filtered position as a tuple of ``(x, y)``.
+
+        :param float x:
+            The x position.
+
+        :param float y:
+            The y position.
+
+        :param float t:
+            The time of the position in seconds.
+        """
+
+
+class ExponentialFilter(PositionFilter):
+    """
+    Smooths positions using an exponential moving average.
+
+    :param float alpha:
+        The weight given to each new position, between ``0`` and ``1``.
+        Smaller values are smoother but lag further behind the finger.
+        Defaults to ``0.5``.
+    """
+    def __init__(self, alpha = 0.5):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be greater than 0 and no more than 1")
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        self._x = None
+        self._y = None
+
+    def __call__(self, x, y, t):
+        if self._x is None:
+            self._x, self._y = x, y
+        else:
+            self._x += self.alpha * (x - self._x)
+            self._y += self.alpha * (y - self._y)
+        return self._x, self._y
+
+
+class OneEuroFilter(PositionFilter):
+    """
+    Smooths positions using the `1€ filter`_, which filters heavily when
+    the finger is held still (removing jitter) and less as it moves faster
+    (reducing lag).
+
+    :param float min_cutoff:
+        The minimum cutoff frequency in Hz. Lower values remove more jitter
+        when the finger is slow. Defaults to ``1``.
+
+    :param float beta:
+        How much the cutoff increases with speed. Higher values reduce lag
+        when the finger moves quickly. Defaults to ``0.5``.
+
+    :param float d_cutoff:
+        The cutoff frequency in Hz used to smooth the speed. Defaults to
+        ``1``.
+
+    .. _1€ filter: https://gery.casiez.net/1euro/
+    """
+    def __init__(self, min_cutoff = 1, beta = 0.5, d_cutoff = 1):
+        if min_cutoff <= 0 or d_cutoff <= 0:
+            raise ValueError("cutoff frequencies must be greater than 0")
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = None
+        self._y = None
+        self._dx = 0
+        self._dy = 0
+
+    def _alpha(self, cutoff, dt):
+        tau = 1 / (2 * pi * cutoff)
+        return 1 / (1 + tau / dt)
+
+    def __call__(self, x, y, t):
+        if self._t is None:
+            self._t, self._x, self._y = t, x, y
+            return x, y
+
+        dt = t - self._t
+        if dt <= 0:
+            # positions received at the same time can't be used to work out
+            # a speed, return the last filtered position
+            return self._x, self._y
+        self._t = t
+
+        # smooth the speed
+        a = self._alpha(self.d_cutoff, dt)
+        self._dx += a * ((x - self._x) / dt - self._dx)
+        self._dy += a * ((y - self._y) / dt - self._dy)
+
+        # the faster it is moving the higher the cutoff
+        cutoff = self.min_cutoff + self.beta * hypot(self._dx, self._dy)
+        a = self._alpha(cutoff, dt)
+        self._x += a * (x - self._x)
+        self._y += a * (y - self._y)
+        return self._x, self._y
+
+
+class DeadZoneFilter(PositionFilter):
+    """
+    Ignores positions close to the centre, useful for stopping a robot
+    creeping when the finger is resting in the middle.
+
+    :param float radius:
+        Positions closer to the centre than this are returned as ``(0, 0)``.
+        Defaults to ``0.1``.
+
+    :param bool rescale:
+        If ``True`` (the default), positions outside the dead zone are
+        rescaled so the distance from centre still goes smoothly from ``0``
+        (at the edge of the dead zone) to ``1``.
+    """
+    def __init__(self, radius = 0.1, rescale = True):
+        if not 0 <= radius < 1:
+            raise ValueError("radius must be at least 0 and less than 1")
+        self.radius = radius
+        self.rescale = rescale
+
+    def __call__(self, x, y, t):
+        distance = hypot(x, y)
+        if distance <= self.radius:
+            return 0.0, 0.0
+        if self.rescale:
+            scale = (min(distance, 1) - self.radius) / (1 - self.radius) / distance
+            return x * scale, y * scale
+        return x, y
@@ -0,0 +1,622 @@
+from math import cos, hypot, pi, sin, sqrt
+
+from .interactions import BlueDotRotation, BlueDotSwipe
+
+
+class BlueDotGesture:
+    """
+    Represents a gesture which has been recognised by a
+    :class:`GestureRecognizer`.
+
+    :param str name:
+        The name of the gesture, e.g. "swipe".
+
+    :param BlueDotButton button:
+        The button the gesture was made on.
+
+    :param value:
+        The value returned by the recognizer, e.g. the :class:`BlueDotSwipe`
+        or the number of taps.
+    """
+    def __init__(self, name, button, value):
+        self._name = name
+        self._col = button.col
+        self._row = button.row
+        self._interaction = button.interaction
+        self._value = value
+
+    @property
+    def name(self):
+        """
+        The name of the gesture.
+        """
+        return self._name
+
+    @property
+    def col(self):
+        """
+        The column.
+        """
+        return self._col
+
+    @property
+    def row(self):
+        """
+        The row.
+        """
+        return self._row
+
+    @property
+    def interaction(self):
+        """
+        The :class:`BlueDotInteraction` of the button when the gesture was
+        recognised.
+        """
+        return self._interaction
+
+    @property
+    def value(self):
+        """
+        The value returned by the recognizer, this depends on the type of
+        gesture.
+        """
+        return self._value
+
+    def __str__(self):
+        return "BlueDotGesture - name={}, col={}, row={}, value={}".format(
+            self.name, self.col, self.row, self.value
+        )
+
+
+class GestureRecognizer:
+    """
+    The base class for gesture recognizers, which are added to a
+    :class:`~bluedot.BlueDot` using :meth:`~bluedot.BlueDot.add_gesture`.
+
+    A recognizer is given each position as it is received by overriding
+    :meth:`pressed`, :meth:`moved` and :meth:`released`. If a method returns
+    a value (other than ``None``) the gesture has been recognised and the
+    ``when_gesture`` callbacks are called with a :class:`BlueDotGesture`.
+
+    Only the methods a recognizer overrides are called, and each should do a
+    small, fixed amount of work, so adding more recognizers doesn't slow
+    down every event.
+
+    :param str name:
+        The name given to gestures recognised. If ``None`` (the default),
+        the recognizer's default name is used.
+    """
+    name = None
+
+    def __init__(self, name = None):
+        if name is not None:
+            self.name = name
+
+    def pressed(self, button, position):
+        """
+        Called when a button is pressed.
+
+        :param BlueDotButton button:
+            The button which was pressed.
+
+        :param BlueDotPosition position:
+            The position where the button was pressed.
+        """
+        return None
+
+    def moved(self, button, position):
+        """
+        Called when the position a button is pressed is moved.
+
+        :param BlueDotButton button:
+            The button which was moved.
+
+        :param BlueDotPosition position:
+            The new position.
+        """
+        return None
+
+    def released(self, button, position):
+        """
+        Called when a button is released.
+
+        :param BlueDotButton button:
+            The button which was released.
+
+        :param BlueDotPosition position:
+            The position where the button was released.
+        """
+        return None
+
+
+class SwipeRecognizer(GestureRecognizer):
+    """
+    Recognises swipes, the gesture's value is a :class:`BlueDotSwipe`.
+    """
+    name = "swipe"
+
+    def released(self, button, position):
+        swipe = BlueDotSwipe(button.interaction)
+        if swipe.valid:
+            return swipe
+
+
+class RotationRecognizer(GestureRecognizer):
+    """
+    Recognises rotations, the gesture's value is a :class:`BlueDotRotation`.
+    The button's :attr:`~BlueDotButton.rotation_segments` are used.
+    """
+    name = "rotation"
+
+    def moved(self, button, position):
+        rotation = BlueDotRotation(button.interaction, button.rotation_segments)
+        if rotation.valid:
+            return rotation
+
+
+class LongPressRecognizer(GestureRecognizer):
+    """
+    Recognises a long press, where a button is held without moving and then
+    released. The gesture's value is the time in seconds the button was
+    held.
+
+    :param float min_duration:
+        The minimum time in seconds the button must be held. Defaults to
+        ``1``.
+
+    :param float max_distance:
+        The maximum distance the position can move while the button is held.
+        Defaults to ``0.2``.
+
+    :param str name:
+        The name given to gestures recognised. Defaults to "long_press".
+    """
+    name = "long_press"
+
+    def __init__(self, min_duration = 1, max_distance = 0.2, name = None):
+        super().__init__(name)
+        self.min_duration = min_duration
+        self.max_distance = max_distance
+
+    def released(self, button, position):
+        interaction = button.interaction
+        if interaction.duration >= self.min_duration and interaction.distance <= self.max_distance:
+            return interaction.duration
+
+
+class TapRecognizer(GestureRecognizer):
+    """
+    Recognises a number of quick taps on a button. The gesture's value is the
+    number of taps.
+
+    :param int taps:
+        The number of taps. Defaults to ``3``.
+
+    :param float interval:
+        The maximum time in seconds between a tap being released and the next
+        tap being pressed. Defaults to ``0.3``.
+
+    :param float max_duration:
+        The maximum time in seconds a tap can be held for. Defaults to
+        ``0.3``.
+
+    :param str name:
+        The name given to gestures recognised. Defaults to "tap".
+    """
+    name = "tap"
+
+    def __init__(self, taps = 3, interval = 0.3, max_duration = 0.3, name = None):
+        super().__init__(name)
+        self.taps = taps
+        self.interval = interval
+        self.max_duration = max_duration
+        # (count, time of last release) for each button
+        self._state = {}
+
+    def pressed(self, button, position):
+        key = (button.col, button.row)
+        count, released_at = self._state.get(key, (0, None))
+        if released_at is None or (position.timestamp - released_at) / 1e9 > self.interval:
+            self._state[key] = (0, None)
+
+    def released(self, button, position):
+        key = (button.col, button.row)
+        if button.interaction.duration > self.max_duration:
+            self._state[key] = (0, None)
+            return None
+
+        count = self._state.get(key, (0, None))[0] + 1
+        if count == self.taps:
+            self._state[key] = (0, None)
+            return count
+        self._state[key] = (count, position.timestamp)
+
+
+class ChordRecognizer(GestureRecognizer):
+    """
+    Recognises a chord, where several buttons are held at the same time. The
+    gesture's value is a tuple of the ``(col, row)`` of the buttons in the
+    chord.
+
+    :param buttons:
+        A sequence of the ``(col, row)`` of the buttons which make up the
+        chord.
+
+    :param str name:
+        The name given to gestures recognised. Defaults to "chord".
+    """
+    name = "chord"
+
+    def __init__(self, buttons, name = None):
+        super().__init__(name)
+        self.buttons = tuple(tuple(button) for button in buttons)
+        self._chord = frozenset(self.buttons)
+        self._held = set()
+
+    def pressed(self, button, position):
+        key = (button.col, button.row)
+        if key in self._chord:
+            self._held.add(key)
+            # the chord is recognised when the last button is pressed
+            if len(self._held) == len(self._chord):
+                return self.buttons
+
+    def released(self, button, position):
+        self._held.discard((button.col, button.row))
+
+
+class GestureEngine:
+    """
+    Passes positions to :class:`GestureRecognizer` instances.
+
+    This class is intended for use via :class:`~bluedot.BlueDot` and should
+    not be instantiated "manually".
+    """
+    def __init__(self):
+        self._recognizers = []
+        self._handlers = {"pressed": [], "moved": [], "released": []}
+
+    def __bool__(self):
+        return len(self._recognizers) > 0
+
+    @property
+    def recognizers(self):
+        """
+        A tuple of the recognizers added.
+        """
+        return tuple(self._recognizers)
+
+    def add(self, recognizer):
+        """
+        Adds a recognizer.
+
+        :param GestureRecognizer recognizer:
+            The recognizer to add.
+        """
+        self._recognizers.append(recognizer)
+        # only call the methods which have been overridden
+        for event, handlers in self._handlers.items():
+            if getattr(type(recognizer), event) is not getattr(GestureRecognizer, event):
+                handlers.append(recognizer)
+
+    def remove(self, recognizer):
+        """
+        Removes a recognizer.
+
+        :param GestureRecognizer recognizer:
+            The recognizer to remove.
+        """
+        self._recognizers.remove(recognizer)
+        for handlers in self._handlers.values():
+            if recognizer in handlers:
+                handlers.remove(recognizer)
+
+    def process(self, event, button, position):
+        """
+        Passes a position to the recognizers and returns a list of the
+        :class:`BlueDotGesture` instances recognised.
+
+        :param str event:
+            The event, "pressed", "moved" or "released".
+
+        :param BlueDotButton button:
+            The button the event happened on.
+
+        :param BlueDotPosition position:
+            The position of the event.
+        """
+        gestures = []
+        for recognizer in self._handlers[event]:
+            value = getattr(recognizer, event)(button, position)
+            if value is not None:
+                gestures.append(BlueDotGesture(recognizer.name, button, value))
+        return gestures
+
+
+def resample_path(points, n = 32):
+    """
+    Returns a list of `n` ``(x, y)`` points, evenly spaced along the path
+    made by `points`.
+
+    :param points:
+        A sequence of ``(x, y)`` tuples or :class:`BlueDotPosition`
+        instances.
+
+    :param int n:
+        The number of points to return. Defaults to ``32``.
+    """
+    points = [(p.x, p.y) if hasattr(p, "x") else (p[0], p[1]) for p in points]
+    if not points:
+        raise ValueError("a path needs at least 1 point")
+
+    length = sum(hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(points, points[1:]))
+    if n < 2 or length == 0:
+        return [points[0]] * n
+
+    interval = length / (n - 1)
+    resampled = [points[0]]
+    travelled = 0
+    px, py = points[0]
+    i = 1
+    while i < len(points) and len(resampled) < n:
+        x, y = points[i]
+        d = hypot(x - px, y - py)
+        if travelled + d >= interval and d > 0:
+            t = (interval - travelled) / d
+            px, py = px + t * (x - px), py + t * (y - py)
+            resampled.append((px, py))
+            travelled = 0
+        else:
+            travelled += d
+            px, py = x, y
+            i += 1
+
+    # rounding can leave the last point off
+    while len(resampled) < n:
+        resampled.append(points[-1])
+
+    return resampled
+
+
+def normalize_path(points, n = 32):
+    """
+    Resamples `points` (see :func:`resample_path`), moves the centre of the
+    path to ``(0, 0)`` and scales it so it can be compared to other paths
+    regardless of their size and position. Returns a flat list of
+    ``[x0, y0, x1, y1, ...]`` values with a length of 1, or ``None`` if the
+    path doesn't move.
+
+    :param points:
+        A sequence of ``(x, y)`` tuples or :class:`BlueDotPosition`
+        instances.
+
+    :param int n:
+        The number of points to resample to. Defaults to ``32``.
+    """
+    points = resample_path(points, n)
+    cx = sum(x for x, y in points) / n
+    cy = sum(y for x, y in points) / n
+
+    vector = []
+    for x, y in points:
+        vector.append(x - cx)
+        vector.append(y - cy)
+
+    magnitude = sqrt(sum(v * v for v in vector))
+    if magnitude == 0:
+        return None
+    return [v / magnitude for v in vector]
+
+
+class PathMatch:
+    """
+    Represents the template which best matched a path, returned by
+    :meth:`PathRecognizer.recognize`.
+
+    :param str name:
+        The name of the template.
+
+    :param float score:
+        How closely the path matched the template, ``1`` being a perfect
+        match.
+    """
+    def __init__(self, name, score):
+        self._name = name
+        self._score = score
+
+    @property
+    def name(self):
+        """
+        The name of the template.
+        """
+        return self._name
+
+    @property
+    def score(self):
+        """
+        How closely the path matched the template, ``1`` being a perfect
+        match.
+        """
+        return self._score
+
+    def __str__(self):
+        return "PathMatch - name={}, score={}".format(self.name, self.score)
+
+
+def _circle(clockwise):
+    direction = 1 if clockwise else -1
+    return [(sin(direction * 2 * pi * i / 32), cos(2 * pi * i / 32)) for i in range(33)]
+
+TEMPLATES = {
+    "circle": _circle(True),
+    "circle_anticlockwise": _circle(False),
+    "triangle": [(0, 1), (0.87, -0.5), (-0.87, -0.5), (0, 1)],
+    "square": [(-1, 1), (1, 1), (1, -1), (-1, -1), (-1, 1)],
+    "zigzag": [(-1, 1), (1, 1), (-1, -1), (1, -1)],
+    "check": [(-1, 0), (-0.4, -0.8), (1, 1)],
+}
+"""
+The templates used by :class:`PathRecognizer` by default, a dictionary of
+names and sequences of ``(x, y)`` points.
+"""
+
+
+class PathRecognizer(GestureRecognizer):
+    """
+    Recognises shapes drawn on a button, by matching the path of the
+    interaction against a library of templates when the button is released.
+    The gesture's value is a :class:`PathMatch`.
+
+    Paths are compared using the "Protractor" variant of the `$1 unistroke
+    recognizer`_. If `NumPy`_ is installed the path is compared to all the
+    templates at once, otherwise each template is compared in turn.
+
+    The following example will print the shape drawn on the Blue Dot::
+
+        from bluedot import BlueDot
+        from bluedot.gestures import PathRecognizer
+        from signal import pause
+
+        def gesture(g):
+            print("{} drawn".format(g.value.name))
+
+        bd = BlueDot()
+        bd.add_gesture(PathRecognizer())
+        bd.when_gesture = gesture
+
+        pause()
+
+    :param dict templates:
+        A dictionary of names and sequences of ``(x, y)`` points. If
+        ``None`` (the default), :data:`TEMPLATES` are used.
+
+    :param float threshold:
+        The minimum score (between ``0`` and ``1``) for a path to match a
+        template. Defaults to ``0.9``.
+
+    :param int points:
+        The number of points paths are resampled to. Defaults to ``32``.
+
+    :param bool rotation_invariant:
+        If ``True``, templates will match paths drawn at any angle. Defaults
+        to ``False``.
+
+    :param bool use_numpy:
+        If ``None`` (the default), NumPy is used if it is installed. Set to
+        ``False`` to never use NumPy.
+
+    :param str name:
+        The name given to gestures recognised. Defaults to "path".
+
+    .. _$1 unistroke recognizer: https://depts.washington.edu/acelab/proj/dollar/index.html
+    .. _NumPy: https://numpy.org
+    """
+    name = "path"
+
+    def __init__(self, templates = None, threshold = 0.9, points = 32, rotation_invariant = False, use_numpy = None, name = None):
+        super().__init__(name)
+        self.threshold = threshold
+        self.rotation_invariant = rotation_invariant
+        self._points = points
+        self._numpy = None
+        if use_numpy is not False:
+            try:
+                # imported here, so numpy is only a pre-requisite for faster matching
+                import numpy
+                self._numpy = numpy
+            except ImportError:
+                if use_numpy:
+                    raise
+
+        self._names = []
+        self._vectors = []
+        self._matrix = None
+        if templates is None:
+            templates = TEMPLATES
+        for template_name, template_points in templates.items():
+            self.add_template(template_name, template_points)
+
+    @property
+    def templates(self):
+        """
+        A list of the names of the templates.
+        """
+        return list(self._names)
+
+    def add_template(self, name, points):
+        """
+        Adds a template.
+
+        :param str name:
+            The name of the template, more than one template can have the
+            same name.
+
+        :param points:
+            A sequence of ``(x, y)`` tuples or :class:`BlueDotPosition`
+            instances, e.g. the :attr:`~BlueDotInteraction.positions` of a
+            recorded interaction.
+        """
+        vector = normalize_path(points, self._points)
+        if vector is None:
+            raise ValueError("the template '{}' doesn't move".format(name))
+        self._names.append(name)
+        self._vectors.append(vector)
+        self._matrix = None
+
+    def recognize(self, points):
+        """
+        Returns a :class:`PathMatch` for the template which best matches the
+        path, or ``None`` if no template scores at least :attr:`threshold`.
+
+        :param points:
+            A sequence of ``(x, y)`` tuples or :class:`BlueDotPosition`
+            instances.
+        """
+        if not self._names or len(points) < 2:
+            return None
+
+        vector = normalize_path(points, self._points)
+        if vector is None:
+            return None
+
+        if self._numpy is not None:
+            index, score = self._best_numpy(vector)
+        else:
+            index, score = self._best_python(vector)
+
+        if score >= self.threshold:
+            return PathMatch(self._names[index], score)
+
+    def _best_numpy(self, vector):
+        numpy = self._numpy
+        if self._matrix is None:
+            self._matrix = numpy.array(self._vectors)
+        v = numpy.array(vector)
+        # the cosine similarity of the path with every template
+        a = self._matrix @ v
+        if self.rotation_invariant:
+            # the similarity at the best angle, see Protractor
+            r = numpy.empty_like(v)
+            r[0::2] = v[1::2]
+            r[1::2] = -v[0::2]
+            b = self._matrix @ r
+            a = numpy.sqrt(a * a + b * b)
+        index = int(numpy.argmax(a))
+        return index, float(a[index])
+
+    def _best_python(self, vector):
+        best_index = 0
+        best_score = -1
+        for index, template in enumerate(self._vectors):
+            a = sum(t * v for t, v in zip(template, vector))
+            if self.rotation_invariant:
+                b = sum(
+                    template[i] * vector[i + 1] - template[i + 1] * vector[i]
+                    for i in range(0, len(vector), 2))
+                a = sqrt(a * a + b * b)
+            if a > best_score:
+                best_index, best_score = index, a
+        return best_index, best_score
+
+    def released(self, button, position):
+        return self.recognize(button.interaction.positions)
@@ -0,0 +1,247 @@
+from operator import index
+
+from .colors import parse_color
+from .exceptions import ButtonDoesNotExist
+
+
+def _index(key):
+    # an int, or anything which can be used as one e.g. a numpy integer
+    try:
+        return index(key)
+    except TypeError:
+        return None
+
+def _indices(key, size):
+    # the indices selected by an int or a slice
+    if isinstance(key, slice):
+        return range(*key.indices(size))
+    key = _index(key)
+    if key is not None and 0 <= key < size:
+        return (key, )
+    return None
+
+
+class ButtonGrid:
+    """
+    The buttons of a :class:`~bluedot.BlueDot`, stored in a list row by row,
+    so a button is found by working out its index rather than looking it
+    up. The grid also keeps track of which buttons have been modified, so
+    only they need to be looked at when the configuration is sent.
+
+    This class is used by :class:`~bluedot.BlueDot` and is not intended to
+    be created directly.
+
+    :param int cols:
+        The number of columns.
+
+    :param int rows:
+        The number of rows.
+
+    :param buttons:
+        The buttons, row by row.
+    """
+    def __init__(self, cols = 0, rows = 0, buttons = ()):
+        buttons = tuple(buttons)
+        if len(buttons) != cols * rows:
+            raise ValueError("a grid of {}x{} needs {} buttons".format(cols, rows, cols * rows))
+        self._cols = cols
+        self._rows = rows
+        self._buttons = buttons
+        self._buttons_by_col = None
+        self._modified = set()
+
+    @property
+    def cols(self):
+        """
+        The number of columns.
+        """
+        return self._cols
+
+    @property
+    def rows(self):
+        """
+        The number of rows.
+        """
+        return self._rows
+
+    @property
+    def buttons(self):
+        """
+        A tuple of the buttons, row by row.
+        """
+        return self._buttons
+
+    @property
+    def buttons_by_col(self):
+        """
+        A tuple of the buttons, column by column, the order
+        :attr:`BlueDot.buttons <bluedot.BlueDot.buttons>` returns them in.
+        """
+        if self._buttons_by_col is None:
+            self._buttons_by_col = tuple(
+                self._buttons[row * self._cols + col]
+                for col in range(self._cols) for row in range(self._rows))
+        return self._buttons_by_col
+
+    @property
+    def modified(self):
+        """
+        A tuple of the buttons which have been modified, row by row.
+        """
+        return tuple(sorted(self._modified, key=lambda button: (button.row, button.col)))
+
+    def get(self, col, row):
+        """
+        Returns the button at `col`, `row` or ``None`` if there isn't one.
+        """
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            return self._buttons[row * self._cols + col]
+        return None
+
+    def update_modified(self, button):
+        """
+        Records whether a button is modified, called when its appearance or
+        the appearance of the Blue Dot changes.
+        """
+        if self.get(button.col, button.row) is not button:
+            # the button was removed when the grid was resized
+            return
+        if button.modified:
+            self._modified.add(button)
+        else:
+            self._modified.discard(button)
+
+    def resized(self, cols, rows, create):
+        """
+        Returns a new grid of `cols` x `rows`, keeping the buttons which are
+        in both grids.
+
+        :param create:
+            A function which is passed the ``col`` and ``row`` of each new
+            button and returns it.
+        """
+        buttons = []
+        for row in range(rows):
+            for col in range(cols):
+                button = self.get(col, row)
+                buttons.append(create(col, row) if button is None else button)
+        grid = ButtonGrid(cols, rows, buttons)
+        grid._modified = {button for button in self._modified if button.col < cols and button.row < rows}
+        return grid
+
+    def __len__(self):
+        return len(self._buttons)
+
+    def __iter__(self):
+        return iter(self._buttons)
+
+    def __getitem__(self, key):
+        try:
+            col, row = key
+        except (TypeError, ValueError):
+            raise ButtonDoesNotExist("The button `{}` does not exist".format(key))
+
+        col_index, row_index = _index(col), _index(row)
+        if col_index is not None and row_index is not None:
+            if 0 <= col_index < self._cols and 0 <= row_index < self._rows:
+                return self._buttons[row_index * self._cols + col_index]
+            raise ButtonDoesNotExist("The button `{}` does not exist".format(key))
+
+        cols = _indices(col, self._cols)
+        rows = _indices(row, self._rows)
+        if cols is None or rows is None:
+            raise ButtonDoesNotExist("The buttons `{}` do not exist".format(key))
+        buttons = self._buttons
+        return ButtonGridView(
+            buttons[r * self._cols + c] for r in rows for c in cols)
+
+
+class ButtonGridView:
+    """
+    A group of buttons from a :class:`~bluedot.BlueDot`, such as a row, a
+    column or a block, returned when the Blue Dot is indexed with slices::
+
+        from bluedot import BlueDot
+
+        bd = BlueDot(cols=3, rows=3)
+        bd[:, 0].color = "red"
+        bd[1, :].square = True
+        bd[0:2, 1:3].border = True
+
+    Setting :attr:`color`, :attr:`square`, :attr:`border` or
+    :attr:`visible` changes all the buttons, sending the changes in one
+    message.
+
+    :param buttons:
+        The buttons in the view.
+    """
+    def __init__(self, buttons):
+        self._buttons = tuple(buttons)
+
+    @property
+    def buttons(self):
+        """
+        A tuple of the buttons in the view, row by row.
+        """
+        return self._buttons
+
+    def __len__(self):
+        return len(self._buttons)
+
+    def __iter__(self):
+        return iter(self._buttons)
+
+    def __getitem__(self, index):
+        return self._buttons[index]
+
+    def _update(self, attr, value):
+        if self._buttons:
+            bd = self._buttons[0]._bd
+            bd._update_buttons((button, attr, value) for button in self._buttons)
+
+    @property
+    def color(self):
+        """
+        Sets the color of the buttons, or returns a tuple of their colors.
+        """
+        return tuple(button.color for button in self._buttons)
+
+    @color.setter
+    def color(self, value):
+        self._update("_color", parse_color(value))
+
+    @property
+    def square(self):
+        """
+        Sets whether the buttons are square, or returns a tuple of their
+        values.
+        """
+        return tuple(button.square for button in self._buttons)
+
+    @square.setter
+    def square(self, value):
+        self._update("_square", value)
+
+    @property
+    def border(self):
+        """
+        Sets whether the buttons have a border, or returns a tuple of their
+        values.
+        """
+        return tuple(button.border for button in self._buttons)
+
+    @border.setter
+    def border(self, value):
+        self._update("_border", value)
+
+    @property
+    def visible(self):
+        """
+        Sets whether the buttons are visible, or returns a tuple of their
+        values.
+        """
+        return tuple(button.visible for button in self._buttons)
+
+    @visible.setter
+    def visible(self, value):
+        self._update("_visible", value)
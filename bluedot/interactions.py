@@ -1,6 +1,9 @@
-from time import time
+from array import array
+from collections.abc import Sequence
 from math import atan2, degrees, hypot
 
+from .clock import DEFAULT_CLOCK
+
 class BlueDotPosition:
     """
     Represents a position of where the blue dot is pressed, released or held.
@@ -12,15 +15,40 @@ class BlueDotPosition:
     :param float y:
         The y position of the Blue Dot, 0 being centre, -1 being at the
         bottom and 1 being at the top.
+
+    :param clock:
+        The clock used to timestamp the position. If ``None`` (the default)
+        :class:`~bluedot.clock.MonotonicClock` is used.
     """
-    def __init__(self, col, row, x, y):
-        self._time = time()
+    # a position is created for every message received, slots keep them small
+    __slots__ = ("_clock", "_timestamp", "_col", "_row", "_x", "_y", "_angle", "_distance", "_region")
+
+    def __init__(self, col, row, x, y, clock = None):
+        self._clock = clock or DEFAULT_CLOCK
+        self._timestamp = self._clock.time_ns()
         self._col = int(col)
         self._row = int(row)
         self._x = self._clamped(float(x))
         self._y = self._clamped(float(y))
         self._angle = None
         self._distance = None
+        self._region = None
+
+    @classmethod
+    def _from_values(cls, col, row, x, y, timestamp, clock):
+        # creates a position from values which have already been parsed,
+        # without reading the clock
+        position = cls.__new__(cls)
+        position._clock = clock
+        position._timestamp = timestamp
+        position._col = col
+        position._row = row
+        position._x = x
+        position._y = y
+        position._angle = None
+        position._distance = None
+        position._region = None
+        return position
 
     def _clamped(self, v):
         return max(-1, min(1, v))
@@ -75,52 +103,92 @@ class BlueDotPosition:
             self._distance = self._clamped(hypot(self.x, self.y))
         return self._distance
 
+    @property
+    def region(self):
+        """
+        The region of the Blue Dot which is pressed, held or released, one
+        of ``"middle"``, ``"top"``, ``"right"``, ``"bottom"`` or ``"left"``.
+
+        The region is worked out once, so testing :attr:`top`,
+        :attr:`left`, etc is quick. See :class:`~bluedot.regions.RegionMap`
+        for splitting the Blue Dot into other regions.
+        """
+        if self._region is None:
+            self._region = self._find_region(self._x, self._y)
+        return self._region
+
+    @staticmethod
+    def _find_region(x, y):
+        # the same as testing distance and angle, without hypot or atan2
+        if x * x + y * y <= 0.25:
+            return "middle"
+        if y > 0 and -y < x <= y:
+            return "top"
+        if x > 0 and -x <= y < x:
+            return "right"
+        if y < 0 and y <= x < -y:
+            return "bottom"
+        return "left"
+
     @property
     def middle(self):
         """
         Returns ``True`` if the Blue Dot is pressed, held or released in the middle.
         """
-        return self.distance <= 0.5
+        return self.region == "middle"
 
     @property
     def top(self):
         """
         Returns ``True`` if the Blue Dot is pressed, held or released at the top.
         """
-        return self.distance > 0.5 and (-45 < self.angle <= 45)
+        return self.region == "top"
 
     @property
     def right(self):
         """
         Returns ``True`` if the Blue Dot is pressed, held or released on the right.
         """
-        return self.distance > 0.5 and (45 < self.angle <= 135)
+        return self.region == "right"
 
     @property
     def bottom(self):
         """
         Returns ``True`` if the Blue Dot is pressed, held or released at the bottom.
         """
-        return self.distance > 0.5 and (self.angle > 135 or self.angle <= -135)
+        return self.region == "bottom"
 
     @property
     def left(self):
         """
         Returns ``True`` if the Blue Dot is pressed, held or released on the left.
         """
-        return self.distance > 0.5 and (-135 < self.angle <= -45)
+        return self.region == "left"
 
     @property
     def time(self):
         """
-        The time the blue dot was at this position.
+        The time the blue dot was at this position, in seconds since the
+        epoch.
 
         .. note::
 
             This is the time the message was received from the Blue Dot app,
             not the time it was sent.
         """
-        return self._time
+        return self._clock.wall_time(self._timestamp)
+
+    @property
+    def timestamp(self):
+        """
+        The time the blue dot was at this position, as an integer number of
+        nanoseconds from the :class:`~bluedot.BlueDot`'s
+        :attr:`~bluedot.BlueDot.clock`.
+
+        The timestamp is monotonic and should be used to calculate the time
+        between positions.
+        """
+        return self._timestamp
 
     def __str__(self):
         return "BlueDotPosition - col={}, row={}, x={}, y={}".format(
@@ -128,6 +196,151 @@ class BlueDotPosition:
         )
 
 
+class BlueDotPositions(Sequence):
+    """
+    A sequence of :class:`BlueDotPosition` instances which make up a
+    :class:`BlueDotInteraction`.
+
+    The timestamp, x and y values of the positions are stored in compact
+    arrays and :class:`BlueDotPosition` objects are only created when they
+    are accessed.
+
+    The history can be bounded by the number of positions or by time, in
+    which case the oldest positions are discarded. The first position (where
+    the Blue Dot was pressed) and the most recent position are always kept.
+
+    This class is intended for use via :attr:`BlueDotInteraction.positions`
+    and should not be instantiated "manually".
+
+    :param BlueDotPosition first_position:
+        The first position in the sequence.
+
+    :param int max_positions:
+        The maximum number of positions to keep, must be at least 2. If
+        ``None`` (the default), the number of positions is not limited.
+
+    :param float history_seconds:
+        The number of seconds of positions to keep. If ``None`` (the
+        default), positions are not discarded based on their age.
+    """
+    def __init__(self, first_position, max_positions = None, history_seconds = None):
+        if max_positions is not None and max_positions < 2:
+            raise ValueError("max_positions must be at least 2")
+        if history_seconds is not None and history_seconds < 0:
+            raise ValueError("history_seconds cannot be negative")
+
+        self._col = first_position.col
+        self._row = first_position.row
+        self._clock = first_position._clock
+        self._max_positions = max_positions
+        self._history_ns = None if history_seconds is None else int(history_seconds * 1e9)
+        self._t = array("q", [first_position.timestamp])
+        self._x = array("d", [first_position.x])
+        self._y = array("d", [first_position.y])
+        # the index of the oldest position kept after the first position
+        self._start = 1
+        self._closed = False
+
+    def __len__(self):
+        return len(self._t) - self._start + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._position(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("position index out of range")
+        return self._position(index)
+
+    def __iter__(self):
+        yield self._position(0)
+        start = self._start
+        for t, x, y in zip(self._t[start:], self._x[start:], self._y[start:]):
+            yield BlueDotPosition._from_values(self._col, self._row, x, y, t, self._clock)
+
+    def _position(self, index):
+        if index > 0:
+            index += self._start - 1
+        return BlueDotPosition._from_values(
+            self._col, self._row, self._x[index], self._y[index], self._t[index], self._clock)
+
+    def append(self, position):
+        """
+        Adds a position to the end of the sequence, discarding the oldest
+        positions if the history is bounded.
+
+        :param BlueDotPosition position:
+            The position to add.
+        """
+        self._t.append(position.timestamp)
+        self._x.append(position.x)
+        self._y.append(position.y)
+
+        if self._max_positions is not None or self._history_ns is not None:
+            self._trim()
+
+    def _trim(self):
+        end = len(self._t)
+        start = self._start
+
+        if self._max_positions is not None:
+            start = max(start, end - self._max_positions + 1)
+
+        if self._history_ns is not None:
+            oldest = self._t[-1] - self._history_ns
+            while start < end - 1 and self._t[start] < oldest:
+                start += 1
+
+        self._start = start
+
+        # only remove the discarded positions once they make up half of the
+        # arrays, so the cost of moving the kept positions is amortised
+        if start > 16 and start * 2 > end:
+            self._compact()
+
+    def _compact(self):
+        if self._start > 1:
+            del self._t[1:self._start]
+            del self._x[1:self._start]
+            del self._y[1:self._start]
+            self._start = 1
+
+    def close(self):
+        """
+        Marks the sequence as complete, no more positions will be added.
+        """
+        self._compact()
+        self._closed = True
+
+    def as_numpy(self):
+        """
+        Returns a tuple of ``(timestamps, x, y)`` `NumPy`_ arrays.
+
+        Once the interaction has finished the arrays are views onto the
+        positions' storage and no data is copied. While the interaction is
+        still active copies are returned, so positions can continue to be
+        added.
+
+        `NumPy`_ will need to be installed.
+
+        .. _NumPy: https://numpy.org
+        """
+        # imported here, so numpy is only a pre-requisite for this method
+        import numpy
+
+        columns = (self._t, self._x, self._y)
+        if not self._closed:
+            # a view would stop the arrays being resized, so copy the
+            # positions which are being kept
+            columns = tuple(column[:1] + column[self._start:] for column in columns)
+
+        return (
+            numpy.frombuffer(columns[0], dtype=numpy.int64),
+            numpy.frombuffer(columns[1], dtype=numpy.float64),
+            numpy.frombuffer(columns[2], dtype=numpy.float64))
+
+
 class BlueDotInteraction:
     """
     Represents an interaction with the Blue Dot, from when it was pressed to
@@ -139,11 +352,31 @@ class BlueDotInteraction:
 
     :param BlueDotPosition pressed_position:
         The BlueDotPosition when the Blue Dot was pressed.
+
+    :param clock:
+        The clock used to calculate the :attr:`duration` of an active
+        interaction. If ``None`` (the default)
+        :class:`~bluedot.clock.MonotonicClock` is used.
+
+    :param int max_positions:
+        The maximum number of :attr:`positions` to keep. If ``None`` (the
+        default), all positions are kept.
+
+    :param float history_seconds:
+        The number of seconds of :attr:`positions` to keep. If ``None`` (the
+        default), all positions are kept.
     """
-    def __init__(self, pressed_position):
+    def __init__(self, pressed_position, clock = None, max_positions = None, history_seconds = None):
+        self._clock = clock or DEFAULT_CLOCK
         self._active = True
-        self._positions = []
-        self._positions.append(pressed_position)
+        self._positions = BlueDotPositions(pressed_position, max_positions, history_seconds)
+        self._pressed_position = pressed_position
+        self._previous_position = None
+        self._current_position = pressed_position
+        self._distance = 0
+        self._velocity = (0, 0)
+        self._acceleration = (0, 0)
+        self._velocity_known = False
 
     @property
     def active(self):
@@ -156,12 +389,16 @@ class BlueDotInteraction:
     @property
     def positions(self):
         """
-        A sequence of :class:`BlueDotPosition` instances for all the positions
-        which make up this interaction.
+        A :class:`BlueDotPositions` sequence of :class:`BlueDotPosition`
+        instances for all the positions which make up this interaction.
 
         The first position is where the Blue Dot was pressed, the last is where
         the Blue Dot was released, all position in between are where the position
         Blue Dot changed (i.e. moved) when it was held down.
+
+        If the history is bounded (see :attr:`BlueDot.max_positions` and
+        :attr:`BlueDot.history_seconds`) only the first and the most recent
+        positions are kept.
         """
         return self._positions
 
@@ -171,7 +408,7 @@ class BlueDotInteraction:
         Returns the position when the Blue Dot was pressed i.e. where the
         interaction started.
         """
-        return self._positions[0]
+        return self._pressed_position
 
     @property
     def released_position(self):
@@ -181,7 +418,7 @@ class BlueDotInteraction:
 
         If the interaction is still active it returns ``None``.
         """
-        return self._positions[-1] if not self.active else None
+        return self._current_position if not self.active else None
 
     @property
     def current_position(self):
@@ -191,7 +428,7 @@ class BlueDotInteraction:
         If the interaction is inactive, it will return the position when the
         Blue Dot was released.
         """
-        return self._positions[-1]
+        return self._current_position
 
     @property
     def previous_position(self):
@@ -200,7 +437,7 @@ class BlueDotInteraction:
 
         If the interaction contains only 1 position, None will be returned.
         """
-        return self._positions[-2] if len(self._positions) > 1 else None
+        return self._previous_position
 
     @property
     def duration(self):
@@ -209,22 +446,127 @@ class BlueDotInteraction:
         between when the Blue Dot was pressed and now or when it was released.
         """
         if self.active:
-            return time() - self.pressed_position.time
+            return (self._clock.time_ns() - self.pressed_position.timestamp) / 1e9
         else:
-            return self.released_position.time - self.pressed_position.time
+            return (self.released_position.timestamp - self.pressed_position.timestamp) / 1e9
 
     @property
     def distance(self):
         """
         Returns the total distance of the Blue Dot interaction
         """
-        dist = 0
-        for i in range(1, len(self._positions)):
-            p1 = self._positions[i-1]
-            p2 = self._positions[i]
-            dist += hypot(p2.x - p1.x, p2.y - p1.y)
+        # the distance is accumulated as positions are added, as the
+        # positions may not all be kept
+        return self._distance
+
+    @property
+    def displacement(self):
+        """
+        Returns a tuple of ``(x, y)`` which is the distance moved, in each
+        direction, between the pressed position and the current position.
+        """
+        return (
+            self._current_position.x - self._pressed_position.x,
+            self._current_position.y - self._pressed_position.y)
+
+    @property
+    def velocity(self):
+        """
+        Returns a tuple of ``(x, y)`` which is the velocity, in Blue Dot
+        radius / second, between the previous and current positions.
+        """
+        return self._velocity
+
+    @property
+    def speed(self):
+        """
+        Returns the speed, in Blue Dot radius / second, between the previous
+        and current positions.
+        """
+        return hypot(*self._velocity)
+
+    @property
+    def average_velocity(self):
+        """
+        Returns a tuple of ``(x, y)`` which is the average velocity, in Blue
+        Dot radius / second, between the pressed position and the current
+        position.
+        """
+        elapsed = self._elapsed()
+        if elapsed == 0:
+            return (0, 0)
+        x, y = self.displacement
+        return (x / elapsed, y / elapsed)
+
+    @property
+    def average_speed(self):
+        """
+        Returns the average speed, in Blue Dot radius / second, i.e. the
+        :attr:`distance` travelled between the pressed position and the
+        current position divided by the time taken.
+        """
+        elapsed = self._elapsed()
+        return self._distance / elapsed if elapsed > 0 else 0
 
-        return dist
+    @property
+    def acceleration(self):
+        """
+        Returns a tuple of ``(x, y)`` which is the change in
+        :attr:`velocity`, in Blue Dot radius / second², between the last 2
+        velocities.
+        """
+        return self._acceleration
+
+    def _elapsed(self):
+        return (self._current_position.timestamp - self._pressed_position.timestamp) / 1e9
+
+    def predicted_position(self, at = None, max_horizon = 0.1):
+        """
+        Returns a :class:`BlueDotPosition` which is where the Blue Dot is
+        predicted to be pressed at a point in time, extrapolated from the
+        current position, :attr:`velocity` and :attr:`acceleration`.
+
+        Positions take time to arrive over Bluetooth, so the current position
+        is always slightly out of date, predicting where the finger is now
+        can compensate for this.
+
+        If the interaction is inactive, the position where the Blue Dot was
+        released is returned.
+
+        :param float at:
+            The time, in seconds since the epoch (the same as
+            :attr:`BlueDotPosition.time`), to predict the position at e.g.
+            ``position.time + 0.05``. If ``None`` (the default) the current
+            time is used.
+
+        :param float max_horizon:
+            The maximum number of seconds to predict ahead of the current
+            position, the further ahead the less accurate the prediction.
+            Defaults to ``0.1``.
+        """
+        position = self._current_position
+        if not self._active:
+            return position
+
+        if at is None:
+            dt = (self._clock.time_ns() - position.timestamp) / 1e9
+        else:
+            # at is a wall clock time, so it is compared to the wall clock
+            # time of the position
+            dt = at - position.time
+        dt = min(max(dt, 0), max_horizon)
+        if dt == 0:
+            return position
+
+        vx, vy = self._velocity
+        ax, ay = self._acceleration
+        x = position.x + (vx + ax * dt / 2) * dt
+        y = position.y + (vy + ay * dt / 2) * dt
+
+        return BlueDotPosition._from_values(
+            position.col, position.row,
+            max(-1, min(1, x)), max(-1, min(1, y)),
+            position.timestamp + int(round(dt * 1e9)), self._clock)
 
     def moved(self, moved_position):
         """
@@ -232,7 +574,7 @@ class BlueDotInteraction:
         the Blue Dot is pressed moves.
         """
         if self._active:
-            self._positions.append(moved_position)
+            self._add_position(moved_position)
 
     def released(self, released_position):
         """
@@ -242,7 +584,32 @@ class BlueDotInteraction:
             The BlueDotPosition when the Blue Dot was released.
         """
         self._active = False
-        self._positions.append(released_position)
+        self._add_position(released_position)
+        self._positions.close()
+
+    def _add_position(self, position):
+        # keep running totals, so the properties don't need to look at all
+        # the positions
+        current = self._current_position
+        dx = position.x - current.x
+        dy = position.y - current.y
+        dt = (position.timestamp - current.timestamp) / 1e9
+
+        self._positions.append(position)
+        self._distance += hypot(dx, dy)
+
+        # positions received at the same time don't change the velocity
+        if dt > 0:
+            velocity = (dx / dt, dy / dt)
+            if self._velocity_known:
+                self._acceleration = (
+                    (velocity[0] - self._velocity[0]) / dt,
+                    (velocity[1] - self._velocity[1]) / dt)
+            self._velocity = velocity
+            self._velocity_known = True
+
+        self._previous_position = current
+        self._current_position = position
 
 
 class BlueDotSwipe:
@@ -268,8 +635,13 @@ class BlueDotSwipe:
     def _is_valid_swipe(self):
         #the validity of a swipe is based on the speed of the interaction,
         # so a short fast swipe is valid as well as a long slow swipe
-        #self._speed = self.distance / self.interaction.duration
-        self._speed = self.distance / self.interaction.duration
+        duration = self.interaction.duration
+        if duration > 0:
+            self._speed = self.distance / duration
+        else:
+            # the press and release happened at the same time (e.g. using a
+            # virtual clock), any movement is an infinitely fast swipe
+            self._speed = float("inf") if self.distance > 0 else 0
         if not self.interaction.active and self._speed > self._speed_threshold:
             return True
         else:
@@ -42,6 +42,14 @@ class MockBluetoothAdapter(BluetoothAdapter):
     def paired_devices(self):
         return [["01:01:01:01:01:01", "mock_device_1"], ["02:02:02:02:02:02", "mock_device_2"]]
 
+    def find_paired_device(self, name):
+        for address, alias in self.paired_devices:
+            if name == address or name == alias:
+                return address
+
+    def close(self):
+        pass
+
 
 class MockBluetoothServer(BluetoothServer):
     """
@@ -160,8 +168,10 @@ class MockBluetoothClient(BluetoothClient):
         """
         Connect to a Bluetooth server.
         """
-        self._server.mock_client_connected(self)
+        # connected first, so data the server sends when the client
+        # connects isn't lost
         self._connected = True
+        self._server.mock_client_connected(self)
 
     def disconnect(self):
         """
@@ -0,0 +1,152 @@
+from math import hypot
+
+from .colors import Color, parse_color
+
+DIRECTIONS = ("horizontal", "vertical", "diagonal", "radial")
+
+
+def _get_numpy(use_numpy):
+    if use_numpy is False:
+        return None
+    try:
+        # imported here, so numpy is only a pre-requisite for faster painting
+        import numpy
+        return numpy
+    except ImportError:
+        if use_numpy:
+            raise
+        return None
+
+
+def _gradient_position(col, row, cols, rows, direction):
+    # how far (0 - 1) along the gradient a button is
+    x = col / (cols - 1) if cols > 1 else 0
+    y = row / (rows - 1) if rows > 1 else 0
+    if direction == "horizontal":
+        return x
+    if direction == "vertical":
+        return y
+    if direction == "diagonal":
+        return (x + y) / 2
+    # radial, from the centre to the corners
+    return min(1, hypot(x - 0.5, y - 0.5) / hypot(0.5, 0.5))
+
+
+def _colors_from_array(numpy, values):
+    # values is an array of (rows, cols, 3 or 4) numbers, which are
+    # truncated to ints like Color does
+    if values.shape[2] == 3:
+        alpha = numpy.full(values.shape[:2] + (1, ), 255, dtype=values.dtype)
+        values = numpy.concatenate((values, alpha), axis=2)
+    values = values.astype(numpy.uint32)
+
+    # pack each color into a single number, so only the unique colors need
+    # to be created
+    packed = (values[..., 0] << 24) | (values[..., 1] << 16) | (values[..., 2] << 8) | values[..., 3]
+    unique, inverse = numpy.unique(packed, return_inverse=True)
+    colors = [Color(p >> 24, (p >> 16) & 255, (p >> 8) & 255, p & 255) for p in unique.tolist()]
+    rows, cols = packed.shape
+    inverse = inverse.reshape(-1).tolist()
+    return [[colors[i] for i in inverse[r * cols:(r + 1) * cols]] for r in range(rows)]
+
+
+def color_grid(values, cols, rows, use_numpy = None):
+    """
+    Returns a list of `rows` lists of `cols` :class:`~bluedot.colors.Color`
+    objects, see :meth:`~bluedot.BlueDot.set_colors`.
+
+    :param values:
+        A NumPy array of shape ``(rows, cols, 3)`` or ``(rows, cols, 4)``,
+        a list of rows, each a list of colors, or a function which is
+        passed the ``col`` and ``row`` of each button and returns its color.
+
+    :param int cols:
+        The number of columns.
+
+    :param int rows:
+        The number of rows.
+
+    :param bool use_numpy:
+        If ``None`` (the default), NumPy is used to convert arrays of
+        numbers if it is installed. Set to ``False`` to never use NumPy.
+    """
+    if callable(values):
+        return [[parse_color(values(col, row)) for col in range(cols)] for row in range(rows)]
+
+    numpy = _get_numpy(use_numpy)
+    if numpy is not None:
+        try:
+            array = numpy.asarray(values)
+        except (TypeError, ValueError):
+            # a mixture of types of color
+            array = None
+        if array is not None and array.dtype.kind in "iuf" and array.ndim == 3:
+            if array.shape[:2] != (rows, cols) or array.shape[2] not in (3, 4):
+                raise ValueError("colors must be an array of shape ({}, {}, 3) or ({}, {}, 4)".format(rows, cols, rows, cols))
+            if (array < 0).any() or (array > 255).any():
+                raise ValueError("color values must be 0 - 255")
+            return _colors_from_array(numpy, array)
+
+    values = [list(row) for row in values]
+    if len(values) != rows or any(len(row) != cols for row in values):
+        raise ValueError("colors must be {} rows of {} colors".format(rows, cols))
+    return [[parse_color(value) for value in row] for row in values]
+
+
+def gradient_grid(color_from, color_to, cols, rows, direction = "horizontal", use_numpy = None):
+    """
+    Returns a list of `rows` lists of `cols` :class:`~bluedot.colors.Color`
+    objects, blending from one color to another, see
+    :meth:`~bluedot.BlueDot.fill_gradient`.
+
+    :param color_from:
+        The color to start from.
+
+    :param color_to:
+        The color to finish at.
+
+    :param int cols:
+        The number of columns.
+
+    :param int rows:
+        The number of rows.
+
+    :param str direction:
+        ``"horizontal"`` (the default) from left to right, ``"vertical"``
+        from top to bottom, ``"diagonal"`` from the top left to the bottom
+        right or ``"radial"`` from the centre out.
+
+    :param bool use_numpy:
+        If ``None`` (the default), NumPy is used if it is installed. Set to
+        ``False`` to never use NumPy.
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError("{} is not a direction, must be one of {}".format(direction, ", ".join(DIRECTIONS)))
+    start = parse_color(color_from).rgba
+    end = parse_color(color_to).rgba
+
+    numpy = _get_numpy(use_numpy)
+    if numpy is not None:
+        x = numpy.arange(cols) / (cols - 1) if cols > 1 else numpy.zeros(cols)
+        y = numpy.arange(rows) / (rows - 1) if rows > 1 else numpy.zeros(rows)
+        x, y = numpy.meshgrid(x, y)
+        if direction == "horizontal":
+            t = x
+        elif direction == "vertical":
+            t = y
+        elif direction == "diagonal":
+            t = (x + y) / 2
+        else:
+            t = numpy.minimum(1, numpy.hypot(x - 0.5, y - 0.5) / numpy.hypot(0.5, 0.5))
+        start = numpy.array(start, dtype=float)
+        values = start + (numpy.array(end, dtype=float) - start) * t[..., None]
+        return _colors_from_array(numpy, numpy.rint(values))
+
+    grid = []
+    for row in range(rows):
+        colors = []
+        for col in range(cols):
+            t = _gradient_position(col, row, cols, rows, direction)
+            colors.append(Color(*(round(s + (e - s) * t) for s, e in zip(start, end))))
+        grid.append(colors)
+    return grid
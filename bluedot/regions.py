@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from math import cos, radians, sin
+
+from .threads import expects_arg
+
+
+def _pseudo_angle(x, y):
+    # a number between 0 and 4 which increases with the angle clockwise from
+    # up, like BlueDotPosition.angle, but without using trig
+    if x >= 0:
+        if y >= 0:
+            return x / (x + y) if x + y else 0
+        return 1 + -y / (x - y)
+    if y < 0:
+        return 2 + -x / (-x - y)
+    return 3 + y / (y - x)
+
+
+class RegionMap:
+    """
+    Splits the Blue Dot into regions, made up of rings (distances from the
+    centre) and sectors (angles), and calls a different function for each
+    region. A :class:`RegionMap` can be used as a callback, for example a
+    d-pad::
+
+        from bluedot import BlueDot
+        from bluedot.regions import RegionMap
+        from signal import pause
+
+        dpad = RegionMap(sectors=4, rings=(0.5, ))
+        dpad[0] = lambda: print("fire")
+        dpad[1, 0] = lambda: print("up")
+        dpad[1, 1] = lambda: print("right")
+        dpad[1, 2] = lambda: print("down")
+        dpad[1, 3] = lambda: print("left")
+
+        bd = BlueDot()
+        bd.when_pressed = dpad
+
+        pause()
+
+    Rings are numbered from ``0`` in the middle outwards, sectors from ``0``
+    at the top clockwise. A function can be set for a whole ring e.g.
+    ``dpad[0]`` or for a sector of a ring e.g. ``dpad[1, 0]``, which takes
+    priority.
+
+    The region of a position is worked out once, using tables built when the
+    map is created, rather than each function testing the position.
+
+    :param int sectors:
+        The number of sectors, of equal angle, the Blue Dot is split into.
+        Sector 0 is centred at the top. Defaults to ``4``.
+
+    :param rings:
+        The distances from the centre where each ring ends, in increasing
+        order. Defaults to ``(0.5, )``, a middle and an outer ring.
+    """
+    def __init__(self, sectors = 4, rings = (0.5, )):
+        if sectors < 1:
+            raise ValueError("there must be at least 1 sector")
+        rings = tuple(rings)
+        if list(rings) != sorted(rings) or any(not 0 < r < 1 for r in rings):
+            raise ValueError("rings must be in increasing order and between 0 and 1")
+
+        self._sectors = sectors
+        self._rings = rings
+        self._handlers = {}
+
+        # the squared distances where the rings end
+        self._ring_table = [r * r for r in rings]
+        # the pseudo angles where the sectors end
+        size = 360 / sectors
+        self._sector_table = [
+            _pseudo_angle(sin(radians(a)), cos(radians(a)))
+            for a in (size * (i + 0.5) for i in range(sectors))]
+
+    @property
+    def sectors(self):
+        """
+        The number of sectors.
+        """
+        return self._sectors
+
+    @property
+    def rings(self):
+        """
+        The distances from the centre where each ring ends.
+        """
+        return self._rings
+
+    def region(self, position):
+        """
+        Returns a tuple of ``(ring, sector)`` for a position.
+
+        :param BlueDotPosition position:
+            The position.
+        """
+        x, y = position.x, position.y
+        ring = bisect_left(self._ring_table, x * x + y * y)
+        sector = bisect_left(self._sector_table, _pseudo_angle(x, y)) % self._sectors
+        return ring, sector
+
+    def __setitem__(self, key, handler):
+        self._handlers[key] = (handler, expects_arg(handler))
+
+    def __getitem__(self, key):
+        return self._handlers[key][0]
+
+    def __delitem__(self, key):
+        del self._handlers[key]
+
+    def __call__(self, position):
+        ring, sector = self.region(position)
+        handler = self._handlers.get((ring, sector)) or self._handlers.get(ring)
+        if handler is not None:
+            handler, expects_arg = handler
+            if expects_arg:
+                handler(position)
+            else:
+                handler()
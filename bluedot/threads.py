@@ -1,5 +1,6 @@
 import atexit
-from threading import Thread, Event
+from inspect import getfullargspec
+from threading import Thread, Event, Condition, Lock
 
 _THREADS = set()
 
@@ -29,3 +30,106 @@ class WrapThread(Thread):
     def join(self):
         super(WrapThread, self).join()
         _THREADS.discard(self)
+
+
+def expects_arg(callback):
+    """
+    Returns ``True`` if `callback` takes an argument, ignoring ``self``.
+
+    :param callback:
+        The function or method.
+    """
+    args_expected = getfullargspec(callback).args
+    no_args_expected = len(args_expected)
+    if no_args_expected > 0:
+        # if someone names the first arg of a class function to something
+        # other than self, this will fail! or if they name the first argument
+        # of a non class function to self this will fail!
+        if args_expected[0] == "self":
+            no_args_expected -= 1
+    return no_args_expected > 0
+
+
+def run_callback(callback, args = (), background = False):
+    """
+    Calls `callback` in a :class:`WrapThread`, so an error in it is reported
+    but doesn't stop the caller.
+
+    :param callback:
+        The function to call.
+
+    :param tuple args:
+        The arguments to call it with.
+
+    :param bool background:
+        If ``False`` (the default) waits for the callback to finish.
+    """
+    call_back_t = WrapThread(target=callback, args=args)
+    call_back_t.start()
+
+    # if this callback is not running in the background wait for it
+    if not background:
+        call_back_t.join()
+
+
+class SequencedEvent:
+    """
+    An event which counts the number of times it has been set. Threads wait
+    for the count to pass a sequence number, so unlike
+    :class:`threading.Event` an event which happens before a thread starts
+    waiting, or several events in quick succession, are not missed.
+    """
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._seq = 0
+        self._waiting = 0
+
+    @property
+    def seq(self):
+        """
+        The number of times the event has been set.
+        """
+        return self._seq
+
+    @property
+    def waiting(self):
+        """
+        The number of threads waiting for the event.
+        """
+        return self._waiting
+
+    def set(self):
+        """
+        Increments the sequence number and wakes any waiting threads.
+        """
+        with self._cond:
+            self._seq += 1
+            if self._waiting:
+                self._cond.notify_all()
+
+    def wait(self, timeout = None, since = None):
+        """
+        Waits until the event is set after the sequence number `since` and
+        returns the number of times it has been set since, or ``0`` if the
+        wait timed out.
+
+        :param float timeout:
+            Number of seconds to wait, if ``None`` (the default) it will
+            wait indefinitely.
+
+        :param int since:
+            The sequence number to wait for the event to be set after. If
+            ``None`` (the default) the current sequence number is used, i.e.
+            it waits for the next event. If the event has already been set
+            since, it returns immediately.
+        """
+        with self._cond:
+            if since is None:
+                since = self._seq
+            if self._seq == since:
+                self._waiting += 1
+                try:
+                    self._cond.wait_for(lambda: self._seq != since, timeout)
+                finally:
+                    self._waiting -= 1
+            return self._seq - since
@@ -1,38 +1,436 @@
 from __future__ import unicode_literals
 
-import dbus
 import time
 import sys
+from threading import Lock, Thread
 
-SERVICE_NAME = "org.bluez"
-ADAPTER_INTERFACE = SERVICE_NAME + ".Adapter1"
-DEVICE_INTERFACE = SERVICE_NAME + ".Device1"
-PROFILE_MANAGER = SERVICE_NAME + ".ProfileManager1"
+from .constants import (
+    SERVICE_NAME,
+    ADAPTER_INTERFACE,
+    DEVICE_INTERFACE,
+    PROFILE_MANAGER,
+    PROPERTIES_INTERFACE,
+    OBJECT_MANAGER_INTERFACE,
+    DBUS_TIMEOUT,
+    SIGNAL_LOOP_WAKEUP,
+)
+
+_bus = None
+_signal_bus = None
+_signal_bus_lock = Lock()
+
+# the paths and addresses of the adapters, only cached when signals can be
+# received, so the cache can be cleared when adapters are added or removed
+_adapters = None
+# bumped each time the adapters change, so a list read while they were
+# changing isn't cached
+_adapters_generation = 0
+_adapters_lock = Lock()
+
+def _dbus():
+    # imported here, so importing bluedot doesn't load dbus until it is used
+    import dbus
+    return dbus
+
+def get_bus():
+    """
+    Returns the connection to the system bus shared by all the functions in
+    this module.
+    """
+    global _bus
+    if _bus is None:
+        _bus = _dbus().SystemBus()
+    return _bus
+
+def get_signal_bus():
+    """
+    Returns a connection to the system bus which receives signals. Returns
+    ``None`` if GLib is not available, in which case signals can't be
+    received.
+
+    dbus-python can only dispatch signals from GLib's default main context.
+    If the application is already running a GLib main loop, it dispatches
+    them. Otherwise they are dispatched by a background thread. The thread
+    iterates the context rather than running its own main loop, so a main
+    loop the application starts later takes the context over and the
+    thread waits.
+    """
+    dbus = _dbus()
+
+    global _signal_bus
+    with _signal_bus_lock:
+        if _signal_bus is None:
+            try:
+                # imported here, so GLib is only a pre-requisite for receiving signals
+                from gi.repository import GLib
+                from dbus.mainloop.glib import DBusGMainLoop, threads_init
+            except ImportError:
+                _signal_bus = False
+            else:
+                threads_init()
+                # a private connection, so the main loop doesn't have to be
+                # set as the default for every connection
+                _signal_bus = dbus.bus.BusConnection(dbus.bus.BUS_SYSTEM, mainloop=DBusGMainLoop())
+
+                context = GLib.MainContext.default()
+                if context.acquire():
+                    # no main loop is running
+                    context.release()
+                    # wake the thread regularly, so it lets go of the context
+                    # if a main loop is waiting for it
+                    GLib.timeout_add(SIGNAL_LOOP_WAKEUP, lambda: True)
+                    # a plain daemon thread, it runs until exit
+                    loop_thread = Thread(target=_iterate_main_context, args=(context, ))
+                    loop_thread.daemon = True
+                    loop_thread.start()
+
+                _watch_adapters(_signal_bus)
+        return _signal_bus or None
+
+def _iterate_main_context(context):
+    # each iteration acquires and releases the context, unlike
+    # GLib.MainLoop.run which holds it until the loop stops
+    while True:
+        context.iteration(True)
+
+def _watch_adapters(bus):
+    # clear the cached adapters when one is added or removed
+    for signal_name in ("InterfacesAdded", "InterfacesRemoved"):
+        bus.add_signal_receiver(
+            _clear_adapters,
+            signal_name=signal_name,
+            dbus_interface=OBJECT_MANAGER_INTERFACE,
+            bus_name=SERVICE_NAME)
+
+def _clear_adapters(path, interfaces):
+    global _adapters, _adapters_generation
+    if ADAPTER_INTERFACE in interfaces:
+        with _adapters_lock:
+            _adapters = None
+            _adapters_generation += 1
 
 def get_managed_objects():
-    bus = dbus.SystemBus()
-    manager = dbus.Interface(bus.get_object(SERVICE_NAME, "/"), "org.freedesktop.DBus.ObjectManager")
-    return manager.GetManagedObjects()
+    bus = get_bus()
+    manager = _dbus().Interface(bus.get_object(SERVICE_NAME, "/"), OBJECT_MANAGER_INTERFACE)
+    return manager.GetManagedObjects(timeout=DBUS_TIMEOUT)
+
+def _get_adapters():
+    # returns a list of (path, address) of the adapters, which is cached if
+    # signals can be received to say when it changes
+    global _adapters
+    adapters = _adapters
+    if adapters is None:
+        caching = get_signal_bus() is not None
+        generation = _adapters_generation
+        adapters = [
+            (str(path), str(ifaces[ADAPTER_INTERFACE]["Address"]))
+            for path, ifaces in get_managed_objects().items()
+            if ADAPTER_INTERFACE in ifaces]
+        if caching:
+            with _adapters_lock:
+                if generation == _adapters_generation:
+                    _adapters = adapters
+    return adapters
+
+def find_adapter_path(pattern=None):
+    """
+    Returns the D-Bus object path of the adapter whose address is `pattern`
+    or whose path ends with `pattern` e.g. ``"hci0"``. If `pattern` is
+    ``None`` the first adapter's path is returned.
+    """
+    for path, address in _get_adapters():
+        if not pattern or pattern == address or path.endswith(pattern):
+            return path
+    raise Exception("Bluetooth adapter {} not found".format(pattern))
 
 def find_adapter(pattern=None):
-    return find_adapter_in_objects(get_managed_objects(), pattern)
+    obj = get_bus().get_object(SERVICE_NAME, find_adapter_path(pattern))
+    return _dbus().Interface(obj, ADAPTER_INTERFACE)
 
 def find_adapter_in_objects(objects, pattern=None):
-    bus = dbus.SystemBus()
+    bus = get_bus()
     for path, ifaces in objects.items():
         adapter = ifaces.get(ADAPTER_INTERFACE)
         if adapter is None:
             continue
         if not pattern or pattern == adapter["Address"] or path.endswith(pattern):
             obj = bus.get_object(SERVICE_NAME, path)
-            return dbus.Interface(obj, ADAPTER_INTERFACE)
+            return _dbus().Interface(obj, ADAPTER_INTERFACE)
     raise Exception("Bluetooth adapter {} not found".format(pattern))
 
+def _adapter_properties_interface(device_name):
+    bus = get_bus()
+    return _dbus().Interface(bus.get_object(SERVICE_NAME, find_adapter_path(device_name)), PROPERTIES_INTERFACE)
+
 def get_adapter_property(device_name, prop):
-    bus = dbus.SystemBus()
-    adapter_path = find_adapter(device_name).object_path
-    adapter = dbus.Interface(bus.get_object(SERVICE_NAME, adapter_path),"org.freedesktop.DBus.Properties")
-    return adapter.Get(ADAPTER_INTERFACE, prop)
+    return _adapter_properties_interface(device_name).Get(ADAPTER_INTERFACE, prop, timeout=DBUS_TIMEOUT)
+
+def get_adapter_properties(device_name):
+    """
+    Returns a dictionary of all the properties of an adapter, read using a
+    single ``GetAll`` call.
+    """
+    return dict(_adapter_properties_interface(device_name).GetAll(ADAPTER_INTERFACE, timeout=DBUS_TIMEOUT))
+
+def set_adapter_property(device_name, prop, value):
+    if isinstance(value, bool):
+        value = _dbus().Boolean(value)
+    _adapter_properties_interface(device_name).Set(ADAPTER_INTERFACE, prop, value, timeout=DBUS_TIMEOUT)
+
+class AdapterProperties:
+    """
+    Caches the properties of a Bluetooth adapter, so reading a property is a
+    dictionary lookup rather than D-Bus calls. The cache is kept up to date
+    using the adapter's ``PropertiesChanged`` signal. If the adapter is
+    removed the cache is not used until it is added again.
+
+    If signals can't be received (see :func:`get_signal_bus`) the properties
+    are read from D-Bus each time.
+    """
+    def __init__(self, device_name):
+        self._lock = Lock()
+        self._path = find_adapter_path(device_name)
+        self._properties = None
+        self._receivers = []
+
+        bus = get_signal_bus()
+        if bus is not None:
+            self._receivers.append(bus.add_signal_receiver(
+                self._properties_changed,
+                signal_name="PropertiesChanged",
+                dbus_interface=PROPERTIES_INTERFACE,
+                bus_name=SERVICE_NAME,
+                path=self._path))
+            self._receivers.append(bus.add_signal_receiver(
+                self._interfaces_added,
+                signal_name="InterfacesAdded",
+                dbus_interface=OBJECT_MANAGER_INTERFACE,
+                bus_name=SERVICE_NAME))
+            self._receivers.append(bus.add_signal_receiver(
+                self._interfaces_removed,
+                signal_name="InterfacesRemoved",
+                dbus_interface=OBJECT_MANAGER_INTERFACE,
+                bus_name=SERVICE_NAME))
+            # read the properties after subscribing, so no changes are missed
+            self._properties = self._get_all()
+
+    @property
+    def path(self):
+        """
+        The D-Bus object path of the adapter.
+        """
+        return self._path
+
+    @property
+    def cached(self):
+        """
+        Returns ``True`` if the properties are being cached.
+        """
+        return self._properties is not None
+
+    def _interface(self):
+        bus = get_bus()
+        return _dbus().Interface(bus.get_object(SERVICE_NAME, self._path), PROPERTIES_INTERFACE)
+
+    def _get_all(self):
+        return dict(self._interface().GetAll(ADAPTER_INTERFACE, timeout=DBUS_TIMEOUT))
+
+    def get(self, prop):
+        """
+        Returns the value of an adapter property e.g. ``"Powered"``.
+        """
+        properties = self._properties
+        if properties is not None and prop in properties:
+            return properties[prop]
+        return self._interface().Get(ADAPTER_INTERFACE, prop, timeout=DBUS_TIMEOUT)
+
+    def set(self, prop, value):
+        """
+        Sets the value of an adapter property. The cache is updated straight
+        away, so reading the property returns the new value.
+        """
+        if isinstance(value, bool):
+            value = _dbus().Boolean(value)
+        self._interface().Set(ADAPTER_INTERFACE, prop, value, timeout=DBUS_TIMEOUT)
+        with self._lock:
+            if self._properties is not None:
+                self._properties[prop] = value
+
+    def close(self):
+        """
+        Stops receiving signals and caching the properties.
+        """
+        for receiver in self._receivers:
+            receiver.remove()
+        self._receivers = []
+        self._properties = None
+
+    def _properties_changed(self, interface, changed, invalidated):
+        if interface != ADAPTER_INTERFACE:
+            return
+        with self._lock:
+            if self._properties is not None:
+                self._properties.update(changed)
+                for prop in invalidated:
+                    self._properties.pop(prop, None)
+
+    def _interfaces_added(self, path, interfaces):
+        # the adapter is back, the signal has all its properties
+        if path == self._path and ADAPTER_INTERFACE in interfaces and self._receivers:
+            with self._lock:
+                self._properties = dict(interfaces[ADAPTER_INTERFACE])
+
+    def _interfaces_removed(self, path, interfaces):
+        # the adapter has gone, stop using the cache
+        if path == self._path and ADAPTER_INTERFACE in interfaces:
+            with self._lock:
+                self._properties = None
+
+class DeviceRegistry:
+    """
+    An index of the devices paired with a Bluetooth adapter, by address and
+    by alias, so finding a device doesn't need any D-Bus calls. The index is
+    kept up to date using the ``InterfacesAdded``, ``InterfacesRemoved`` and
+    ``PropertiesChanged`` signals.
+
+    If signals can't be received (see :func:`get_signal_bus`) the devices
+    are read from D-Bus each time they are looked up.
+    """
+    def __init__(self, device_name):
+        self._lock = Lock()
+        self._adapter_path = find_adapter_path(device_name)
+        self._devices = {}
+        self._by_address = {}
+        self._by_alias = {}
+        self._receivers = []
+
+        bus = get_signal_bus()
+        if bus is not None:
+            self._receivers.append(bus.add_signal_receiver(
+                self._interfaces_added,
+                signal_name="InterfacesAdded",
+                dbus_interface=OBJECT_MANAGER_INTERFACE,
+                bus_name=SERVICE_NAME))
+            self._receivers.append(bus.add_signal_receiver(
+                self._interfaces_removed,
+                signal_name="InterfacesRemoved",
+                dbus_interface=OBJECT_MANAGER_INTERFACE,
+                bus_name=SERVICE_NAME))
+            self._receivers.append(bus.add_signal_receiver(
+                self._properties_changed,
+                signal_name="PropertiesChanged",
+                dbus_interface=PROPERTIES_INTERFACE,
+                bus_name=SERVICE_NAME,
+                arg0=DEVICE_INTERFACE,
+                path_keyword="path"))
+        # load the devices after subscribing, so no changes are missed
+        self._load()
+
+    @property
+    def watching(self):
+        """
+        Returns ``True`` if the index is being kept up to date by signals.
+        """
+        return bool(self._receivers)
+
+    @property
+    def paired_devices(self):
+        """
+        Returns a list of ``(address, alias)`` of the paired devices.
+        """
+        self._refresh()
+        with self._lock:
+            return [(d["Address"], d["Alias"]) for d in self._by_address.values()]
+
+    def find(self, name):
+        """
+        Returns the address of the paired device whose address or alias is
+        `name`, or ``None`` if it isn't found.
+        """
+        self._refresh()
+        with self._lock:
+            device = self._by_address.get(name)
+            if device is None:
+                devices = self._by_alias.get(name)
+                if not devices:
+                    return None
+                device = next(iter(devices.values()))
+            return device["Address"]
+
+    def close(self):
+        """
+        Stops receiving signals.
+        """
+        for receiver in self._receivers:
+            receiver.remove()
+        self._receivers = []
+
+    def _refresh(self):
+        # without signals the index can't be trusted, so reload it
+        if not self._receivers:
+            self._load()
+
+    def _load(self):
+        with self._lock:
+            self._devices = {}
+            self._by_address = {}
+            self._by_alias = {}
+            for path, interfaces in get_managed_objects().items():
+                if DEVICE_INTERFACE in interfaces:
+                    self._add(path, interfaces[DEVICE_INTERFACE])
+
+    def _add(self, path, properties):
+        if properties.get("Adapter") != self._adapter_path:
+            return
+        device = {
+            "Address": str(properties.get("Address", "")),
+            "Alias": str(properties.get("Alias", "")),
+            "Paired": bool(properties.get("Paired", False)),
+            }
+        self._devices[str(path)] = device
+        self._index(device)
+
+    def _index(self, device):
+        if device["Paired"]:
+            self._by_address[device["Address"]] = device
+            self._by_alias.setdefault(device["Alias"], {})[device["Address"]] = device
+
+    def _unindex(self, device):
+        if self._by_address.get(device["Address"]) is device:
+            del self._by_address[device["Address"]]
+        devices = self._by_alias.get(device["Alias"])
+        if devices and devices.get(device["Address"]) is device:
+            del devices[device["Address"]]
+            if not devices:
+                del self._by_alias[device["Alias"]]
+
+    def _interfaces_added(self, path, interfaces):
+        if DEVICE_INTERFACE in interfaces:
+            with self._lock:
+                device = self._devices.pop(str(path), None)
+                if device is not None:
+                    self._unindex(device)
+                self._add(path, interfaces[DEVICE_INTERFACE])
+
+    def _interfaces_removed(self, path, interfaces):
+        if DEVICE_INTERFACE in interfaces:
+            with self._lock:
+                device = self._devices.pop(str(path), None)
+                if device is not None:
+                    self._unindex(device)
+
+    def _properties_changed(self, interface, changed, invalidated, path=None):
+        with self._lock:
+            device = self._devices.get(str(path))
+            if device is None:
+                return
+            self._unindex(device)
+            for prop in ("Address", "Alias"):
+                if prop in changed:
+                    device[prop] = str(changed[prop])
+            if "Paired" in changed:
+                device["Paired"] = bool(changed["Paired"])
+            self._index(device)
 
 def get_mac(device_name):
     return get_adapter_property(device_name, "Address")
@@ -52,10 +450,8 @@ def get_adapter_pairable_status(device_name):
 def get_paired_devices(device_name):
     paired_devices = []
 
-    bus = dbus.SystemBus()
-    adapter_path = find_adapter(device_name).object_path
-    om = dbus.Interface(bus.get_object(SERVICE_NAME, "/"), "org.freedesktop.DBus.ObjectManager")
-    objects = om.GetManagedObjects()
+    adapter_path = find_adapter_path(device_name)
+    objects = get_managed_objects()
 
     for path, interfaces in objects.items():
         if DEVICE_INTERFACE not in interfaces:
@@ -63,40 +459,21 @@ def get_paired_devices(device_name):
         properties = interfaces[DEVICE_INTERFACE]
         if properties["Adapter"] != adapter_path:
             continue
+        if not properties.get("Paired", False):
+            continue
 
         paired_devices.append((str(properties["Address"]), str(properties["Alias"])))
 
     return paired_devices
 
 def device_discoverable(device_name, discoverable):
-    bus = dbus.SystemBus()
-    adapter_path = find_adapter(device_name).object_path
-    adapter = dbus.Interface(bus.get_object(SERVICE_NAME, adapter_path),"org.freedesktop.DBus.Properties")
-    if discoverable:
-        value = dbus.Boolean(1)
-    else:
-        value = dbus.Boolean(0)
-    adapter.Set(ADAPTER_INTERFACE, "Discoverable", value)
+    set_adapter_property(device_name, "Discoverable", bool(discoverable))
 
 def device_pairable(device_name, pairable):
-    bus = dbus.SystemBus()
-    adapter_path = find_adapter(device_name).object_path
-    adapter = dbus.Interface(bus.get_object(SERVICE_NAME, adapter_path),"org.freedesktop.DBus.Properties")
-    if pairable:
-        value = dbus.Boolean(1)
-    else:
-        value = dbus.Boolean(0)
-    adapter.Set(ADAPTER_INTERFACE, "Pairable", value)
+    set_adapter_property(device_name, "Pairable", bool(pairable))
 
 def device_powered(device_name, powered):
-    bus = dbus.SystemBus()
-    adapter_path = find_adapter(device_name).object_path
-    adapter = dbus.Interface(bus.get_object(SERVICE_NAME, adapter_path),"org.freedesktop.DBus.Properties")
-    if powered:
-        value = dbus.Boolean(1)
-    else:
-        value = dbus.Boolean(0)
-    adapter.Set(ADAPTER_INTERFACE, "Powered", value)
+    set_adapter_property(device_name, "Powered", bool(powered))
 
 def register_spp(port):
 
@@ -127,7 +504,9 @@ def register_spp(port):
     </record>
     """.format(port)
 
-    bus = dbus.SystemBus()
+    dbus = _dbus()
+
+    bus = get_bus()
 
     manager = dbus.Interface(bus.get_object(SERVICE_NAME, "/org/bluez"), PROFILE_MANAGER)
 
@@ -139,7 +518,7 @@ def register_spp(port):
     }
 
     try:
-        manager.RegisterProfile(path, uuid, opts)
+        manager.RegisterProfile(path, uuid, opts, timeout=DBUS_TIMEOUT)
     except dbus.exceptions.DBusException as e:
         #the spp profile has already been registered, ignore
         if str(e) != "org.bluez.Error.AlreadyExists: Already Exists":
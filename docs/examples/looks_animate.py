@@ -0,0 +1,14 @@
+from bluedot import BlueDot
+from signal import pause
+
+bd = BlueDot()
+bd.animate_keyframes(
+    [(0, "blue"), (0.5, "red"), (1, "blue")],
+    easing="ease_in_out", repeat=True)
+
+def stop_pulsing():
+    bd.color = "green"
+
+bd.when_pressed = stop_pulsing
+
+pause()
@@ -0,0 +1,7 @@
+from bluedot import BlueDot
+from signal import pause
+
+bd = BlueDot(cols=5, rows=5)
+bd.fill_gradient("blue", "red", direction="radial")
+
+pause()
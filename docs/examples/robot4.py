@@ -0,0 +1,10 @@
+from gpiozero import Robot
+from bluedot import BlueDot
+from signal import pause
+
+robot = Robot(left=(lfpin, lbpin), right=(rfpin, rbpin))
+bd = BlueDot()
+
+robot.source = bd.iter_robot_values()
+
+pause()
@@ -1,15 +1,13 @@
 from bluedot import BlueDot
+from bluedot.regions import RegionMap
 from signal import pause
 
-def dpad(pos):
-    if pos.top:
-        print("up")
-    elif pos.bottom:
-        print("down")
-    elif pos.left:
-        print("left")
-    elif pos.right:
-        print("right")
+# the middle and 4 sectors around it, starting at the top
+dpad = RegionMap(sectors=4, rings=(0.5, ))
+dpad[1, 0] = lambda: print("up")
+dpad[1, 1] = lambda: print("right")
+dpad[1, 2] = lambda: print("down")
+dpad[1, 3] = lambda: print("left")
 
 bd = BlueDot()
 bd.when_pressed = dpad
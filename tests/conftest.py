@@ -0,0 +1,152 @@
+import sys
+import types
+import pytest
+from threading import Event
+
+from bluedot import MockBlueDot
+from bluedot.constants import PROTOCOL_VERSION, ADAPTER_INTERFACE, DEVICE_INTERFACE
+from bluedot.mock import MockBluetoothClient
+
+@pytest.fixture
+def mock_blue_dot():
+    """
+    Returns a function which creates a :class:`MockBlueDot` connected to a
+    :class:`MockBluetoothClient`, and a list of the messages the client
+    receives from the Blue Dot.
+    """
+    def create(**kwargs):
+        mbd = MockBlueDot(print_messages = False, **kwargs)
+        received = []
+        connected = Event()
+
+        def data_received(data):
+            received.append(data)
+            connected.set()
+
+        client = MockBluetoothClient(mbd.server, data_received)
+        client.send("3,{},Mock client\n".format(PROTOCOL_VERSION))
+        # the configuration is sent when the client connects, in the
+        # background, wait for it so it isn't mistaken for a later message
+        assert connected.wait(1)
+        del received[:]
+        return mbd, received
+
+    return create
+
+
+class FakeDBusObject:
+    def __init__(self, bus, path):
+        self.bus = bus
+        self.path = path
+
+
+class FakeInterface:
+    # the methods of the bluez interfaces used by bluedot.utils, working on
+    # the objects held by a FakeBus
+    def __init__(self, obj, interface):
+        self._bus = obj.bus
+        self._path = obj.path
+        self._interface = interface
+
+    def GetManagedObjects(self, timeout = None):
+        self._bus.calls.append("GetManagedObjects")
+        return {path: {iface: dict(props) for iface, props in ifaces.items()} for path, ifaces in self._bus.objects.items()}
+
+    def GetAll(self, interface, timeout = None):
+        self._bus.calls.append("GetAll")
+        return dict(self._bus.objects[self._path][interface])
+
+    def Get(self, interface, prop, timeout = None):
+        self._bus.calls.append("Get")
+        return self._bus.objects[self._path][interface][prop]
+
+    def Set(self, interface, prop, value, timeout = None):
+        self._bus.calls.append("Set")
+        self._bus.objects[self._path][interface][prop] = value
+
+
+class FakeReceiver:
+    def __init__(self, receivers, handler, signal_name, path, arg0, path_keyword):
+        self._receivers = receivers
+        self.handler = handler
+        self.signal_name = signal_name
+        self.path = path
+        self.arg0 = arg0
+        self.path_keyword = path_keyword
+
+    def remove(self):
+        self._receivers.remove(self)
+
+
+class FakeBus:
+    """
+    Stands in for a D-Bus connection to bluez. It holds the managed objects
+    and calls the signal receivers added to it when a signal is emitted.
+    """
+    def __init__(self):
+        self.objects = {}
+        self.receivers = []
+        self.calls = []
+
+    def get_object(self, service, path):
+        return FakeDBusObject(self, path)
+
+    def add_signal_receiver(self, handler, signal_name, dbus_interface = None, bus_name = None, path = None, arg0 = None, path_keyword = None):
+        receiver = FakeReceiver(self.receivers, handler, signal_name, path, arg0, path_keyword)
+        self.receivers.append(receiver)
+        return receiver
+
+    def emit(self, signal_name, path, *args):
+        for receiver in list(self.receivers):
+            if receiver.signal_name != signal_name:
+                continue
+            if receiver.path is not None and receiver.path != path:
+                continue
+            if receiver.arg0 is not None and receiver.arg0 != args[0]:
+                continue
+            kwargs = {receiver.path_keyword: path} if receiver.path_keyword else {}
+            receiver.handler(*args, **kwargs)
+
+    def add_adapter(self, path, address, **properties):
+        properties.update(Address = address)
+        self.objects[path] = {ADAPTER_INTERFACE: properties}
+        self.emit("InterfacesAdded", "/", path, self.objects[path])
+
+    def remove_adapter(self, path):
+        interfaces = list(self.objects.pop(path))
+        self.emit("InterfacesRemoved", "/", path, interfaces)
+
+    def add_device(self, path, adapter, address, alias, paired = True):
+        self.objects[path] = {DEVICE_INTERFACE: {
+            "Adapter": adapter, "Address": address, "Alias": alias, "Paired": paired}}
+        self.emit("InterfacesAdded", "/", path, self.objects[path])
+
+    def remove_device(self, path):
+        interfaces = list(self.objects.pop(path))
+        self.emit("InterfacesRemoved", "/", path, interfaces)
+
+    def change_properties(self, path, interface, changed):
+        self.objects[path][interface].update(changed)
+        self.emit("PropertiesChanged", path, interface, changed, [])
+
+
+@pytest.fixture
+def fake_bus(monkeypatch):
+    """
+    Replaces the D-Bus connections used by :mod:`bluedot.utils` with a
+    :class:`FakeBus`, which receives signals, and ``dbus`` with a module
+    holding the parts of it bluedot uses.
+    """
+    from bluedot import utils
+
+    dbus = types.ModuleType("dbus")
+    dbus.Interface = FakeInterface
+    dbus.Boolean = bool
+    monkeypatch.setitem(sys.modules, "dbus", dbus)
+
+    bus = FakeBus()
+    monkeypatch.setattr(utils, "_bus", bus)
+    monkeypatch.setattr(utils, "_signal_bus", bus)
+    monkeypatch.setattr(utils, "_adapters", None)
+    utils._watch_adapters(bus)
+    return bus
@@ -0,0 +1,145 @@
+import sys
+import types
+import asyncio
+import pytest
+
+from bluedot.aio import AsyncBluetoothAdapter
+from bluedot.constants import ADAPTER_INTERFACE, DEVICE_INTERFACE
+
+
+class Variant:
+    def __init__(self, signature, value):
+        self.signature = signature
+        self.value = value
+
+
+class Message:
+    def __init__(self, destination, path, interface, member, signature = "", body = ()):
+        self.path = path
+        self.interface = interface
+        self.member = member
+        self.body = body
+
+
+class Reply:
+    def __init__(self, body = (), error_name = None):
+        self.message_type = "error" if error_name else "method_return"
+        self.body = list(body)
+        self.error_name = error_name
+
+
+class DBusError(Exception):
+    def __init__(self, error_name, text, reply):
+        super().__init__(error_name, text)
+        self.error_name = error_name
+
+
+class MessageBus:
+    """
+    Stands in for a dbus-next connection to bluez, replying to the calls the
+    adapter makes from a dictionary of objects.
+    """
+    objects = {}
+
+    def __init__(self, bus_type = None):
+        self.calls = []
+        self.connected = False
+        self.delay = 0
+
+    async def connect(self):
+        self.connected = True
+        return self
+
+    def disconnect(self):
+        self.connected = False
+
+    async def call(self, message):
+        self.calls.append(message.member)
+        await asyncio.sleep(self.delay)
+        objects = self.objects
+        if message.member == "GetManagedObjects":
+            return Reply([{path: {iface: {name: Variant("", value) for name, value in props.items()}
+                for iface, props in ifaces.items()} for path, ifaces in objects.items()}])
+        interface, *args = message.body
+        properties = objects.get(message.path, {}).get(interface)
+        if properties is None:
+            return Reply(["unknown object"], "org.freedesktop.DBus.Error.UnknownObject")
+        if message.member == "Get":
+            return Reply([Variant("", properties[args[0]])])
+        if message.member == "GetAll":
+            return Reply([{name: Variant("", value) for name, value in properties.items()}])
+        if message.member == "Set":
+            name, value = args
+            properties[name] = value.value if isinstance(value, Variant) else value
+            return Reply()
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    dbus_next = types.ModuleType("dbus_next")
+    dbus_next.BusType = types.SimpleNamespace(SYSTEM = "system")
+    dbus_next.MessageType = types.SimpleNamespace(ERROR = "error", METHOD_RETURN = "method_return")
+    dbus_next.Message = Message
+    dbus_next.Variant = Variant
+    aio = types.ModuleType("dbus_next.aio")
+    aio.MessageBus = MessageBus
+    errors = types.ModuleType("dbus_next.errors")
+    errors.DBusError = DBusError
+    monkeypatch.setitem(sys.modules, "dbus_next", dbus_next)
+    monkeypatch.setitem(sys.modules, "dbus_next.aio", aio)
+    monkeypatch.setitem(sys.modules, "dbus_next.errors", errors)
+
+    MessageBus.objects = {
+        "/org/bluez/hci0": {ADAPTER_INTERFACE: {
+            "Address": "00:11:22:33:44:55", "Powered": False, "Discoverable": False, "Pairable": False}},
+        "/org/bluez/hci0/dev_1": {DEVICE_INTERFACE: {
+            "Adapter": "/org/bluez/hci0", "Address": "11:11:11:11:11:11", "Alias": "phone", "Paired": True}},
+        "/org/bluez/hci0/dev_2": {DEVICE_INTERFACE: {
+            "Adapter": "/org/bluez/hci0", "Address": "22:22:22:22:22:22", "Alias": "tablet", "Paired": False}},
+        }
+    return MessageBus
+
+def test_async_adapter(bus):
+    async def test():
+        async with AsyncBluetoothAdapter() as bta:
+            assert bta.address == "00:11:22:33:44:55"
+
+            assert await bta.get_powered() == False
+            await bta.set_powered(True)
+            assert await bta.get_powered() == True
+            assert bus.objects["/org/bluez/hci0"][ADAPTER_INTERFACE]["Powered"] is True
+
+            properties = await bta.get_properties()
+            assert properties["Address"] == "00:11:22:33:44:55"
+
+            assert await bta.get_paired_devices() == [("11:11:11:11:11:11", "phone")]
+
+            await bta.allow_pairing(0.01)
+            assert await bta.get_pairable() and await bta.get_discoverable()
+            await asyncio.sleep(0.1)
+            assert not await bta.get_pairable() and not await bta.get_discoverable()
+
+        assert bta._bus is None
+
+    asyncio.run(test())
+
+def test_async_adapter_not_found(bus):
+    async def test():
+        async with AsyncBluetoothAdapter("hci1"):
+            pass
+
+    with pytest.raises(Exception, match = "Bluetooth adapter hci1 not found"):
+        asyncio.run(test())
+
+def test_async_adapter_timeout(bus):
+    async def test():
+        bta = AsyncBluetoothAdapter(timeout = 0.01)
+        await bta.open()
+        bta._bus.delay = 1
+        try:
+            await bta.get_powered()
+        finally:
+            bta.close()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(test())
@@ -0,0 +1,136 @@
+import pytest
+
+from bluedot import MockBlueDot
+from bluedot.mock import MockBluetoothClient
+from bluedot.animation import Animation, ease_in, ease_in_out, ease_out, linear
+from bluedot.clock import VirtualClock
+from bluedot.colors import Color
+from bluedot.constants import PROTOCOL_VERSION
+
+def test_easings():
+    for easing in (linear, ease_in, ease_out, ease_in_out):
+        assert easing(0) == 0
+        assert easing(1) == 1
+    assert ease_in(0.5) < linear(0.5) < ease_out(0.5)
+    assert ease_in_out(0.5) == 0.5
+
+def test_keyframes():
+    animation = Animation(None, [(1, "white"), (0, "black")])
+    assert animation.duration == 1
+    assert animation.color_at(0) is Color(0, 0, 0)
+    assert animation.color_at(0.5) == (128, 128, 128)
+    assert animation.color_at(2) is Color(255, 255, 255)
+
+    animation = Animation(None, [(0, "black"), (1, "white"), (3, "black")], repeat = True)
+    assert animation.color_at(2) == (128, 128, 128)
+    assert animation.color_at(3.5) == animation.color_at(0.5)
+
+    with pytest.raises(ValueError):
+        Animation(None, [(0, "black"), (1, "white")], easing = "bounce")
+    with pytest.raises(ValueError):
+        Animation(None, [(0, "black")], repeat = True)
+
+def test_animate(mock_blue_dot):
+    clock = VirtualClock()
+    mbd, sent = mock_blue_dot(cols = 2, clock = clock)
+
+    animation = mbd.animate("black", "white", duration = 1)
+    assert mbd.animation is animation
+    mbd._animator.frame()
+    assert mbd.color == "black"
+    assert mbd[0,0].color == "black" and mbd[1,0].color == "black"
+    # both buttons are sent in one message
+    assert sent[-1].count("5,") == 2
+
+    clock.advance(0.5)
+    mbd._animator.frame()
+    assert mbd[1,0].color == (128, 128, 128)
+
+    clock.advance(0.5)
+    mbd._animator.frame()
+    assert mbd[1,0].color == "white"
+    assert animation.wait(1)
+    assert animation.done
+    assert mbd.animation is None
+
+def test_animate_button(mock_blue_dot):
+    clock = VirtualClock()
+    mbd, sent = mock_blue_dot(cols = 2, clock = clock)
+
+    mbd.animate_keyframes([(0, "red"), (1, "green")], repeat = True)
+    button_animation = mbd[1,0].animate(None, "white", duration = 1)
+    mbd._animator.frame()
+    # the button's own animation takes priority
+    assert mbd[0,0].color == "red"
+    assert mbd[1,0].color == "blue"
+
+    # setting the color stops the animation
+    mbd[1,0].color = "yellow"
+    assert mbd[1,0].animation is None
+    assert button_animation.done
+    clock.advance(0.5)
+    mbd._animator.frame()
+    assert mbd[0,0].color == (128, 64, 0)
+    # and the blue dot's animation leaves the button's new color alone
+    assert mbd[1,0].color == "yellow"
+
+    # starting an animation replaces the last one
+    first = mbd[1,0].animate("black", "white")
+    second = mbd[1,0].animate("white", "black")
+    assert first.done and not second.done
+    assert mbd[1,0].animation is second
+
+    mbd.color = "blue"
+    assert mbd.animation is None
+    second.cancel()
+    assert mbd._animator.animations == ()
+
+def test_adaptive_fps():
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+
+    # a client which is slow to receive the frames
+    def slow_receive(data):
+        clock.advance(0.05)
+    client = MockBluetoothClient(mbd.server, slow_receive)
+    client.send("3,{},Mock client\n".format(PROTOCOL_VERSION))
+
+    animation = mbd.animate("black", "white", duration = 1, fps = 25, repeat = True)
+    clock.advance(0.1)
+    mbd._animator.frame()
+    assert mbd._animator.fps < 25
+    animation.cancel()
+
+def test_animate_modified_buttons(mock_blue_dot):
+    clock = VirtualClock()
+    mbd, sent = mock_blue_dot(cols = 2, clock = clock)
+
+    mbd[1,0].color = "red"
+    mbd.animate("black", "white", duration = 1)
+    mbd._animator.frame()
+    clock.advance(0.5)
+    mbd._animator.frame()
+    # the button with its own color is left alone
+    assert mbd[0,0].color == (128, 128, 128)
+    assert mbd[1,0].color == "red"
+    assert mbd._buttons.modified == (mbd[1,0], )
+
+def test_animation_error(capsys):
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+
+    def broken(t):
+        raise ValueError("broken easing")
+
+    animation = mbd.animate("black", "white", duration = 0.1, easing = broken)
+    # the animation is finished and the error printed
+    assert animation.wait(1)
+    assert mbd.animation is None
+    assert "broken easing" in capsys.readouterr().err
+    mbd._animator._thread.join()
+    assert mbd._animator.fps is None
+
+    # later animations still run
+    animation = mbd.animate("black", "white", duration = 0.1)
+    assert animation.wait(1)
+    assert mbd.color == "white"
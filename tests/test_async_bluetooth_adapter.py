@@ -0,0 +1,59 @@
+import pytest
+import asyncio
+
+pytest.importorskip("dbus_next")
+
+from bluedot.aio import AsyncBluetoothAdapter
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+try:
+    bta = AsyncBluetoothAdapter("hci0")
+    run(bta.open())
+    bta.close()
+except Exception as e:
+    if str(e) == "Bluetooth adapter hci0 not found":
+        pytest.skip("Bluetooth adapter hci0 not found - skipping test", allow_module_level = True)
+
+def test_async_bluetooth_adapter():
+    async def test():
+        async with AsyncBluetoothAdapter() as bta:
+            assert bta.device == "hci0"
+            assert len(bta.address) == 17
+
+            powered = await bta.get_powered()
+            discoverable = await bta.get_discoverable()
+            pairable = await bta.get_pairable()
+
+            await bta.set_powered(True)
+            assert await bta.get_powered() == True
+
+            await bta.set_discoverable(not discoverable)
+            assert await bta.get_discoverable() == (not discoverable)
+            await bta.set_discoverable(discoverable)
+
+            await bta.set_pairable(not pairable)
+            assert await bta.get_pairable() == (not pairable)
+            await bta.set_pairable(pairable)
+
+            await bta.allow_pairing(None)
+            assert await bta.get_pairable() == True
+            assert await bta.get_discoverable() == True
+
+            assert isinstance(await bta.get_paired_devices(), list)
+
+            # reset the adapter back
+            await bta.set_powered(powered)
+            await bta.set_discoverable(discoverable)
+            await bta.set_pairable(pairable)
+
+    run(test())
+
+def test_async_bluetooth_adapter_timeout():
+    async def test():
+        async with AsyncBluetoothAdapter(timeout = 0.000001) as bta:
+            pass
+
+    with pytest.raises(asyncio.TimeoutError):
+        run(test())
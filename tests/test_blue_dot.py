@@ -1,7 +1,9 @@
 import pytest
 from bluedot import MockBlueDot, BlueDotSwipe, BlueDotRotation
 from bluedot.exceptions import ButtonDoesNotExist
-from time import sleep
+from bluedot.clock import VirtualClock
+from bluedot.threads import WrapThread
+from time import sleep, time
 from threading import Event, Thread
 
 def test_default_values():
@@ -163,22 +165,23 @@ def test_pressed_moved_released():
     not_pressed(mbd[1,0], 0, 0)
 
 def test_double_press():
-    mbd = MockBlueDot()
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
     mbd.mock_client_connected()
 
     def simulate_double_press(col, row):
-        #sleep longer than the double press time, to clear any past double presses!
-        sleep(mbd.double_press_time + 0.1)
+        #move time on by longer than the double press time, to clear any past double presses!
+        clock.advance(mbd.double_press_time + 0.1)
         mbd.mock_blue_dot_pressed(col,row,0,0)
         mbd.mock_blue_dot_released(col,row,0,0)
         mbd.mock_blue_dot_pressed(col,row,0,0)
         mbd.mock_blue_dot_released(col,row,0,0)
 
     def simulate_failed_double_press(col, row):
-        sleep(mbd.double_press_time + 0.1)
+        clock.advance(mbd.double_press_time + 0.1)
         mbd.mock_blue_dot_pressed(col,row,0,0)
         mbd.mock_blue_dot_released(col,row,0,0)
-        sleep(mbd.double_press_time + 0.1)
+        clock.advance(mbd.double_press_time + 0.1)
         mbd.mock_blue_dot_pressed(col,row,0,0)
         mbd.mock_blue_dot_released(col,row,0,0)
 
@@ -431,6 +434,255 @@ def test_interaction():
     
     interaction(mbd[1,0], 1, 0)
 
+def test_virtual_clock():
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+    assert mbd.clock is clock
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert mbd[0,0].interaction.duration == 0
+    clock.advance(1.5)
+    assert mbd[0,0].interaction.duration == 1.5
+
+    mbd.mock_blue_dot_released(0,0,0,0)
+    clock.advance(1)
+    assert mbd[0,0].interaction.duration == 1.5
+    assert mbd[0,0].interaction.released_position.time == 1.5
+
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+
+def test_position_timestamps():
+    clock = VirtualClock(10)
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    clock.advance(0.25)
+    mbd.mock_blue_dot_released(0,0,1,0)
+
+    interaction = mbd[0,0].interaction
+    assert interaction.pressed_position.timestamp == 10000000000
+    assert interaction.released_position.timestamp == 10250000000
+    assert interaction.released_position.time == 10.25
+    assert interaction.duration == 0.25
+
+    # a swipe which takes no time at all is still a swipe
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    mbd.mock_blue_dot_released(0,0,1,0)
+    swipe = BlueDotSwipe(mbd[0,0].interaction)
+    assert swipe.valid
+    assert swipe.right
+
+def test_position_wall_time():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert abs(mbd.position.time - time()) < 1
+
+def test_position_wall_time_changed(monkeypatch):
+    import bluedot.clock
+
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    position = mbd.position
+
+    # the system time is set (e.g. by NTP) an hour forward after the
+    # position was received
+    stepped_time = time() + 3600
+    monkeypatch.setattr(bluedot.clock, "time", lambda: stepped_time)
+    assert abs(position.time - stepped_time) < 1
+
+def test_interaction_positions():
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    for i in range(1, 10):
+        clock.advance(0.1)
+        mbd.mock_blue_dot_moved(0,0,-1 + (i * 0.2),0)
+    clock.advance(0.1)
+    mbd.mock_blue_dot_released(0,0,1,0)
+
+    positions = mbd[0,0].interaction.positions
+    assert len(positions) == 11
+    assert positions[0].x == -1
+    assert positions[-1].x == 1
+    assert positions[5].x == pytest.approx(0)
+    assert positions[5].timestamp == 500000000
+    assert positions[5].col == 0 and positions[5].row == 0
+    assert [p.x for p in positions[9:]] == [positions[9].x, 1]
+    assert [p.x for p in positions] == [p.x for p in positions[:]]
+    with pytest.raises(IndexError):
+        positions[11]
+
+def test_interaction_motion():
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    interaction = mbd[0,0].interaction
+    assert interaction.velocity == (0, 0)
+    assert interaction.speed == 0
+    assert interaction.acceleration == (0, 0)
+    assert interaction.average_velocity == (0, 0)
+    assert interaction.average_speed == 0
+
+    clock.advance(0.5)
+    mbd.mock_blue_dot_moved(0,0,0.5,0)
+    assert interaction.velocity == pytest.approx((1, 0))
+    assert interaction.speed == pytest.approx(1)
+    assert interaction.acceleration == (0, 0)
+
+    clock.advance(0.5)
+    mbd.mock_blue_dot_moved(0,0,0.5,-1)
+    assert interaction.velocity == pytest.approx((0, -2))
+    assert interaction.speed == pytest.approx(2)
+    assert interaction.acceleration == pytest.approx((-2, -4))
+    assert interaction.displacement == pytest.approx((0.5, -1))
+    assert interaction.average_velocity == pytest.approx((0.5, -1))
+    assert interaction.distance == pytest.approx(1.5)
+    assert interaction.average_speed == pytest.approx(1.5)
+
+    # positions at the same time don't change the velocity
+    mbd.mock_blue_dot_released(0,0,0.5,-1)
+    assert interaction.velocity == pytest.approx((0, -2))
+
+def test_predicted_position():
+    clock = VirtualClock()
+    mbd = MockBlueDot(cols = 2, clock = clock)
+    mbd.mock_client_connected()
+    assert mbd.predicted_position() is None
+
+    mbd.mock_blue_dot_pressed(1,0,0,0)
+    # no velocity, so no change
+    clock.advance(0.05)
+    pos = mbd.predicted_position()
+    assert (pos.x, pos.y) == (0, 0)
+    assert pos.col == 1
+
+    mbd.mock_blue_dot_moved(1,0,0.1,0)
+    interaction = mbd[1,0].interaction
+    assert interaction.velocity == pytest.approx((2, 0))
+
+    # predicting the time of the last position returns it
+    assert mbd.predicted_position(interaction.current_position.time) is interaction.current_position
+
+    clock.advance(0.05)
+    pos = mbd[1,0].predicted_position()
+    assert pos.x == pytest.approx(0.2)
+    assert pos.timestamp == clock.time_ns()
+
+    # predictions are limited to the horizon
+    pos = mbd.predicted_position(interaction.current_position.time + 10, max_horizon = 0.1)
+    assert pos.x == pytest.approx(0.3)
+
+    # and the edge of the dot
+    pos = mbd.predicted_position(interaction.current_position.time + 10, max_horizon = 1)
+    assert pos.x == 1
+
+    # positions in the past are not predicted
+    assert mbd.predicted_position(0) is interaction.current_position
+
+    # acceleration is used
+    mbd.mock_blue_dot_moved(1,0,0.3,0)
+    assert interaction.velocity == pytest.approx((4, 0))
+    assert interaction.acceleration == pytest.approx((40, 0))
+    pos = mbd.predicted_position(interaction.current_position.time + 0.05)
+    assert pos.x == pytest.approx(0.3 + 4 * 0.05 + 40 * 0.05 ** 2 / 2)
+
+    # released, so the released position is returned
+    mbd.mock_blue_dot_released(1,0,0.3,0)
+    clock.advance(0.1)
+    assert mbd.predicted_position() is interaction.released_position
+    assert mbd[0,0].predicted_position() is None
+
+def test_predicted_position_wall_time():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    sleep(0.01)
+    mbd.mock_blue_dot_moved(0,0,0.1,0)
+    interaction = mbd.interaction
+    position = interaction.current_position
+
+    # the time is the same as the time of the positions
+    pos = mbd.predicted_position(position.time + 0.05)
+    vx, vy = interaction.velocity
+    ax, ay = interaction.acceleration
+    assert pos.x == pytest.approx(max(-1, min(1, 0.1 + (vx + ax * 0.05 / 2) * 0.05)), abs = 0.01)
+    assert pos.time == pytest.approx(position.time + 0.05, abs = 0.001)
+
+def test_bounded_history():
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+    mbd.resize(2,1)
+    assert mbd.max_positions is None
+    assert mbd.history_seconds is None
+
+    with pytest.raises(ValueError):
+        mbd.max_positions = 1
+
+    mbd.max_positions = 5
+    assert mbd[1,0].max_positions == 5
+
+    # swipe left to right, with lots of positions
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    for i in range(1, 100):
+        clock.advance(0.001)
+        mbd.mock_blue_dot_moved(0,0,-1 + (i * 0.02),0)
+    swiped = Event()
+    mbd.when_swiped = lambda: swiped.set()
+    mbd.mock_blue_dot_released(0,0,1,0)
+
+    interaction = mbd[0,0].interaction
+    assert len(interaction.positions) == 5
+    assert interaction.positions[0].x == -1
+    assert [p.x for p in interaction.positions[1:]] == pytest.approx([0.94, 0.96, 0.98, 1])
+    assert interaction.pressed_position.x == -1
+    assert interaction.distance == pytest.approx(2)
+    assert swiped.is_set()
+    assert BlueDotSwipe(interaction).right
+
+    # rotate with a limited time history
+    mbd.max_positions = None
+    mbd.history_seconds = 0.5
+    rotated = Event()
+    mbd.when_rotated = lambda: rotated.set()
+    mbd.mock_blue_dot_pressed(1,0,-0.1,1)
+    for i in range(10):
+        clock.advance(0.1)
+        mbd.mock_blue_dot_moved(1,0,-0.1,1)
+    assert len(mbd[1,0].interaction.positions) == 7
+    assert not rotated.is_set()
+    mbd.mock_blue_dot_moved(1,0,0.1,1)
+    assert rotated.is_set()
+
+def test_interaction_positions_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    mbd.mock_blue_dot_moved(0,0,0,0.5)
+    t, x, y = mbd[0,0].interaction.positions.as_numpy()
+    assert list(x) == [-1, 0]
+    # the interaction is still active, so more positions can be added
+    mbd.mock_blue_dot_moved(0,0,0.5,0.5)
+    mbd.mock_blue_dot_released(0,0,1,0)
+
+    t, x, y = mbd[0,0].interaction.positions.as_numpy()
+    assert list(x) == [-1, 0, 0.5, 1]
+    assert list(y) == [0, 0.5, 0.5, 0]
+    assert numpy.all(numpy.diff(t) >= 0)
+
 def test_swipe():
     mbd = MockBlueDot()
     mbd.mock_client_connected()
@@ -513,6 +765,48 @@ def test_swipe():
     swipe(mbd[1,0], 1, 0)
 
 
+def test_gestures_only_when_subscribed(monkeypatch):
+    from bluedot import BlueDotButton
+
+    calculated = []
+    for method in ("get_swipe", "get_rotation", "is_double_press"):
+        original = getattr(BlueDotButton, method)
+        def wrapper(self, *args, method=method, original=original):
+            calculated.append(method)
+            return original(self, *args)
+        monkeypatch.setattr(BlueDotButton, method, wrapper)
+
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    # nothing is interested, no gestures are worked out
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    mbd.mock_blue_dot_moved(0,0,0,1)
+    mbd.mock_blue_dot_released(0,0,1,0)
+    assert calculated == []
+
+    # the button is interested in swipes
+    mbd[0,0].when_swiped = lambda: None
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    mbd.mock_blue_dot_released(0,0,1,0)
+    assert calculated == ["get_swipe"]
+    mbd[0,0].when_swiped = None
+
+    # the blue dot is interested in rotations
+    calculated.clear()
+    mbd.when_rotated = lambda: None
+    mbd.mock_blue_dot_pressed(0,0,-0.1,1)
+    mbd.mock_blue_dot_moved(0,0,0.1,1)
+    mbd.mock_blue_dot_released(0,0,0.1,1)
+    assert calculated == ["get_rotation"]
+    mbd.when_rotated = None
+
+    # a thread is waiting for a double press
+    calculated.clear()
+    delay_function(lambda: mbd.mock_blue_dot_pressed(0,0,0,0), 0.2)
+    mbd.wait_for_double_press(1)
+    assert calculated == ["is_double_press"]
+
 def test_callback_in_class():
 
     class CallbackClass():
@@ -694,6 +988,221 @@ def test_dot_colors():
     mbd.color = "#ffffff11"
     assert mbd.color == "#ffffff11"
 
+def test_compact_objects():
+    from bluedot import BlueDotPosition
+    from bluedot.colors import Color
+
+    pos = BlueDotPosition(0, 0, 0.5, 0.5)
+    assert not hasattr(pos, "__dict__")
+    assert pos.x == 0.5 and pos.y == 0.5 and pos.top
+
+    color = Color(1, 2, 3)
+    assert not hasattr(color, "__dict__")
+    assert color.rgba == (1, 2, 3, 255)
+
+def test_color_interned():
+    from copy import deepcopy
+    from bluedot.colors import Color, BLUE, RED, parse_color
+
+    assert Color(0, 0, 255) is BLUE
+    assert parse_color("#0000ff") is BLUE
+    assert parse_color((0, 0, 255)) is BLUE
+    assert deepcopy(BLUE) is BLUE
+    assert Color(0, 0, 255, 128) is not BLUE
+    assert Color(0, 0, 255, 128) != BLUE
+
+    colors = {BLUE: "blue", RED: "red"}
+    assert colors[Color(255, 0, 0)] == "red"
+    assert hash(Color(1, 2, 3)) == hash(Color(1, 2, 3))
+
+    color = Color(1, 2, 3, 4)
+    assert color.str_rgb == "#010203"
+    assert color.str_rgba == "#01020304"
+    assert color.str_argb == "#04010203"
+    assert color.rgb == (1, 2, 3)
+
+    assert BLUE.get_adjusted_color(0.5) is Color(0, 0, 128)
+
+    mbd = MockBlueDot(cols = 2)
+    assert not mbd[0,0].modified
+    mbd[0,0].color = "red"
+    assert mbd[0,0].modified
+    mbd[0,0].color = BLUE
+    assert not mbd[0,0].modified
+
+def test_parse_color_cached():
+    from bluedot.colors import Color, BLUE, parse_color
+
+    assert parse_color(None) is None
+    assert parse_color(BLUE) is BLUE
+    assert parse_color("blue") is parse_color(" BLUE ") is BLUE
+    assert parse_color([0, 0, 255]) is BLUE
+    assert parse_color((0, 0, 255, 255)) is BLUE
+    assert parse_color(bytearray((0, 0, 255))) is BLUE
+
+    # errors are raised every time, not cached
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_color("notacolor")
+        with pytest.raises(ValueError):
+            parse_color((0, 0, 256))
+
+def test_iter_values():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    values = mbd.iter_values()
+    assert next(values) == 0
+
+    delay_function(lambda: mbd.mock_blue_dot_pressed(0,0,0,0), 0.1)
+    assert next(values) == 1
+
+    # moving doesn't change the value, so only the release is yielded
+    def move_and_release():
+        mbd.mock_blue_dot_moved(0,0,0.1,0)
+        mbd.mock_blue_dot_released(0,0,0.1,0)
+    delay_function(move_and_release, 0.1)
+    assert next(values) == 0
+
+    # at a fixed rate
+    values = mbd.iter_values(on_change = False, rate = 20)
+    start = time()
+    assert [next(values) for i in range(5)] == [0] * 5
+    assert time() - start >= 0.15
+
+def test_iter_values_stop():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    # the generator ends when the thread using it is stopped
+    values = []
+    def source():
+        for value in mbd.iter_values():
+            values.append(value)
+    t = WrapThread(target = source)
+    t.start()
+    sleep(0.1)
+    t.stop()
+    assert not t.is_alive()
+    assert values == [0]
+
+    # or when the blue dot is stopped
+    values = mbd[0,0].iter_values()
+    assert next(values) == 0
+    delay_function(mbd.stop, 0.1)
+    with pytest.raises(StopIteration):
+        next(values)
+
+def test_iter_positions():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    positions = mbd.iter_positions()
+    assert next(positions) is None
+
+    delay_function(lambda: mbd.mock_blue_dot_pressed(0,0,0,0.5), 0.1)
+    assert next(positions).y == 0.5
+
+    delay_function(lambda: mbd.mock_blue_dot_moved(0,0,0,1), 0.1)
+    assert next(positions).y == 1
+    # the button's position changes as it is moved
+    assert mbd[0,0].position is mbd.position
+    assert mbd[0,0].position.y == 1
+
+def test_iter_robot_values():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+
+    values = mbd.iter_robot_values(on_change = False)
+    assert next(values) == (0, 0)
+
+    mbd.mock_blue_dot_pressed(0,0,0,1)
+    assert next(values) == (1, 1)
+
+    mbd.mock_blue_dot_moved(0,0,0,-1)
+    assert next(values) == (-1, -1)
+
+    mbd.mock_blue_dot_moved(0,0,1,0)
+    assert next(values) == (0, -1)
+
+    mbd.mock_blue_dot_moved(0,0,-0.5,0.5)
+    assert next(values) == (0, 0.5)
+
+    mbd.mock_blue_dot_released(0,0,-0.5,0.5)
+    assert next(values) == (0, 0)
+
+def test_wait_since():
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+    assert mbd.press_seq == 0
+
+    seq = mbd.press_seq
+    # presses which happen before waiting aren't missed
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert mbd.press_seq == 2
+    assert mbd[0,0].press_seq == 2
+    assert mbd.release_seq == 1
+    assert mbd.wait_for_press(0, since = seq) == 2
+    seq += 2
+
+    # nothing has happened since
+    assert mbd.wait_for_press(0, since = seq) == 0
+
+    delay_function(lambda: mbd.mock_blue_dot_pressed(0,0,0,0), 0.1)
+    assert mbd.wait_for_press(1, since = seq) == 1
+
+    mbd.mock_blue_dot_moved(0,0,0.1,0)
+    assert mbd.move_seq == 1
+    assert mbd.wait_for_move(0, since = 0) == 1
+
+def test_wait_since_gestures():
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+
+    # nothing is handling or waiting for double presses and swipes, but
+    # reading the sequence numbers means they are counted
+    double_press_seq = mbd.double_press_seq
+    swipe_seq = mbd[0,0].swipe_seq
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    clock.advance(0.1)
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    clock.advance(1)
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    clock.advance(0.1)
+    mbd.mock_blue_dot_released(0,0,1,0)
+
+    assert mbd.wait_for_double_press(0, since = double_press_seq) == 1
+    assert mbd[0,0].wait_for_swipe(0, since = swipe_seq) == 1
+
+def test_sequenced_event():
+    from bluedot.threads import SequencedEvent
+
+    event = SequencedEvent()
+    assert event.seq == 0
+    assert event.waiting == 0
+    assert event.wait(0) == 0
+
+    event.set()
+    event.set()
+    assert event.seq == 2
+    assert event.wait(0, since = 0) == 2
+
+    delay_function(event.set, 0.1)
+    assert event.wait(1) == 1
+    assert event.waiting == 0
+
+def test_find_paired_device():
+    mbd = MockBlueDot()
+    assert mbd.adapter.find_paired_device("mock_device_2") == "02:02:02:02:02:02"
+    assert mbd.adapter.find_paired_device("01:01:01:01:01:01") == "01:01:01:01:01:01"
+    assert mbd.adapter.find_paired_device("not_paired") is None
+
 def delay_function(func, time):
     delayed_thread = Thread(target = _delayed_function, args = (func, time))
     delayed_thread.start()
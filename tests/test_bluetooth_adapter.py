@@ -1,6 +1,9 @@
 import pytest
 from bluedot.btcomm import BluetoothAdapter
 
+# bluedot can be imported without dbus, but it is needed to use an adapter
+pytest.importorskip("dbus")
+
 try:
     bta = BluetoothAdapter("hci0")
 except Exception as e:
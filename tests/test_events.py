@@ -0,0 +1,138 @@
+import pytest
+import threading
+from threading import Event
+
+from bluedot import MockBlueDot
+from bluedot.gestures import LongPressRecognizer
+from bluedot.clock import VirtualClock
+
+def test_subscribe_unsubscribe():
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+    calls = []
+
+    sub1 = mbd.subscribe("pressed", lambda pos: calls.append(("sub1", pos.x)))
+    sub2 = mbd.subscribe("pressed", lambda: calls.append(("sub2", )))
+    assert sub1.kind == "pressed"
+    assert sub1.active
+
+    mbd.mock_blue_dot_pressed(0,0,0.5,0)
+    assert calls == [("sub1", 0.5), ("sub2", )]
+
+    calls.clear()
+    sub1.unsubscribe()
+    assert not sub1.active
+    # unsubscribing twice does nothing
+    mbd.unsubscribe(sub1)
+    mbd.mock_blue_dot_pressed(0,0,0.5,0)
+    assert calls == [("sub2", )]
+
+    mbd.unsubscribe(sub2)
+    mbd.mock_blue_dot_pressed(0,0,0.5,0)
+    assert calls == [("sub2", )]
+
+    with pytest.raises(ValueError):
+        mbd.subscribe("pushed", lambda: None)
+
+def test_subscribe_buttons():
+    mbd = MockBlueDot(print_messages = False, cols = 3)
+    mbd.mock_client_connected()
+    calls = []
+
+    mbd.subscribe("released", lambda pos: calls.append(("one", pos.col)), button = (1,0))
+    mbd.subscribe("released", lambda pos: calls.append(("two", pos.col)), button = [mbd[0,0], (2,0), (2,0)])
+
+    for col in range(3):
+        mbd.mock_blue_dot_pressed(col,0,0,0)
+        mbd.mock_blue_dot_released(col,0,0,0)
+    assert calls == [("two", 0), ("one", 1), ("two", 2)]
+
+def test_subscribe_button_range():
+    mbd = MockBlueDot(print_messages = False, cols = 3, rows = 2)
+    mbd.mock_client_connected()
+    calls = []
+
+    mbd.subscribe("pressed", lambda pos: calls.append((pos.col, pos.row)), button = mbd[1:, :])
+
+    for button in mbd.buttons:
+        mbd.mock_blue_dot_pressed(button.col,button.row,0,0)
+        mbd.mock_blue_dot_released(button.col,button.row,0,0)
+    assert calls == [(1, 0), (1, 1), (2, 0), (2, 1)]
+
+def test_subscribe_filters():
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+    calls = []
+
+    mbd.subscribe("pressed", lambda: calls.append("top"), filter = "top")
+    mbd.subscribe("pressed", lambda: calls.append("side"), filter = ["left", "right"])
+    mbd.subscribe("pressed", lambda pos: calls.append("far"), filter = lambda pos: pos.distance > 0.9)
+
+    mbd.mock_blue_dot_pressed(0,0,0,1)
+    assert calls == ["top", "far"]
+
+    calls.clear()
+    mbd.mock_blue_dot_pressed(0,0,-0.8,0)
+    assert calls == ["side"]
+
+    calls.clear()
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert calls == []
+
+def test_subscribe_swipes_and_gestures():
+    clock = VirtualClock()
+    mbd = MockBlueDot(clock = clock)
+    mbd.mock_client_connected()
+    calls = []
+
+    mbd.subscribe("swiped", lambda swipe: calls.append(swipe.direction), filter = "right")
+    mbd.subscribe("rotated", lambda rotation: calls.append(rotation.value))
+    mbd.subscribe("gesture", lambda gesture: calls.append(gesture.name))
+    mbd.add_gesture(LongPressRecognizer(min_duration = 1))
+
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    clock.advance(0.1)
+    mbd.mock_blue_dot_released(0,0,1,0)
+    assert calls == ["right"]
+
+    calls.clear()
+    mbd.mock_blue_dot_pressed(0,0,-0.1,1)
+    mbd.mock_blue_dot_moved(0,0,0.1,1)
+    clock.advance(1)
+    mbd.mock_blue_dot_released(0,0,0.1,1)
+    assert calls == [1, "long_press"]
+
+def test_subscribe_background():
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+    event = Event()
+
+    mbd.subscribe("pressed", event.set, background = True)
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert event.wait(1)
+
+def test_subscriber_errors(capsys):
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+    calls = []
+
+    def fail():
+        raise RuntimeError("failed")
+
+    # errors are reported and don't stop the other handlers
+    mbd.subscribe("pressed", fail)
+    mbd.subscribe("pressed", lambda: calls.append(1))
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert calls == [1]
+    assert "RuntimeError: failed" in capsys.readouterr().err
+
+def test_subscriber_calling_thread():
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+    threads = []
+
+    mbd.subscribe("pressed", lambda: threads.append(threading.current_thread()))
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    # handlers which aren't in the background are called straight away on
+    # the thread which received the data
+    assert threads == [threading.current_thread()]
@@ -0,0 +1,89 @@
+import pytest
+
+from bluedot import MockBlueDot
+from bluedot.clock import VirtualClock
+from bluedot.filters import PositionFilter, ExponentialFilter, OneEuroFilter, DeadZoneFilter
+
+def test_position_filter_abstract():
+    with pytest.raises(TypeError):
+        PositionFilter()
+
+    class PassThroughFilter(PositionFilter):
+        def __call__(self, x, y, t):
+            return x, y
+
+    assert PassThroughFilter()(0.5, 0.5, 0) == (0.5, 0.5)
+
+def test_exponential_filter():
+    f = ExponentialFilter(0.5)
+    assert f(1, 0, 0) == (1, 0)
+    assert f(0, 1, 0.1) == (0.5, 0.5)
+    assert f(0, 1, 0.2) == (0.25, 0.75)
+    f.reset()
+    assert f(0, 0, 0.3) == (0, 0)
+
+    with pytest.raises(ValueError):
+        ExponentialFilter(0)
+
+def test_one_euro_filter():
+    f = OneEuroFilter(min_cutoff = 1, beta = 0)
+    assert f(0, 0, 0) == (0, 0)
+
+    # jitter is smoothed out
+    x, y = f(0.1, 0, 0.01)
+    assert 0 < x < 0.01
+
+    # the same time doesn't change the position
+    assert f(1, 1, 0.01) == (x, y)
+
+    # a fast movement with a high beta follows the finger closely
+    slow = OneEuroFilter(beta = 0)
+    fast = OneEuroFilter(beta = 10)
+    for f in (slow, fast):
+        f(0, 0, 0)
+        f(0.5, 0, 0.01)
+    assert fast(1, 0, 0.02)[0] > slow(1, 0, 0.02)[0]
+
+def test_dead_zone_filter():
+    f = DeadZoneFilter(0.5)
+    assert f(0.2, 0.2, 0) == (0, 0)
+    assert f(1, 0, 0) == (1, 0)
+    assert f(0, -0.75, 0) == pytest.approx((0, -0.5))
+
+    f = DeadZoneFilter(0.5, rescale = False)
+    assert f(0, -0.75, 0) == (0, -0.75)
+
+def test_blue_dot_filters():
+    clock = VirtualClock()
+    mbd = MockBlueDot(cols = 2, clock = clock)
+    mbd.mock_client_connected()
+
+    moves = []
+    mbd.when_moved = lambda pos: moves.append((pos.x, pos.y))
+
+    mbd.filters = [ExponentialFilter(0.5)]
+    assert len(mbd[0,0].filters) == 1
+    # each button has its own filter
+    assert mbd[0,0].filters[0] is not mbd[1,0].filters[0]
+    assert mbd[0,0].filters[0] is not mbd.filters[0]
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    clock.advance(0.1)
+    mbd.mock_blue_dot_moved(0,0,1,0)
+    assert moves == [(0.5, 0)]
+    assert mbd.position.x == 0.5
+    assert mbd[0,0].interaction.current_position.x == 0.5
+    assert mbd[0,0].interaction.current_position.timestamp == clock.time_ns()
+    mbd.mock_blue_dot_released(0,0,1,0)
+    assert mbd.position.x == 0.75
+
+    # pressing again resets the filter
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    assert mbd.position.x == -1
+
+    # new buttons get the filters
+    mbd.resize(3, 1)
+    assert len(mbd[2,0].filters) == 1
+
+    mbd.filters = None
+    assert mbd[0,0].filters == ()
@@ -0,0 +1,269 @@
+import pytest
+from math import cos, pi, sin
+
+from bluedot import MockBlueDot, BlueDotSwipe, BlueDotRotation
+from bluedot.clock import VirtualClock
+from bluedot.gestures import (
+    GestureRecognizer,
+    SwipeRecognizer,
+    RotationRecognizer,
+    LongPressRecognizer,
+    TapRecognizer,
+    ChordRecognizer,
+    )
+
+def test_add_remove_gesture():
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    assert mbd.gestures == ()
+
+    swipe = mbd.add_gesture(SwipeRecognizer())
+    assert mbd.gestures == (swipe, )
+
+    mbd.remove_gesture(swipe)
+    assert mbd.gestures == ()
+    mbd.mock_blue_dot_pressed(0,0,-1,0)
+    mbd.mock_blue_dot_released(0,0,1,0)
+    assert gestures == []
+
+def test_only_overridden_methods_called():
+    calls = []
+
+    class ReleaseRecognizer(GestureRecognizer):
+        name = "release"
+        def released(self, button, position):
+            calls.append(position)
+
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    mbd.add_gesture(ReleaseRecognizer())
+    assert mbd._gestures._handlers["pressed"] == []
+    assert mbd._gestures._handlers["moved"] == []
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_moved(0,0,0.1,0)
+    mbd.mock_blue_dot_released(0,0,0.2,0)
+    assert len(calls) == 1
+    assert gestures == []
+
+def test_recognizers_see_every_event():
+    calls = []
+
+    class ReleaseRecognizer(GestureRecognizer):
+        name = "release"
+        def released(self, button, position):
+            calls.append(position)
+            return True
+
+    mbd = MockBlueDot(print_messages = False)
+    mbd.mock_client_connected()
+    mbd.add_gesture(ReleaseRecognizer())
+
+    # nothing is listening, the recognizer still sees the events
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    assert len(calls) == 1
+
+    gestures = []
+    mbd[0,0].when_gesture = lambda g: gestures.append(g)
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    assert len(calls) == 2
+    assert len(gestures) == 1
+
+def test_swipe_and_rotation():
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    mbd.add_gesture(SwipeRecognizer())
+    mbd.add_gesture(RotationRecognizer(name = "wheel"))
+
+    mbd.mock_blue_dot_pressed(0,0,-0.1,1)
+    mbd.mock_blue_dot_moved(0,0,0.1,1)
+    clock.advance(0.1)
+    mbd.mock_blue_dot_released(0,0,1,-1)
+
+    assert [g.name for g in gestures] == ["wheel", "swipe"]
+    assert isinstance(gestures[0].value, BlueDotRotation)
+    assert gestures[0].value.clockwise
+    assert isinstance(gestures[1].value, BlueDotSwipe)
+    assert gestures[1].col == 0 and gestures[1].row == 0
+
+def test_long_press():
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    mbd.add_gesture(LongPressRecognizer(min_duration = 1))
+
+    # too short
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    clock.advance(0.5)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    assert gestures == []
+
+    # moved too far
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    clock.advance(1)
+    mbd.mock_blue_dot_released(0,0,0.5,0)
+    assert gestures == []
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    clock.advance(1.5)
+    mbd.mock_blue_dot_released(0,0,0.1,0)
+    assert len(gestures) == 1
+    assert gestures[0].name == "long_press"
+    assert gestures[0].value == 1.5
+
+def test_taps():
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock, cols = 2)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    button_gestures = []
+    mbd[1,0].when_gesture = lambda g: button_gestures.append(g)
+    mbd.add_gesture(TapRecognizer(taps = 3, interval = 0.3))
+
+    def tap(col, gap = 0.1):
+        clock.advance(gap)
+        mbd.mock_blue_dot_pressed(col,0,0,0)
+        clock.advance(0.05)
+        mbd.mock_blue_dot_released(col,0,0,0)
+
+    tap(0)
+    tap(0)
+    assert gestures == []
+    tap(0)
+    assert len(gestures) == 1
+    assert gestures[0].value == 3
+    assert button_gestures == []
+
+    # too slow
+    tap(1)
+    tap(1)
+    tap(1, gap = 1)
+    assert len(gestures) == 1
+    tap(1)
+    tap(1)
+    assert len(gestures) == 2
+    assert gestures[1].col == 1
+    assert len(button_gestures) == 1
+
+def test_chord():
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock, cols = 3)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    mbd.add_gesture(ChordRecognizer([(0,0), (2,0)]))
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_pressed(1,0,0,0)
+    assert gestures == []
+    mbd.mock_blue_dot_pressed(2,0,0,0)
+    assert len(gestures) == 1
+    assert gestures[0].name == "chord"
+    assert gestures[0].value == ((0,0), (2,0))
+
+    mbd.mock_blue_dot_released(0,0,0,0)
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert len(gestures) == 2
+
+def test_chord_one_button_listening():
+    mbd = MockBlueDot(print_messages = False, cols = 2)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd[0,0].when_gesture = lambda g: gestures.append(g)
+    mbd.add_gesture(ChordRecognizer([(0,0), (1,0)]))
+
+    # the press of the button without a handler is still part of the chord
+    mbd.mock_blue_dot_pressed(1,0,0,0)
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    assert len(gestures) == 1
+    assert gestures[0].value == ((0,0), (1,0))
+
+    # releases are seen while nothing is listening, so a stale press
+    # doesn't complete a later chord
+    mbd[0,0].when_gesture = None
+    mbd.mock_blue_dot_released(0,0,0,0)
+    mbd.mock_blue_dot_released(1,0,0,0)
+    mbd[0,0].when_gesture = lambda g: gestures.append(g)
+    mbd[1,0].when_gesture = lambda g: gestures.append(g)
+    mbd.mock_blue_dot_pressed(1,0,0,0)
+    assert len(gestures) == 1
+
+def test_resample_and_normalize_path():
+    from bluedot.gestures import resample_path, normalize_path
+
+    points = resample_path([(0, 0), (1, 0)], 5)
+    assert points == [(0, 0), (0.25, 0), (0.5, 0), (0.75, 0), (1, 0)]
+
+    vector = normalize_path([(0, 0), (2, 0), (2, 2)], 16)
+    assert len(vector) == 32
+    assert sum(v * v for v in vector) == pytest.approx(1)
+    assert normalize_path([(0.5, 0.5), (0.5, 0.5)]) is None
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_path_recognizer(use_numpy):
+    from bluedot.gestures import PathRecognizer, TEMPLATES
+    if use_numpy:
+        pytest.importorskip("numpy")
+
+    clock = VirtualClock()
+    mbd = MockBlueDot(print_messages = False, clock = clock)
+    mbd.mock_client_connected()
+    gestures = []
+    mbd.when_gesture = lambda g: gestures.append(g)
+    paths = mbd.add_gesture(PathRecognizer(use_numpy = use_numpy))
+    assert paths.templates == list(TEMPLATES)
+
+    # draw a small clockwise circle, starting at the top
+    mbd.mock_blue_dot_pressed(0,0,0,0.5)
+    for i in range(1, 40):
+        angle = 2 * pi * i / 40
+        mbd.mock_blue_dot_moved(0,0,0.5 * sin(angle),0.5 * cos(angle))
+    mbd.mock_blue_dot_released(0,0,0,0.5)
+
+    assert len(gestures) == 1
+    assert gestures[0].name == "path"
+    assert gestures[0].value.name == "circle"
+    assert gestures[0].value.score > 0.95
+
+    # a press isn't a path
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_released(0,0,0,0)
+    assert len(gestures) == 1
+
+    # a zigzag, drawn at a different size
+    assert paths.recognize([(-0.5, 0.5), (0.5, 0.5), (-0.5, -0.5), (0.5, -0.5)]).name == "zigzag"
+
+    # an upside down triangle only matches if rotation doesn't matter
+    upside_down = [(0, -1), (-0.87, 0.5), (0.87, 0.5), (0, -1)]
+    assert paths.recognize(upside_down) is None
+    paths.rotation_invariant = True
+    assert paths.recognize(upside_down).name == "triangle"
+
+def test_path_recognizer_custom_templates():
+    from bluedot.gestures import PathRecognizer
+
+    paths = PathRecognizer(templates = {}, use_numpy = False)
+    assert paths.recognize([(0, 0), (1, 1)]) is None
+
+    paths.add_template("L", [(0, 1), (0, 0), (0.5, 0)])
+    assert paths.templates == ["L"]
+    match = paths.recognize([(0, 0.25), (0, -0.25), (0.25, -0.25)])
+    assert match.name == "L"
+    assert match.score == pytest.approx(1)
+
+    with pytest.raises(ValueError):
+        paths.add_template("dot", [(0, 0), (0, 0)])
@@ -0,0 +1,82 @@
+import pytest
+
+from bluedot.exceptions import ButtonDoesNotExist
+from bluedot.grid import ButtonGridView
+
+def test_grid_lookup(mock_blue_dot):
+    mbd, sent = mock_blue_dot(cols = 3, rows = 2)
+    assert len(mbd.buttons) == 6
+    # column by column, as they always have been
+    assert [(b.col, b.row) for b in mbd.buttons] == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert (mbd[2,1].col, mbd[2,1].row) == (2, 1)
+
+    for key in ((3, 0), (0, 2), (-1, 0), (0, -1), (0, ), 1):
+        with pytest.raises(ButtonDoesNotExist):
+            mbd[key]
+
+def test_grid_lookup_numpy(mock_blue_dot):
+    numpy = pytest.importorskip("numpy")
+    mbd, sent = mock_blue_dot(cols = 3, rows = 2)
+
+    # numpy integers can be used like ints
+    col, row = numpy.int64(2), numpy.int64(1)
+    assert mbd[col, row] is mbd[2, 1]
+    assert [(b.col, b.row) for b in mbd[col, :]] == [(2, 0), (2, 1)]
+    with pytest.raises(ButtonDoesNotExist):
+        mbd[numpy.int64(3), row]
+
+def test_grid_views(mock_blue_dot):
+    mbd, sent = mock_blue_dot(cols = 3, rows = 3)
+
+    row = mbd[:, 1]
+    assert isinstance(row, ButtonGridView)
+    assert [(b.col, b.row) for b in row] == [(0, 1), (1, 1), (2, 1)]
+    col = mbd[2, :]
+    assert [(b.col, b.row) for b in col] == [(2, 0), (2, 1), (2, 2)]
+    block = mbd[0:2, 1:3]
+    assert len(block) == 4
+    assert block[3] is mbd[1,2]
+    assert len(mbd[::2, ::2]) == 4
+
+    with pytest.raises(ButtonDoesNotExist):
+        mbd[3, :]
+
+    # changes are sent in one message
+    row.color = "red"
+    assert row.color == ("red", "red", "red")
+    assert mbd[1,0].color == "blue"
+    assert len(sent) == 1 and sent[0].count("5,") == 3
+
+    col.square = True
+    assert col.square == (True, True, True)
+    assert len(sent) == 2
+
+def test_grid_modified(mock_blue_dot):
+    mbd, sent = mock_blue_dot(cols = 3, rows = 3)
+    assert mbd._buttons.modified == ()
+
+    mbd[1,1].color = "red"
+    mbd[2,0].border = True
+    assert mbd._buttons.modified == (mbd[2,0], mbd[1,1])
+
+    mbd[2,0].border = False
+    assert mbd._buttons.modified == (mbd[1,1], )
+
+    # changing the blue dot changes which buttons are modified
+    mbd.color = "red"
+    assert mbd._buttons.modified == ()
+    mbd.square = True
+    mbd[0,0].square = False
+    assert mbd._buttons.modified == (mbd[0,0], )
+
+    # only the modified buttons are sent when a client connects
+    del sent[:]
+    mbd._send_bluedot_config()
+    assert sent[1] == mbd[0,0]._build_config_msg()
+
+    # buttons removed by resizing are no longer modified
+    mbd.resize(1, 1)
+    assert mbd._buttons.modified == (mbd[0,0], )
+    mbd[0,0].square = True
+    mbd.resize(2, 2)
+    assert mbd._buttons.modified == ()
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def imported_after(statement):
+    # the modules imported after running statement in a new interpreter, how
+    # long they take is measured by benchmarks/bench_import.py
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (ROOT, env.get("PYTHONPATH")) if p)
+    result = subprocess.run(
+        [sys.executable, "-c", statement + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    return set(result.stdout.splitlines())
+
+def test_import_is_lazy():
+    modules = imported_after("import bluedot")
+    assert "bluedot" in modules
+    # dbus is only needed once a bluetooth adapter is used
+    assert not any(name == "dbus" or name.startswith("dbus.") for name in modules)
+    # the named colors are only created when one is used
+    assert "bluedot._colortable" not in modules
+
+def test_colors_load_on_use():
+    assert "bluedot._colortable" in imported_after("import bluedot; bluedot.COLORS")
+    assert "bluedot._colortable" in imported_after("from bluedot.colors import RED")
+
+def test_colors_star_import():
+    namespace = {}
+    exec("from bluedot.colors import *", namespace)
+    assert "RED" in namespace
+    assert "BLUE" in namespace
+    assert "COLORS" in namespace
+    assert "Color" in namespace and "parse_color" in namespace
+
+    import bluedot.colors
+    assert "RED" in dir(bluedot.colors)
+
+def test_bluedot_star_import():
+    namespace = {}
+    exec("from bluedot import *", namespace)
+    assert "COLORS" in namespace
+    assert namespace["COLORS"]["red"] == "red"
+    assert "BlueDot" in namespace and "MockBlueDot" in namespace
@@ -0,0 +1,76 @@
+import pytest
+
+from bluedot.colors import Color
+from bluedot.palette import color_grid, gradient_grid
+
+def test_color_grid():
+    values = [[(0, 0, 0), "red", "#0000ff"], [Color(1, 2, 3), (4, 5, 6, 7), "white"]]
+    grid = color_grid(values, 3, 2)
+    assert grid[0] == [Color(0, 0, 0), Color(255, 0, 0), Color(0, 0, 255)]
+    assert grid[1] == [Color(1, 2, 3), Color(4, 5, 6, 7), Color(255, 255, 255)]
+
+    grid = color_grid(lambda col, row: (col, row, 0), 3, 2)
+    assert grid[1][2] is Color(2, 1, 0)
+
+    with pytest.raises(ValueError):
+        color_grid(values, 2, 2)
+
+def test_color_grid_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    values = numpy.zeros((2, 3, 3))
+    values[..., 0] = 255
+    values[1, 2] = (0.4, 127.5, 128.5)
+    grid = color_grid(values, 3, 2)
+    assert grid[0][0] is Color(255, 0, 0)
+    # truncated, like Color
+    assert grid[1][2] is Color(0, 127, 128)
+    assert grid == color_grid(values.tolist(), 3, 2, use_numpy = False)
+
+    values = numpy.full((2, 3, 4), 10)
+    assert color_grid(values, 3, 2)[1][1] is Color(10, 10, 10, 10)
+
+    with pytest.raises(ValueError):
+        color_grid(values, 2, 3)
+    with pytest.raises(ValueError):
+        color_grid(values + 250, 3, 2)
+
+def test_gradient_grid():
+    grid = gradient_grid("black", "white", 3, 2, use_numpy = False)
+    assert grid[0] == grid[1] == [Color(0, 0, 0), Color(128, 128, 128), Color(255, 255, 255)]
+
+    grid = gradient_grid("black", "white", 3, 3, "radial", use_numpy = False)
+    assert grid[1][1] is Color(0, 0, 0)
+    assert grid[0][0] is grid[2][2] is Color(255, 255, 255)
+
+    with pytest.raises(ValueError):
+        gradient_grid("black", "white", 3, 2, "sideways")
+
+def test_gradient_grid_numpy():
+    pytest.importorskip("numpy")
+
+    for direction in ("horizontal", "vertical", "diagonal", "radial"):
+        for cols, rows in ((1, 1), (4, 3), (7, 5)):
+            assert (gradient_grid("red", (0, 0, 255, 0), cols, rows, direction) ==
+                gradient_grid("red", (0, 0, 255, 0), cols, rows, direction, use_numpy = False))
+
+def test_set_colors(mock_blue_dot):
+    mbd, sent = mock_blue_dot(cols = 3, rows = 2)
+
+    mbd.set_colors([["red", "red", "green"], ["blue", "blue", "blue"]])
+    assert mbd[0,0].color == "red"
+    assert mbd[2,0].color == "green"
+    # only the changed buttons are sent, in one message
+    assert len(sent) == 1
+    assert sent[0].count("5,") == 3
+
+    mbd.fill_gradient("black", "white", direction = "vertical")
+    assert mbd[1,0].color == "black"
+    assert mbd[1,1].color == "white"
+    assert len(sent) == 2
+
+    # animations are stopped
+    animation = mbd[0,0].animate("black", "white", repeat = True)
+    mbd.set_colors(lambda col, row: "yellow")
+    assert animation.done
+    assert all(button.color == "yellow" for button in mbd.buttons)
@@ -0,0 +1,60 @@
+import pytest
+
+from bluedot import MockBlueDot, BlueDotPosition
+from bluedot.regions import RegionMap
+
+def test_position_region():
+    for x, y, region in (
+        (0, 0, "middle"),
+        (0.5, 0, "middle"),
+        (0, 1, "top"),
+        (0.7, 0.7, "top"),
+        (1, 0, "right"),
+        (0.7, -0.7, "right"),
+        (0, -1, "bottom"),
+        (-0.7, -0.7, "bottom"),
+        (-1, 0, "left"),
+        (-0.7, 0.7, "left")):
+        pos = BlueDotPosition(0, 0, x, y)
+        assert pos.region == region
+        for name in ("middle", "top", "right", "bottom", "left"):
+            assert getattr(pos, name) == (name == region)
+
+def test_region_map():
+    regions = RegionMap(sectors = 8, rings = (0.3, 0.6))
+    assert regions.sectors == 8
+    assert regions.rings == (0.3, 0.6)
+
+    assert regions.region(BlueDotPosition(0, 0, 0, 0)) == (0, 0)
+    assert regions.region(BlueDotPosition(0, 0, 0, 0.5)) == (1, 0)
+    assert regions.region(BlueDotPosition(0, 0, 0.7, 0.7)) == (2, 1)
+    assert regions.region(BlueDotPosition(0, 0, -1, 0)) == (2, 6)
+    assert regions.region(BlueDotPosition(0, 0, -0.1, 1)) == (2, 0)
+
+    with pytest.raises(ValueError):
+        RegionMap(sectors = 0)
+    with pytest.raises(ValueError):
+        RegionMap(rings = (0.6, 0.3))
+
+def test_region_map_dispatch():
+    calls = []
+
+    dpad = RegionMap()
+    dpad[0] = lambda: calls.append("fire")
+    dpad[1] = lambda pos: calls.append("ring")
+    dpad[1, 0] = lambda pos: calls.append(("up", pos.y))
+    assert dpad[0] is not None
+
+    mbd = MockBlueDot()
+    mbd.mock_client_connected()
+    mbd.when_pressed = dpad
+
+    mbd.mock_blue_dot_pressed(0,0,0,0)
+    mbd.mock_blue_dot_pressed(0,0,0,1)
+    mbd.mock_blue_dot_pressed(0,0,1,0)
+    assert calls == ["fire", ("up", 1), "ring"]
+
+    calls.clear()
+    del dpad[1]
+    mbd.mock_blue_dot_pressed(0,0,1,0)
+    assert calls == []
@@ -0,0 +1,228 @@
+import pytest
+
+from bluedot.utils import AdapterProperties
+
+def test_adapter_properties(fake_bus):
+    fake_bus.add_adapter("/org/bluez/hci0", "00:11:22:33:44:55", Powered = False, Discoverable = False)
+
+    receivers = len(fake_bus.receivers)
+    properties = AdapterProperties("hci0")
+    assert properties.path == "/org/bluez/hci0"
+    assert properties.cached
+
+    # properties are read from the cache
+    del fake_bus.calls[:]
+    assert properties.get("Address") == "00:11:22:33:44:55"
+    assert properties.get("Powered") is False
+    assert fake_bus.calls == []
+
+    # setting a property updates the cache straight away
+    properties.set("Powered", True)
+    assert fake_bus.calls == ["Set"]
+    assert properties.get("Powered") is True
+
+    # and changes made elsewhere are received
+    fake_bus.change_properties("/org/bluez/hci0", "org.bluez.Adapter1", {"Discoverable": True})
+    assert properties.get("Discoverable") is True
+    assert fake_bus.calls == ["Set"]
+
+    properties.close()
+    assert not properties.cached
+    assert len(fake_bus.receivers) == receivers
+
+def test_adapter_properties_invalidated(fake_bus):
+    fake_bus.add_adapter("/org/bluez/hci0", "00:11:22:33:44:55", Powered = True)
+    fake_bus.add_adapter("/org/bluez/hci1", "00:11:22:33:44:66", Powered = True)
+    properties = AdapterProperties("hci0")
+
+    # other adapters don't affect the cache
+    fake_bus.remove_adapter("/org/bluez/hci1")
+    assert properties.cached
+
+    # the adapter is unplugged, so the cache isn't used
+    fake_bus.remove_adapter("/org/bluez/hci0")
+    assert not properties.cached
+
+    # and plugged back in, the cache is used again with the new properties
+    fake_bus.add_adapter("/org/bluez/hci0", "00:11:22:33:44:55", Powered = False)
+    assert properties.cached
+    del fake_bus.calls[:]
+    assert properties.get("Powered") is False
+    assert fake_bus.calls == []
+
+    # a closed cache isn't started again
+    properties.close()
+    fake_bus.remove_adapter("/org/bluez/hci0")
+    fake_bus.add_adapter("/org/bluez/hci0", "00:11:22:33:44:55")
+    assert not properties.cached
+
+def test_adapter_properties_without_signals(fake_bus, monkeypatch):
+    from bluedot import utils
+
+    fake_bus.add_adapter("/org/bluez/hci0", "00:11:22:33:44:55", Powered = True)
+    monkeypatch.setattr(utils, "_signal_bus", False)
+
+    properties = AdapterProperties("hci0")
+    assert not properties.cached
+    del fake_bus.calls[:]
+    assert properties.get("Powered") is True
+    assert fake_bus.calls == ["Get"]
+
+def test_find_adapter_path_cached(fake_bus):
+    from bluedot.utils import find_adapter_path
+
+    for adapter in range(4):
+        fake_bus.add_adapter("/org/bluez/hci{}".format(adapter), "00:00:00:00:00:0{}".format(adapter))
+        for device in range(250):
+            fake_bus.add_device(
+                "/org/bluez/hci{}/dev_{}".format(adapter, device),
+                "/org/bluez/hci{}".format(adapter),
+                "11:11:11:11:{:02X}:{:02X}".format(adapter, device),
+                "device {}".format(device))
+
+    del fake_bus.calls[:]
+    assert find_adapter_path() == "/org/bluez/hci0"
+    assert find_adapter_path("hci2") == "/org/bluez/hci2"
+    assert find_adapter_path("00:00:00:00:00:03") == "/org/bluez/hci3"
+    # the managed objects are only read once
+    assert fake_bus.calls == ["GetManagedObjects"]
+
+    # adding a device doesn't clear the cache
+    fake_bus.add_device("/org/bluez/hci0/dev_new", "/org/bluez/hci0", "22:22:22:22:22:22", "new")
+    assert find_adapter_path("hci1") == "/org/bluez/hci1"
+    assert fake_bus.calls == ["GetManagedObjects"]
+
+    # removing an adapter does
+    fake_bus.remove_adapter("/org/bluez/hci2")
+    with pytest.raises(Exception):
+        find_adapter_path("hci2")
+    assert find_adapter_path("hci3") == "/org/bluez/hci3"
+    assert fake_bus.calls == ["GetManagedObjects"] * 2
+
+    fake_bus.add_adapter("/org/bluez/hci2", "00:00:00:00:00:02")
+    assert find_adapter_path("hci2") == "/org/bluez/hci2"
+    assert fake_bus.calls == ["GetManagedObjects"] * 3
+
+def test_find_adapter_path_changed_while_reading(fake_bus, monkeypatch):
+    from bluedot import utils
+    from bluedot.utils import find_adapter_path
+
+    fake_bus.add_adapter("/org/bluez/hci0", "00:00:00:00:00:00")
+    get_managed_objects = utils.get_managed_objects
+
+    def removed_while_reading():
+        # the adapter is removed after bluez replied, but before the reply
+        # is cached
+        objects = get_managed_objects()
+        fake_bus.remove_adapter("/org/bluez/hci0")
+        return objects
+
+    monkeypatch.setattr(utils, "get_managed_objects", removed_while_reading)
+    assert find_adapter_path("hci0") == "/org/bluez/hci0"
+    monkeypatch.setattr(utils, "get_managed_objects", get_managed_objects)
+
+    # the stale list wasn't cached, so the removed adapter isn't found
+    with pytest.raises(Exception):
+        find_adapter_path("hci0")
+
+def test_device_registry(fake_bus):
+    from bluedot.utils import DeviceRegistry
+
+    fake_bus.add_adapter("/org/bluez/hci0", "00:00:00:00:00:00")
+    fake_bus.add_adapter("/org/bluez/hci1", "00:00:00:00:00:01")
+    fake_bus.add_device("/org/bluez/hci0/dev_1", "/org/bluez/hci0", "11:11:11:11:11:11", "phone")
+    fake_bus.add_device("/org/bluez/hci0/dev_2", "/org/bluez/hci0", "22:22:22:22:22:22", "tablet", paired = False)
+    fake_bus.add_device("/org/bluez/hci1/dev_3", "/org/bluez/hci1", "33:33:33:33:33:33", "laptop")
+
+    registry = DeviceRegistry("hci0")
+    assert registry.watching
+
+    # only the paired devices of the adapter are found, without D-Bus calls
+    del fake_bus.calls[:]
+    assert registry.paired_devices == [("11:11:11:11:11:11", "phone")]
+    assert registry.find("11:11:11:11:11:11") == "11:11:11:11:11:11"
+    assert registry.find("phone") == "11:11:11:11:11:11"
+    assert registry.find("tablet") is None
+    assert registry.find("laptop") is None
+    assert fake_bus.calls == []
+
+    # pairing
+    fake_bus.change_properties("/org/bluez/hci0/dev_2", "org.bluez.Device1", {"Paired": True})
+    assert registry.find("tablet") == "22:22:22:22:22:22"
+
+    # renaming
+    fake_bus.change_properties("/org/bluez/hci0/dev_1", "org.bluez.Device1", {"Alias": "old phone"})
+    assert registry.find("phone") is None
+    assert registry.find("old phone") == "11:11:11:11:11:11"
+    assert registry.find("11:11:11:11:11:11") == "11:11:11:11:11:11"
+
+    # adding and removing
+    fake_bus.add_device("/org/bluez/hci0/dev_4", "/org/bluez/hci0", "44:44:44:44:44:44", "watch")
+    assert registry.find("watch") == "44:44:44:44:44:44"
+    fake_bus.remove_device("/org/bluez/hci0/dev_4")
+    assert registry.find("watch") is None
+    assert registry.find("44:44:44:44:44:44") is None
+    assert fake_bus.calls == []
+
+    registry.close()
+    assert not registry.watching
+
+def test_device_registry_duplicate_aliases(fake_bus):
+    from bluedot.utils import DeviceRegistry
+
+    fake_bus.add_adapter("/org/bluez/hci0", "00:00:00:00:00:00")
+    fake_bus.add_device("/org/bluez/hci0/dev_1", "/org/bluez/hci0", "11:11:11:11:11:11", "pi")
+    fake_bus.add_device("/org/bluez/hci0/dev_2", "/org/bluez/hci0", "22:22:22:22:22:22", "pi")
+    registry = DeviceRegistry("hci0")
+
+    assert sorted(registry.paired_devices) == [("11:11:11:11:11:11", "pi"), ("22:22:22:22:22:22", "pi")]
+    assert registry.find("pi") in ("11:11:11:11:11:11", "22:22:22:22:22:22")
+
+    # removing one of them leaves the other
+    fake_bus.remove_device("/org/bluez/hci0/dev_1")
+    assert registry.find("pi") == "22:22:22:22:22:22"
+
+    # renaming the other one leaves none
+    fake_bus.change_properties("/org/bluez/hci0/dev_2", "org.bluez.Device1", {"Alias": "pi 2"})
+    assert registry.find("pi") is None
+    assert registry.find("pi 2") == "22:22:22:22:22:22"
+
+def test_device_registry_without_signals(fake_bus, monkeypatch):
+    from bluedot import utils
+    from bluedot.utils import DeviceRegistry
+
+    fake_bus.add_adapter("/org/bluez/hci0", "00:00:00:00:00:00")
+    monkeypatch.setattr(utils, "_signal_bus", False)
+    registry = DeviceRegistry("hci0")
+    assert not registry.watching
+
+    # the devices are read each time
+    fake_bus.add_device("/org/bluez/hci0/dev_1", "/org/bluez/hci0", "11:11:11:11:11:11", "phone")
+    assert registry.find("phone") == "11:11:11:11:11:11"
+
+def test_bluetooth_adapter_close(fake_bus):
+    from bluedot.btcomm import BluetoothAdapter, BluetoothServer
+
+    fake_bus.add_adapter("/org/bluez/hci0", "00:11:22:33:44:55", Powered = True)
+    receivers = len(fake_bus.receivers)
+
+    adapter = BluetoothAdapter("hci0")
+    assert adapter.address == "00:11:22:33:44:55"
+    assert adapter.paired_devices == []
+    assert len(fake_bus.receivers) > receivers
+
+    # closing the adapter removes the receivers of its properties and
+    # devices, so the bus doesn't keep it
+    adapter.close()
+    assert len(fake_bus.receivers) == receivers
+
+    # it can still be used, the cache is created again
+    assert adapter.powered is True
+    adapter.close()
+    assert len(fake_bus.receivers) == receivers
+
+    # and stopping a server closes its adapter
+    server = BluetoothServer(None, auto_start = False)
+    assert len(fake_bus.receivers) > receivers
+    server.stop()
+    assert len(fake_bus.receivers) == receivers